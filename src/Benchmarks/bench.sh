@@ -0,0 +1,18 @@
+#!/bin/bash
+
+# find python binary
+python=$(which python)
+if [ -z "$python" ]; then
+    python=$(which python3)
+fi
+if [ -z "$python" ]; then
+    python=$(which python2)
+fi
+
+# run protoargs generator benchmarks, arguments are passed to each of them,
+# e.g. ./bench.sh --max-fields 10000 --json results.json
+SCRIPTPATH="$( cd -- "$(dirname "$0")" >/dev/null 2>&1 ; pwd -P )"
+export PYTHONPATH="$SCRIPTPATH/../Protoargs/bin:$SCRIPTPATH/src"
+for bench in $SCRIPTPATH/src/bench_*.py; do
+    $python $bench "$@" || exit 1
+done
@@ -0,0 +1,34 @@
+import time
+import logging
+
+import paTokenizer
+import synthetic
+
+# excludeUnused should be linear, so time per message stays the same
+if __name__ == "__main__":
+    logging.disable(logging.WARNING) # every excluded message is reported
+
+    print("excludeUnused")
+    for messages in [1000, 2000, 4000, 8000]:
+        data = synthetic.protoargsSchema(fields=100, messages=messages)
+        tokenizer = paTokenizer.Tokenizer().tokenize(data, skipUnused=False)
+        tokens = len(tokenizer.getTokens())
+
+        start = time.time()
+        tokenizer.excludeUnused()
+        elapsed = time.time() - start
+
+        print("  messages: %6d tokens: %7d left: %4d time: %8.4fs per message: %6.2fus" \
+                % (messages, tokens, len(tokenizer.getTokens()), elapsed, elapsed / messages * 1000000))
+
+    # with skipping, tokenizer should not spend time on fields of not needed messages
+    print("tokenize")
+    for messages in [1000, 2000, 4000, 8000]:
+        data = synthetic.protoargsSchema(fields=100, messages=messages)
+        for skipUnused in [False, True]:
+            start = time.time()
+            tokenizer = paTokenizer.Tokenizer().tokenize(data, skipUnused).excludeUnused()
+            elapsed = time.time() - start
+
+            print("  messages: %6d lines: %7d skip: %-5s left: %4d time: %8.4fs" \
+                    % (messages, len(data), skipUnused, len(tokenizer.getTokens()), elapsed))
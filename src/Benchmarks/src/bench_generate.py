@@ -0,0 +1,91 @@
+import os
+import json
+import shutil
+import logging
+import argparse
+import platform
+import tempfile
+
+import paSchema
+import paTimings
+import paApi
+import synthetic
+
+# schema shapes by number of fields, each stresses other part of analysis or generation
+profiles = [
+    ("plain", lambda fields: {}),
+    ("types", lambda fields: {"types": synthetic.types}),
+    ("links", lambda fields: {"links": 2.5}),
+    ("positional", lambda fields: {"positional": fields // 10}),
+    ("unrelated", lambda fields: {"messages": fields // 10}),
+    ("mixed", lambda fields: {"types": synthetic.types, "links": 1.5, "positional": fields // 20, "messages": fields // 20}),
+]
+
+sizes = [10, 100, 1000, 10000, 100000]
+
+# best wall time of function over repeats, small schemas are repeated to reduce noise,
+# reset is called before each repeat and is not timed
+def best(function, fields, reset=lambda: None):
+    times = []
+    for i in range(max(1, min(5, 10000 // fields))):
+        reset()
+        start = paTimings.clock()
+        result = function()
+        times.append(paTimings.clock() - start)
+    return min(times), result
+
+# analysis and generation time per field should not grow with schema size,
+# results are printed and may be stored as json to compare runs
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time analysis of synthetic schemas and generate() of each backend.")
+    parser.add_argument("--json", help="Path to file, where results are written as json, times are in seconds")
+    parser.add_argument("--max-fields", type=int, default=sizes[-1], help="Largest schema size in fields")
+    parser.add_argument("--profile", action="append", choices=[name for name, options in profiles], help="Schema profile to run, may be repeated, all by default")
+    parser.add_argument("--language", action="append", choices=paApi.languages, help="Backend to run, may be repeated, all by default")
+    args, unknown = parser.parse_known_args() # bench.sh passes same arguments to all benchmarks
+
+    logging.disable(logging.WARNING)
+    dst = tempfile.mkdtemp()
+    out = os.path.join(dst, "out")
+    results = []
+    try:
+        print("generate")
+        for name, options in profiles:
+            if args.profile and name not in args.profile:
+                continue
+            for fields in [size for size in sizes if size <= args.max_fields]:
+                path = os.path.join(dst, "bench_%s_%d.proto" % (name, fields))
+                lines = synthetic.protoargsSchema(fields=fields, **options(fields))
+                with open(path, "w") as index:
+                    index.writelines(lines)
+
+                elapsed, schema = best(lambda: paSchema.Schema(path).analyse(), fields)
+                result = {"profile" : name, "fields" : fields, "lines" : len(lines), "analyse" : elapsed, "generators" : {}}
+                print("  %-10s fields: %6d analyse time: %8.4fs per field: %7.2fus" \
+                        % (name, fields, elapsed, elapsed / fields * 1000000))
+
+                for language in args.language or paApi.languages:
+                    module = paApi.loadGenerator(language)
+                    def generate():
+                        generator = module.Generator(path, out, schema)
+                        generator.generate()
+                        return generator
+                    def reset(): # unchanged files are not written, so every repeat writes into empty directory
+                        shutil.rmtree(out, True)
+                        os.mkdir(out)
+                    elapsed, generator = best(generate, fields, reset)
+                    result["generators"][language] = dict(generator.getTimings(), time=elapsed, perField=elapsed / fields) # phases of last repeat
+                    print("  %-10s fields: %6d %-4s     time: %8.4fs per field: %7.2fus" \
+                            % (name, fields, language, elapsed, elapsed / fields * 1000000))
+                results.append(result)
+    finally:
+        shutil.rmtree(dst)
+
+    if args.json:
+        with open(args.json, "w") as index:
+            json.dump({
+                "python" : platform.python_version(),
+                "unit" : "seconds",
+                "results" : results,
+                }, index, indent=2, sort_keys=True)
+        print("results written to '%s'" % args.json)
@@ -0,0 +1,23 @@
+import time
+import logging
+
+import paTokenizer
+import synthetic
+
+# lexer throughput on big inputs, with and without not needed messages
+if __name__ == "__main__":
+    logging.disable(logging.WARNING)
+
+    print("tokenize")
+    for fields, messages in [(50000, 0), (25000, 4000)]:
+        data = synthetic.protoargsSchema(fields=fields, messages=messages)
+
+        best = None
+        for i in range(3):
+            start = time.time()
+            tokenizer = paTokenizer.Tokenizer().tokenize(data)
+            elapsed = time.time() - start
+            best = elapsed if best is None else min(best, elapsed)
+
+        print("  lines: %7d fields: %6d messages: %5d tokens: %7d time: %8.4fs lines/s: %9d" \
+                % (len(data), fields, messages, len(tokenizer.getTokens()), best, len(data) / best))
@@ -0,0 +1,51 @@
+# Synthetic proto files for protoargs benchmarks
+
+# protoargs field types, may be mixed in one schema
+types = ["string", "int32", "uint32", "int64", "uint64", "bool", "float", "double"]
+
+# proto file with protoargs messages and number of unrelated messages around them,
+# option types are taken from types in turn, links is number of links per option,
+# fraction spreads over options, e.g. 1.5 gives every second option long link too,
+# positional fields are required fields without links placed after options,
+# without links (links=0) there is no protoargs_links message and no positional fields
+def protoargsSchema(fields=10, messages=0, messageFields=10, types=("string",), links=1, positional=0):
+    lines = ['syntax = "proto2";\n', "\n", "package bench.protoargs;\n", "\n"]
+    positional = min(positional, fields) if links else 0
+    options = fields - positional
+
+    unrelated = []
+    for m in range(messages):
+        unrelated.append("message unrelated_%d // regular protobuf message\n" % m)
+        unrelated.append("{\n")
+        for f in range(messageFields):
+            unrelated.append("    optional string field_%d = %d; // Unrelated field\n" % (f, f + 1))
+        unrelated.append("}\n")
+        unrelated.append("\n")
+
+    half = messages // 2 * (messageFields + 4) # half of messages is placed before protoargs ones
+    lines += unrelated[:half]
+
+    lines.append("message protoargs\n")
+    lines.append("{\n")
+    for f in range(options):
+        lines.append("    optional %s param_%d = %d; // Param %d\n" % (types[f % len(types)], f, f + 1, f))
+    for f in range(options, fields):
+        lines.append("    required %s PARAM_%d = %d; // Positional param %d\n" % (types[f % len(types)], f, f + 1, f))
+    lines.append("}//protoargs\n")
+    lines.append("\n")
+
+    if links:
+        lines.append("message protoargs_links\n")
+        lines.append("{\n")
+        position = 1
+        for f in range(options):
+            count = max(1, int(links * (f + 1)) - int(links * f))
+            for l in range(count):
+                name = "p%d" % f if l == 0 else "param_%d_link_%d" % (f, l)
+                lines.append("    optional string %s = %d [default = \"param_%d\"];\n" % (name, position, f))
+                position += 1
+        lines.append("}//protoargs_links\n")
+        lines.append("\n")
+
+    lines += unrelated[half:]
+    return lines
@@ -0,0 +1,37 @@
+import importlib
+
+import paSchema
+
+# generator modules by language option, generation order is the order of languages,
+# module is imported only when its language is used, so that startup stays short
+languages = ["cpp", "py", "rust", "go", "bash"]
+generators = {
+        "cpp"   : ("c++",       "paCppGenerator"),
+        "py"    : ("python",    "paPyGenerator"),
+        "rust"  : ("rust",      "paRustGenerator"),
+        "go"    : ("go",        "paGoGenerator"),
+        "bash"  : ("bash",      "paBashGenerator"),
+        }
+
+# get generator module of language, it is imported on first use
+def loadGenerator(language):
+    return importlib.import_module(generators[language][1])
+
+# generate parsers from proto file content in memory, nothing is read or written and
+# logging is left as configured by caller, so it may be used by long running build tools,
+# name is the proto file name without extension, generated file names are derived from it,
+# returns generated file names with their content, None if there is no valid protoargs configuration
+def generate(source, languages, name="protoargs"):
+    for language in languages:
+        if language not in generators:
+            raise ValueError("Unknown parser language '" + language + "'")
+
+    path = name + ".proto"
+    schema = paSchema.Schema(path).analyse(source.splitlines(True))
+    if not schema.valid():
+        return None
+
+    files = {}
+    for language in languages:
+        files.update(loadGenerator(language).Generator(path, "", schema).renderFiles())
+    return files
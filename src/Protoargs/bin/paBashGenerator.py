@@ -1,8 +1,11 @@
 import os
-import sys
-import logging
+import argparse
+import paLogger
 import paTokenizer
-import paPyGenerator
+import paTemplate
+import paGenerator
+
+log = paLogger.log
 
 # GLOBAL DEFS ###################################3
 
@@ -16,7 +19,7 @@ pt_uint64 = "uint64"
 pt_bool = "bool"
 pt_string = "string"
 
-# go types
+# bash types
 bash_float = "float32"
 bash_double = "float64"
 bash_int32 = "int32"
@@ -26,18 +29,29 @@ bash_uint64 = "uint64"
 bash_bool = "bool"
 bash_string = "string"
 
+# bash types by protobuf types
+bash_types = {
+    pt_float: bash_float,
+    pt_double: bash_double,
+    pt_int32: bash_int32,
+    pt_uint32: bash_uint32,
+    pt_int64: bash_int64,
+    pt_uint64: bash_uint64,
+    pt_bool: bash_bool,
+    pt_string: bash_string,
+}
+
 # END GLOBALS ###################################3
 
-class Generator:
+class Generator(paGenerator.BaseGenerator):
 
-    __path = "" # path to proto file
     __package = "" # package to avoid global variables collisions
     __bashCommonPath = "" # path to common source file
     __bashPath = "" # path to source file
     __bash = "" # source file content
 
-    def __init__(self, path, dst):
-        self.__path = path
+    def __init__(self, path, dst, schema=None):
+        paGenerator.BaseGenerator.__init__(self, path, schema)
         filename = os.path.splitext( os.path.basename(path) )[0]
         self.__package = self.__convertToPackageName(filename)
         base = os.path.join(dst, filename)
@@ -45,24 +59,52 @@ class Generator:
         self.__bashPath = base + "_pa.sh"
 
     ##
-    # @brief Additionally generate python parser and steal usage from it
-    # Simple enough, dumb enough, but it works
-    # @param path
+    # @brief Render usage with argparse directly from classified fields,
+    # arguments are registered exactly as python parser generated from the same proto file does
     #
-    # @return 
-    def __parasiteUsage(self, path):
-        filename = os.path.splitext( os.path.basename(path) )[0]
-        dstdir = os.path.join("/", "tmp")
-        logging.info("Generate python parser from proto file '" + path + "'")
-        generator = paPyGenerator.Generator(path, dstdir)
-        generator.generate()
-
-        # import generated module dynamically
-        sys.path.append(dstdir)
-        module = __import__(filename + "_pa")
-        os.environ['COLUMNS']="80" # make default limit in 80 columns
-
-        return module.usage("${program}", "${description}")
+    # @return Usage formatted for 80 columns
+    def __usage(self):
+        parser = argparse.ArgumentParser(description="${description}", prog="${program}",
+                formatter_class=lambda prog: argparse.HelpFormatter(prog, width=78)) # 80 columns minus margin
+        positional = []
+
+        for field in self.getFields():
+            token = field.token
+            if field.positional:
+                positional.append(token)
+                continue
+
+            # all links or field name itself are options
+            options = []
+            for name in ([link.name for link in field.sortedLinks] if field.linked else [token.name]):
+                if name != "h" and name != "help": # exclude predefined args
+                    options.append(self.convertToOptName(self.convertToArgName(name)))
+            if not options:
+                continue
+
+            isFlag = token.type == pt_bool and (not token.value or token.value == "false")
+            arguments = {
+                    "help": token.description + " {" + token.field.upper() + ",type:" + token.type + ",default:\"" + token.value + "\"}",
+                    "metavar": token.name,
+                    "dest": token.name,
+                    }
+            if token.field == paTokenizer.pf_required:
+                arguments["required"] = True
+            if token.field == paTokenizer.pf_repeated:
+                arguments["action"] = "append"
+                if token.type != pt_bool:
+                    arguments["nargs"] = "?"
+            elif isFlag:
+                arguments["action"] = "store_const"
+                arguments["const"] = True
+            parser.add_argument(*options, **arguments)
+
+        for token in positional:
+            parser.add_argument(token.name,
+                    nargs=("+" if token.field == paTokenizer.pf_repeated else None),
+                    help=token.description + " {" + paTokenizer.pf_required.upper() + ",type:" + token.type + "}")
+
+        return parser.format_help()
 
     def getSourceFileData(self):
         return self.__bash
@@ -73,55 +115,10 @@ class Generator:
     def getCommonFilePath(self):
         return self.__bashCommonPath
 
-    # load file entirely
-    def loadFileData(self, path):
-        logging.info("Load file: '" + path + "'")
-        try:
-            with open(path, "r") as index:
-                lines = index.readlines()
-                index.close()
-                return lines
-        except:
-            logging.error("Could not read file '" + path + "' because of error")
-            return ""
-
-    def __saveFileData(self, path, data):
-        logging.info("Save file: '" + path + "'")
-        try:
-            with open(path, "w") as index:
-                index.write(data)
-                index.close()
-                return True;
-        except:
-            logging.error(" Could not write to file '" + path + "' because of error")
-            return False;
-
-    # parse proto file and generate go files
-    def generate(self):
-        #load proto file
-        data = self.loadFileData(self.__path)
-        result = len(data) != 0
-        if result:
-            # tokenize proto file data
-            tokenizer = paTokenizer.Tokenizer() \
-                    .tokenize(data) \
-                    .excludeUnused() \
-
-            result = tokenizer.check() # check tokens
-            if result:
-                tokens = tokenizer.getTokens()
-
-                # DBG
-                for token in tokens:
-                    logging.debug(str(token))
-
-                # generate souce code
-                self.__bash = self.__generateSourceFromTokens(tokens)
-
-                # save code to files
-                self.__saveFileData( self.getSourceFilePath(), self.__bash )
-
-        return data
+    # generate bash files
+    def render(self, tokens):
+        self.__bash = self.__generateSourceFromTokens(tokens)
+        return [(self.getSourceFilePath(), self.__bash)]
 
     # convert protobuf config names into go code names
     def __convertToPackageName(self, name):
@@ -133,43 +130,21 @@ class Generator:
     def __convertToBashName(self, name):
         return self.__package + "_"+ name
 
-    # convert protobuf config names into args
-    def __convertToArgName(self, name):
-        return name.replace("_","-")
-
-    # convert argument to option
-    def __convertToOptName(self, name):
-        if len(name) == 1:
-            return "-" + name
-        elif len(name) > 1:
-            return "--" + name
-        else:
-            return name
-
-    # convert protobuf config types into go types
+    # convert protobuf config types into bash types
     def __convertToBashType(self, token):
-        pyType = token.type # if missing use original
-
-        # get correct type
-        protoType = token.type
-        if protoType == pt_int32:
-            pyType = bash_int32
-        if protoType == pt_uint32:
-            pyType = bash_uint32
-        if protoType == pt_int64:
-            pyType = bash_int64
-        if protoType == pt_uint64:
-            pyType = bash_uint64
-        if protoType == pt_bool:
-            pyType = bash_bool
-        if protoType == pt_string:
-            pyType = bash_string
-        if protoType == pt_float:
-            pyType = bash_float
-        if protoType == pt_double:
-            pyType = bash_double
-
-        return pyType
+        return self.convertToType(token, bash_types)
+
+    # convert protobuf config types into bash value checks
+    def __convertToBashChecker(self, token):
+        if token.type == pt_bool:
+            return r"""[ "${value}" != true ] && [ "${value}" != false ]"""
+        if token.type == pt_double or token.type == pt_float:
+            return r"""! [[ "${value}" =~ ^[+-]?[0-9]+([.][0-9]+)?$ ]]"""
+        if token.type == pt_int32 or token.type == pt_int64:
+            return r"""! [[ "${value}" =~ ^[+-]?[0-9]+$ ]]"""
+        if token.type == pt_uint32 or token.type == pt_uint64:
+            return r"""! [[ "${value}" =~ ^[0-9]+$ ]]"""
+        return r"""[ -z "0" ]"""
 
     def __convertToDefaultValue(self, token):
         if not token.value:
@@ -180,26 +155,27 @@ class Generator:
     def __generateSourceFromTokens(self, tokens):
         head = "#!/bin/bash\n"
         tail = ""
-        body = ""
+        body = paTemplate.Builder()
 
         # add prepare_options function binding
-        body += """
+        body.render("""
 # Options preparation
 function %PACKAGE%_prepareOptions()
 {
     # Common Variables
     %PACKAGE%_PROTOARGS_USAGE=""
-"""
+""",
+            PACKAGE=self.__package)
         # init variables
-        body += self.__flagStructureFields(tokens)
+        body.add(self.__flagStructureFields(tokens))
 
-        body += """
+        body.add("""
 
 }
-"""
+""")
 
         # add usage function binding
-        body += r"""
+        body.render(r"""
 # Get usage string
 #
 # Arguments:
@@ -214,18 +190,19 @@ function %PACKAGE%_usage() #(program, description)
     local description=$(echo "$2" | fold -w 80)
 
     %PACKAGE%_PROTOARGS_USAGE="$(cat << PROTOARGS_EOM
-"""
+""",
+            PACKAGE=self.__package)
 
-        body += self.__parasiteUsage(self.__path)
+        body.add(self.__usage())
 
-        body += r"""
+        body.add(r"""
 PROTOARGS_EOM
 )"
 }
 
-"""
+""")
 
-        body += """
+        body.render("""
 # Parse command line arguments, and return filled configuration
 #
 # Arguments:
@@ -246,15 +223,16 @@ function %PACKAGE%_parse() #(program, description, allow_incomplete, args)
     %PACKAGE%_prepareOptions
     %PACKAGE%_usage "${program}" "${description}"
 
-"""
+""",
+            PACKAGE=self.__package)
 
         # register fields
-        body += self.__addParsing(tokens)
+        body.add(self.__addParsing(tokens))
 
         # verify fields
-        body += self.__flagStructureFill(tokens)
+        body.add(self.__flagStructureFill(tokens))
 
-        body += r"""
+        body.render(r"""
     return 0
 }
 
@@ -304,9 +282,10 @@ function %PACKAGE%_keep_args_tail()
 }
 
 
-"""
+""",
+            PACKAGE=self.__package)
 
-        return (head + body + tail).replace("%PACKAGE%", self.__package)
+        return head + body.build() + tail
 
     def __addParsing(self, tokens):
         templateDefault = r"""
@@ -409,7 +388,7 @@ function %PACKAGE%_keep_args_tail()
 """
 
 
-        code = """
+        code = paTemplate.Builder("""
     shift
     shift
     shift
@@ -418,97 +397,86 @@ function %PACKAGE%_keep_args_tail()
 
     while [[ $# -gt 0 ]]; do
         case $1 in
-"""
+""")
 
         positionals = 0
-        start = False
-        for token in tokens:
-            if token.directive == paTokenizer.pd_message and token.name == paTokenizer.pa_main:
-                start = True
-            elif start:
-                if token.directive == paTokenizer.pd_end:
-                    break
-                elif token.directive == paTokenizer.pd_field:
-                    append = True
-                    positional = False
-                    isLinks = self.__getToken(tokens, paTokenizer.pd_message, paTokenizer.pa_links).valid()
-                    argument = self.__convertToArgName(token.name)
-                    argument_eq = argument + "=*"
-                    if isLinks:
-                        links = sorted(self.__getLinks(tokens, token.name), key=lambda link: link.name)
-                        if len(links) == 0:
-                            positional = True
+        for field in self.getFields():
+            token = field.token
+            append = True
+            positional = False
+            argument = self.convertToArgName(token.name)
+            argument_eq = argument + "=*"
+            if field.linked:
+                links = field.sortedLinks
+                if len(links) == 0:
+                    positional = True
+                else:
+                    argument = ""
+                    argument_eq = ""
+                    for link in links:
+                        arg = self.convertToArgName(link.name)
+                        arg = ("-" + arg if len(arg) <= 1 else "--" + arg)
+                        if argument:
+                            argument += "|" + arg
+                            argument_eq += "|" + arg + "=*"
                         else:
-                            argument = ""
-                            argument_eq = ""
-                            for link in links:
-                                arg = self.__convertToArgName(link.name)
-                                arg = ("-" + arg if len(arg) <= 1 else "--" + arg)
-                                if argument:
-                                    argument += "|" + arg
-                                    argument_eq += "|" + arg + "=*"
-                                else:
-                                    argument = arg
-                                    argument_eq = arg + "=*"
+                            argument = arg
+                            argument_eq = arg + "=*"
+            else:
+                argument = ("-" + argument if len(argument) <= 1 else "--" + argument)
+                argument_eq = argument + "=*"
+
+            if append:
+                bashType = self.__convertToBashType(token)
+
+                # count positionals expected
+                if positional:
+                    positionals += 1
+
+                if not positional:
+                    log.debug("Add field name processing: %s", token)
+                    template_eq = templateDefaultEquals
+                    template = templateDefault
+                    if token.type == pt_bool:
+                        template = templateBool
+                        if token.field != paTokenizer.pf_repeated:
+                            template_eq = "" # no = for flag, like --help
+                        else:
+                            template = templateDefaultRepeated
+                            template_eq = templateDefaultRepeatedEquals
+                    elif token.type == pt_string:
+                        template = templateString
+                        template_eq = templateStringEquals
+                        if token.field == paTokenizer.pf_repeated:
+                            template = templateDefaultRepeated
+                            template_eq = templateDefaultRepeatedEquals
                     else:
-                        argument = ("-" + argument if len(argument) <= 1 else "--" + argument)
-                        argument_eq = argument + "=*"
-
-                    if append:
-                        bashType = self.__convertToBashType(token)
-
-                        # count positionals expected
-                        if positional:
-                            positionals += 1
-
-                        if not positional:
-                            logging.debug("Add field name processing: " + str(token))
-                            template_eq = templateDefaultEquals
-                            template = templateDefault
-                            if token.type == pt_bool:
-                                template = templateBool
-                                if token.field != paTokenizer.pf_repeated:
-                                    template_eq = "" # no = for flag, like --help
-                                else:
-                                    template = templateDefaultRepeated
-                                    template_eq = templateDefaultRepeatedEquals
-                            elif token.type == pt_string:
-                                template = templateString
-                                template_eq = templateStringEquals
-                                if token.field == paTokenizer.pf_repeated:
-                                    template = templateDefaultRepeated
-                                    template_eq = templateDefaultRepeatedEquals
-                            else:
-                                if token.field == paTokenizer.pf_repeated:
-                                    template = templateDefaultRepeated
-                                    template_eq = templateDefaultRepeatedEquals
-
-                            # argument with space
-                            code += template \
-                                    .replace("%NAME%", self.__convertToBashName(token.name)) \
-                                    .replace("%NAME_PRESENT%", self.__convertToBashName(token.name) + "_PRESENT") \
-                                    .replace("%TYPE%", bashType) \
-                                    .replace("%ARGUMENT%", argument) \
-                                    .replace("%OPTION%", self.__convertToArgName(token.name)) \
-
-                            # argument with '='
-                            code += template_eq \
-                                    .replace("%NAME%", self.__convertToBashName(token.name)) \
-                                    .replace("%NAME_PRESENT%", self.__convertToBashName(token.name) + "_PRESENT") \
-                                    .replace("%TYPE%", bashType) \
-                                    .replace("%ARGUMENT%", argument_eq) \
-                                    .replace("%OPTION%", self.__convertToArgName(token.name)) \
-
-                            # checker
-                            code = code.replace("%CHECKER%", ( \
-                                    r"""[ "${value}" != true ] && [ "${value}" != false ]""" if token.type == pt_bool \
-                                    else r"""! [[ "${value}" =~ ^[+-]?[0-9]+([.][0-9]+)?$ ]]"""  if token.type == pt_double or token.type == pt_float \
-                                    else r"""! [[ "${value}" =~ ^[+-]?[0-9]+$ ]]"""  if token.type == pt_int32 or token.type == pt_int64 \
-                                    else r"""! [[ "${value}" =~ ^[0-9]+$ ]]"""  if token.type == pt_uint32 or token.type == pt_uint64 \
-                                    else r"""[ -z "0" ]""" \
-                                    )) \
-
-        code += """
+                        if token.field == paTokenizer.pf_repeated:
+                            template = templateDefaultRepeated
+                            template_eq = templateDefaultRepeatedEquals
+
+                    # argument with space
+                    code.render(template,
+                            NAME=self.__convertToBashName(token.name),
+                            NAME_PRESENT=self.__convertToBashName(token.name) + "_PRESENT",
+                            TYPE=bashType,
+                            ARGUMENT=argument,
+                            OPTION=self.convertToArgName(token.name),
+                            CHECKER=self.__convertToBashChecker(token),
+                            PACKAGE=self.__package)
+
+                    # argument with '='
+                    code.render(template_eq,
+                            NAME=self.__convertToBashName(token.name),
+                            NAME_PRESENT=self.__convertToBashName(token.name) + "_PRESENT",
+                            TYPE=bashType,
+                            ARGUMENT=argument_eq,
+                            OPTION=self.convertToArgName(token.name),
+                            CHECKER=self.__convertToBashChecker(token),
+                            PACKAGE=self.__package)
+
+
+        code.render("""
             -*|--*)
                 if ! [[ "${value}" =~ ^[+-]?[0-9]+([.][0-9]+)?$ ]] || ! [[ "${value}" =~ ^[+-]?[0-9]+$ ]]; then
                     echo "[ERR] Unknown option '$1'"
@@ -527,7 +495,8 @@ function %PACKAGE%_keep_args_tail()
 
     set -- "${POSITIONAL_ARGS[@]}" # restore positional parameters
 
-"""
+""",
+            PACKAGE=self.__package)
 
         templatePositionalDefault = r"""
     if [ "$allow_incomplete" == false ] && [ %POSITION% -ge ${#POSITIONAL_ARGS[@]} ]; then
@@ -579,72 +548,36 @@ function %PACKAGE%_keep_args_tail()
 """
 
         position = 0
-        start = False
-        for token in tokens:
-            if token.directive == paTokenizer.pd_message and token.name == paTokenizer.pa_main:
-                start = True
-            elif start:
-                if token.directive == paTokenizer.pd_end:
-                    break
-                elif token.directive == paTokenizer.pd_field:
-                    append = True
-                    positional = False
-                    isLinks = self.__getToken(tokens, paTokenizer.pd_message, paTokenizer.pa_links).valid()
-                    argument = self.__convertToArgName(token.name)
-                    if isLinks:
-                        links = sorted(self.__getLinks(tokens, token.name), key=lambda link: link.name)
-                        if len(links) == 0:
-                            positional = True
-                            position += 1
-
-                    if append:
-                        bashType = self.__convertToBashType(token)
-
-                        if positional:
-                            logging.debug("Fill positional name: " + str(token))
-                            template = templatePositionalDefault
-                            if token.field == paTokenizer.pf_repeated:
-                                template = templatePositionalRepeated
-                            code += template \
-                                    .replace("%NAME%", self.__convertToBashName(token.name)) \
-                                    .replace("%TYPE%", bashType) \
-                                    .replace("%TRUENAME%", token.name) \
-                                    .replace("%POSITION%", str(position-1)) \
-                                    .replace("%ARGUMENT%", argument) \
-
-                            # checker
-                            code = code.replace("%CHECKER%", ( \
-                                    r"""[ "${value}" != true ] && [ "${value}" != false ]""" if token.type == pt_bool \
-                                    else r"""! [[ "${value}" =~ ^[+-]?[0-9]+([.][0-9]+)?$ ]]"""  if token.type == pt_double or token.type == pt_float \
-                                    else r"""! [[ "${value}" =~ ^[+-]?[0-9]+$ ]]"""  if token.type == pt_int32 or token.type == pt_int64 \
-                                    else r"""! [[ "${value}" =~ ^[0-9]+$ ]]"""  if token.type == pt_uint32 or token.type == pt_uint64 \
-                                    else r"""[ -z "0" ]""" \
-                                    )) \
-
-        return code
-
-    # get token by type and name
-    def __getToken(self, tokens, directive, name):
-        result = paTokenizer.ProtoToken()
-        for token in tokens:
-            if token.directive == directive and token.name == name:
-                result = token
-                break
-        return result
-
-    # get link tokens by field name
-    def __getLinks(self, tokens, name):
-        result = []
-        start = False
-        for token in tokens:
-            if token.directive == paTokenizer.pd_message and token.name == paTokenizer.pa_links:
-                start = True
-            elif start:
-                if token.directive == paTokenizer.pd_end:
-                    break
-                elif token.directive == paTokenizer.pd_field and token.value == name: # default link value should be the name of args
-                    result.append(token)
-        return result
+        for field in self.getFields():
+            token = field.token
+            append = True
+            positional = False
+            argument = self.convertToArgName(token.name)
+            if field.linked:
+                links = field.sortedLinks
+                if len(links) == 0:
+                    positional = True
+                    position += 1
+
+            if append:
+                bashType = self.__convertToBashType(token)
+
+                if positional:
+                    log.debug("Fill positional name: %s", token)
+                    template = templatePositionalDefault
+                    if token.field == paTokenizer.pf_repeated:
+                        template = templatePositionalRepeated
+                    code.render(template,
+                            NAME=self.__convertToBashName(token.name),
+                            TYPE=bashType,
+                            TRUENAME=token.name,
+                            POSITION=str(position-1),
+                            ARGUMENT=argument,
+                            CHECKER=self.__convertToBashChecker(token),
+                            PACKAGE=self.__package)
+
+
+        return code.build()
 
     def __flagStructureFields(self, tokens):
         templateDefault = """
@@ -658,30 +591,23 @@ function %PACKAGE%_keep_args_tail()
     %NAME%_PRESENT=false
     %NAME%_COUNT=0\n"""
 
-        code = ""
-
-        start = False
-        for token in tokens:
-            if token.directive == paTokenizer.pd_message and token.name == paTokenizer.pa_main:
-                start = True
-            elif start:
-                if token.directive == paTokenizer.pd_end:
-                    break
-                elif token.directive == paTokenizer.pd_field:
-                    logging.debug("Create struct field name: " + str(token))
-                    template = templateDefault
-                    if token.field == paTokenizer.pf_repeated:
-                        template = templateRepeated
-                    code += template \
-                            .replace("%NAME%", self.__convertToBashName(token.name)) \
-                            .replace("%DESCRIPTION%", token.description) \
-                            .replace("%DEFAULTVAL%", \
-                            ("()" if token.field == paTokenizer.pf_repeated \
-                            else "\"" + token.value + "\"" if token.type == pt_string \
-                            else "false" if len(token.value) == 0 and token.type == pt_bool \
-                            else "0" if len(token.value) == 0 else token.value) ) \
-
-        return code
+        code = paTemplate.Builder()
+
+        for field in self.getFields():
+            token = field.token
+            log.debug("Create struct field name: %s", token)
+            template = templateDefault
+            if token.field == paTokenizer.pf_repeated:
+                template = templateRepeated
+            code.render(template,
+                    NAME=self.__convertToBashName(token.name),
+                    DESCRIPTION=token.description,
+                    DEFAULTVAL=("()" if token.field == paTokenizer.pf_repeated \
+                    else "\"" + token.value + "\"" if token.type == pt_string \
+                    else "false" if len(token.value) == 0 and token.type == pt_bool \
+                    else "0" if len(token.value) == 0 else token.value))
+
+        return code.build()
 
     def __flagStructureFill(self, tokens):
         templateOptional = r""""""
@@ -702,57 +628,51 @@ function %PACKAGE%_keep_args_tail()
         templatePositional = r""""""
 
         templateRepeatedPositional = r""""""
-        code = ""
+        code = paTemplate.Builder()
         position = 0
 
-        start = False
-        for token in tokens:
-            if token.directive == paTokenizer.pd_message and token.name == paTokenizer.pa_main:
-                start = True
-            elif start:
-                if token.directive == paTokenizer.pd_end:
-                    break
-                elif token.directive == paTokenizer.pd_field:
-                    append = True
-                    positional = False
-                    isLinks = self.__getToken(tokens, paTokenizer.pd_message, paTokenizer.pa_links).valid()
-                    argument = self.__convertToArgName(token.name)
-                    if isLinks:
-                        links = sorted(self.__getLinks(tokens, token.name), key=lambda link: link.name)
-                        if len(links) == 0:
-                            positional = True
-                        else:
-                            argument = self.__convertToArgName(links[0].name)
-
-                    if append:
-                        logging.debug("Fill struct field name: " + str(token))
-                        bashType = self.__convertToBashType(token)
-
-                        if positional:
-                            position += 1
-
-                        template = templateOptional
-                        if positional and token.field == paTokenizer.pf_repeated:
-                            template = templateRepeatedPositional
-                        elif positional:
-                            template = templatePositional
-                        elif token.field == paTokenizer.pf_optional and token.type == pt_bool:
-                            template = templateOptionalBool
-                        elif token.field == paTokenizer.pf_required and token.type == pt_bool:
-                            template = templateOptionalBool + templateRequired
-                        elif token.field == paTokenizer.pf_repeated:
-                            template = templateRepeated
-                        elif token.field == paTokenizer.pf_required:
-                            template = templateRequired
-
-                        code += template \
-                                .replace("%NAME%", self.__convertToBashName(token.name)) \
-                                .replace("%ARGUMENT%", argument) \
-                                .replace("%OPTION%", self.__convertToArgName(token.name)) \
-                                .replace("%TYPE%", bashType) \
-                                .replace("%VARIABLE%", "config." + self.__convertToBashName(token.name)) \
-                                .replace("%POSITION%", str(position)) \
-                                .replace("%INDEX%", str(position-1))
-
-        return code
+        for field in self.getFields():
+            token = field.token
+            append = True
+            positional = False
+            argument = self.convertToArgName(token.name)
+            if field.linked:
+                links = field.sortedLinks
+                if len(links) == 0:
+                    positional = True
+                else:
+                    argument = self.convertToArgName(links[0].name)
+
+            if append:
+                log.debug("Fill struct field name: %s", token)
+                bashType = self.__convertToBashType(token)
+
+                if positional:
+                    position += 1
+
+                template = templateOptional
+                if positional and token.field == paTokenizer.pf_repeated:
+                    template = templateRepeatedPositional
+                elif positional:
+                    template = templatePositional
+                elif token.field == paTokenizer.pf_optional and token.type == pt_bool:
+                    template = templateOptionalBool
+                elif token.field == paTokenizer.pf_required and token.type == pt_bool:
+                    template = templateOptionalBool + templateRequired
+                elif token.field == paTokenizer.pf_repeated:
+                    template = templateRepeated
+                elif token.field == paTokenizer.pf_required:
+                    template = templateRequired
+
+                code.render(template,
+                        NAME=self.__convertToBashName(token.name),
+                        ARGUMENT=argument,
+                        OPTION=self.convertToArgName(token.name),
+                        TYPE=bashType,
+                        VARIABLE="config." + self.__convertToBashName(token.name),
+                        POSITION=str(position),
+                        INDEX=str(position-1),
+                        PACKAGE=self.__package)
+
+        return code.build()
 
@@ -0,0 +1,107 @@
+import os
+import sys
+import json
+import errno
+import hashlib
+
+import paLogger
+import paTokenizer
+import paSchema
+import paFile
+
+log = paLogger.log
+
+try:
+    from sys import intern # python 3
+except ImportError:
+    pass # python 2 builtin
+
+# digest of module sources, compiled module is hashed if there is no source next to it
+def sourcesDigest(modules):
+    digest = hashlib.sha256()
+    for module in modules:
+        path = os.path.splitext(module.__file__)[0] + ".py"
+        if not os.path.exists(path):
+            path = module.__file__
+        with open(path, "rb") as index:
+            digest.update(index.read())
+    return digest.hexdigest()
+
+# version of cached token model, it changes together with code of tokenizer, schema analysis
+# and cache itself, so that schemas cached by other versions are never used
+version = "protoargs-tokens-" + sourcesDigest([paTokenizer, paSchema, sys.modules[__name__]])
+
+
+class Cache:
+
+    __dir = "" # directory where analysed schemas are stored
+    __hits = 0 # schemas loaded from cache
+    __misses = 0 # schemas not found in cache
+
+    def __init__(self, dir):
+        self.__dir = dir
+
+    def getDir(self):
+        return self.__dir
+
+    def getHits(self):
+        return self.__hits
+
+    def getMisses(self):
+        return self.__misses
+
+    # add usage of the same cache from other process
+    def merge(self, cache):
+        self.__hits += cache.getHits()
+        self.__misses += cache.getMisses()
+
+    # cache key of proto file content, mapped file or bytes
+    def key(self, data):
+        digest = hashlib.sha256(version.encode("utf-8"))
+        if data is not None:
+            digest.update(data)
+        return digest.hexdigest()
+
+    def __getFilePath(self, key):
+        return os.path.join(self.__dir, key + ".json")
+
+    # load tokens stored by key, None if there are no tokens for key
+    def load(self, key):
+        path = self.__getFilePath(key)
+        try:
+            with open(path, "r") as index:
+                tokens = [self.__createToken(*fields) for fields in json.load(index)]
+        except (IOError, OSError, ValueError, TypeError):
+            self.__misses += 1
+            log.debug("Schema cache miss \'%s\'", path)
+            return None
+
+        self.__hits += 1
+        log.debug("Schema cache hit \'%s\'", path)
+        return tokens
+
+    # rebuild stored token, names are interned like tokenizer does, json gives unicode on python 2
+    def __createToken(self, directive, field, type, name, position, value, description):
+        return paTokenizer.ProtoToken(intern(str(directive)), intern(str(field)), intern(str(type)),
+                intern(str(name)), position, value, description)
+
+    # store tokens by key, failure to store only means no cache next time
+    def store(self, key, tokens):
+        path = self.__getFilePath(key)
+        try:
+            try:
+                os.makedirs(self.__dir)
+            except OSError as error:
+                if error.errno != errno.EEXIST: # created already, maybe by concurrent worker
+                    raise
+
+            # concurrent runs never see partial file
+            paFile.writeFileData(path, json.dumps([[token.directive, token.field, token.type, token.name,
+                token.position, token.value, token.description] for token in tokens]))
+        except (IOError, OSError):
+            log.warning("Could not store schema in cache '" + path + "'")
+
+    # report cache usage
+    def report(self):
+        log.info("Schema cache '" + self.__dir + "': " + str(self.__hits) + " hit(s), "
+                + str(self.__misses) + " miss(es)")
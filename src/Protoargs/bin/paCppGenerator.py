@@ -1,6 +1,10 @@
 import os
-import logging
+import paLogger
 import paTokenizer
+import paTemplate
+import paGenerator
+
+log = paLogger.log
 
 
 # GLOBAL DEFS ###################################3
@@ -25,19 +29,30 @@ cc_uint64 = "uint64_t"
 cc_bool = "bool"
 cc_string = "std::string"
 
+# c++ types by protobuf types
+cc_types = {
+    pt_float: cc_float,
+    pt_double: cc_double,
+    pt_int32: cc_int32,
+    pt_uint32: cc_uint32,
+    pt_int64: cc_int64,
+    pt_uint64: cc_uint64,
+    pt_bool: cc_bool,
+    pt_string: cc_string,
+}
+
 # END GLOBALS ###################################3
 
-class Generator:
+class Generator(paGenerator.BaseGenerator):
 
-    __path = "" # path to proto file
     __pbhName = ""  # name of protobuf header file for include
     __ccPath = "" # path to source file
     __hPath = ""  # path to header file
     __cc = "" # source file content
     __h = ""  # header content
 
-    def __init__(self, path, dst):
-        self.__path = path
+    def __init__(self, path, dst, schema=None):
+        paGenerator.BaseGenerator.__init__(self, path, schema)
         filename = os.path.splitext( os.path.basename(path) )[0]
         base = os.path.join(dst, filename)
         self.__hPath = base + ".pa.h"
@@ -56,88 +71,19 @@ class Generator:
     def getHeaderFilePath(self):
         return self.__hPath
 
-    # load file entirely
-    def loadFileData(self, path):
-        logging.info("Load file: '" + path + "'")
-        try:
-            with open(path, "r") as index:
-                lines = index.readlines()
-                index.close()
-                return lines
-        except:
-            logging.error("Could not read file '" + path + "' because of error")
-            return ""
-
-    def __saveFileData(self, path, data):
-        logging.info("Save file: '" + path + "'")
-        try:
-            with open(path, "w") as index:
-                index.write(data)
-                index.close()
-                return True;
-        except:
-            logging.error(" Could not write to file '" + path + "' because of error")
-            return False;
-
-    # parse proto file and generate c++ files
-    def generate(self):
-        #load proto file
-        data = self.loadFileData(self.__path)
-        result = len(data) != 0
-        if result:
-            # tokenize proto file data
-            tokenizer = paTokenizer.Tokenizer() \
-                    .tokenize(data) \
-                    .excludeUnused() \
-
-            result = tokenizer.check() # check tokens
-            if result:
-                tokens = tokenizer.getTokens()
-
-                # DBG
-                for token in tokens:
-                    logging.debug(str(token))
-
-                # generate souce code
-                self.__h = self.__generateHeaderFromTokens(tokens)
-                self.__cc = self.__generateSourceFromTokens(tokens)
-
-                # save code to files
-                self.__saveFileData( self.getHeaderFilePath(), self.__h )
-                self.__saveFileData( self.getSourceFilePath(), self.__cc )
-
-        return data
+    # generate c++ files
+    def render(self, tokens):
+        self.__h = self.__generateHeaderFromTokens(tokens)
+        self.__cc = self.__generateSourceFromTokens(tokens)
+        return [(self.getHeaderFilePath(), self.__h), (self.getSourceFilePath(), self.__cc)]
 
     # convert protobuf config names into c code names
     def __convertToCCName(self, name):
         return name.lower()
 
-    # convert protobuf config names into args
-    def __convertToArgName(self, name):
-        return name.replace("_","-")
-
     # convert protobuf config types into c++ types
     def __convertToCCType(self, token):
-        ccType = token.type # if missing use original
-
-        # get correct type
-        protoType = token.type
-        if protoType == pt_int32:
-            ccType = cc_int32
-        if protoType == pt_uint32:
-            ccType = cc_uint32
-        if protoType == pt_int64:
-            ccType = cc_int64
-        if protoType == pt_uint64:
-            ccType = cc_uint64
-        if protoType == pt_bool:
-            ccType = cc_bool
-        if protoType == pt_string:
-            ccType = cc_string
-        if protoType == pt_float:
-            ccType = cc_float
-        if protoType == pt_double:
-            ccType = cc_double
+        ccType = self.convertToType(token, cc_types)
 
         # value may be repeated
         if token.field == paTokenizer.pf_repeated:
@@ -183,17 +129,17 @@ class Generator:
         head += "#include \"" + self.__pbhName + "\"\n\n"
 
         tail = ""
-        body = ""
+        body = paTemplate.Builder()
         for token in tokens:
             if token.directive == paTokenizer.pd_package:
-                logging.debug(str(token))
+                log.debug("%s", token)
                 namespaces = token.name.split(".") #discover namespaces
                 for namespace in namespaces:
                     ns = namespace.strip()
-                    body += "namespace " + ns + " {\n"
+                    body.add("namespace " + ns + " {\n")
                     tail = "}//namespace " + ns + "\n" + tail
 
-        body += """
+        body.add("""
     class ProtoArgs
     {
         public:
@@ -265,9 +211,9 @@ class Generator:
             }
     };//class
 
-"""
+""")
 
-        return head + body + tail
+        return head + body.build() + tail
 
     # generate c++ source file content
     def __generateSourceFromTokens(self, tokens):
@@ -275,44 +221,44 @@ class Generator:
         head = "\n#include \"" + tail + "\"\n\n" # include protoargs header
 
         tail = ""
-        body = ""
+        body = paTemplate.Builder()
         for token in tokens:
             if token.directive == paTokenizer.pd_package:
-                logging.debug(str(token))
+                log.debug("%s", token)
                 namespaces = token.name.split(".") #discover namespaces
                 for namespace in namespaces:
                     ns = namespace.strip()
-                    body += "namespace " + ns + " {\n"
+                    body.add("namespace " + ns + " {\n")
                     tail = "}//namespace " + ns + "\n" + tail
 
         # add prepareOptions function binding
-        body += """
+        body.add("""
 cxxopts::Options ProtoArgs::prepareOptions(const std::string& program) const
 {
-"""
+""")
         # register arguments
-        body += self.__cxxoptsProgramDescription(tokens)
+        body.add(self.__cxxoptsProgramDescription(tokens))
 
-        body += self.__cxxoptsProgramOptions(tokens)
+        body.add(self.__cxxoptsProgramOptions(tokens))
 
-        body += """
+        body.add("""
     return options;
 }
-"""
+""")
 
-        body += """
+        body.add("""
 void updateWithPositionalOptions(cxxopts::Options& options)
 {
-"""
+""")
         # add positional arguments as dummy args, for usage output
-        body += self.__cxxoptsPositionalOptions(tokens)
+        body.add(self.__cxxoptsPositionalOptions(tokens))
 
-        body += """
+        body.add("""
 }
-"""
+""")
 
         # add usage function binding
-        body += """
+        body.add("""
 std::string ProtoArgs::usage(const std::string& program) const
 {
     auto options = prepareOptions(program);
@@ -321,236 +267,195 @@ std::string ProtoArgs::usage(const std::string& program) const
     usage = std::regex_replace(usage, std::regex("--dummy-"), "        ");
     return usage;
 }
-"""
+""")
 
         # add prepareOptions function binding
-        body += """
+        body.add("""
 protoargs* ProtoArgs::parse(const std::string& program, int argc, char* argv[], bool allowIncomplete /*= false*/) const
 {
 
     auto config = new protoargs();
-"""
+""")
         # add arguments parsing using cxxopts
-        body += self.__cxxoptsParsingBegin(tokens)
+        body.add(self.__cxxoptsParsingBegin(tokens))
 
-        body += self.__cxxoptsRequiredParsing(tokens)
-        body += self.__cxxoptsOptionalParsing(tokens)
-        body += self.__cxxoptsRepeatedParsing(tokens)
-        body += self.__cxxoptsPositionalParsing(tokens)
+        body.add(self.__cxxoptsRequiredParsing(tokens))
+        body.add(self.__cxxoptsOptionalParsing(tokens))
+        body.add(self.__cxxoptsRepeatedParsing(tokens))
+        body.add(self.__cxxoptsPositionalParsing(tokens))
 
-        body += self.__cxxoptsParsingEnd(tokens)
+        body.add(self.__cxxoptsParsingEnd(tokens))
 
-        body += """
+        body.add("""
     return config;
 }
 
-"""
-
+""")
 
-        return head + body + tail
 
-    # get token by type and name
-    def __getToken(self, tokens, directive, name):
-        result = paTokenizer.ProtoToken()
-        for token in tokens:
-            if token.directive == directive and token.name == name:
-                result = token
-                break
-        return result
-
-    # get link tokens by field name
-    def __getLinks(self, tokens, name):
-        result = []
-        start = False
-        for token in tokens:
-            if token.directive == paTokenizer.pd_message and token.name == paTokenizer.pa_links:
-                start = True
-            elif start:
-                if token.directive == paTokenizer.pd_end:
-                    break
-                elif token.directive == paTokenizer.pd_field and token.value == name: # default link value should be the name of args
-                    result.append(token)
-        return result
+        return head + body.build() + tail
 
 
     def __cxxoptsProgramDescription(self, tokens):
         code = """
     cxxopts::Options options(program, R"_(%DESCRIPTION%)_");
 """
-        token = self.__getToken(tokens, paTokenizer.pd_message, paTokenizer.pa_main)
+        token = self.getToken(paTokenizer.pd_message, paTokenizer.pa_main)
         if token.valid():
-            code = code.replace("%DESCRIPTION%", token.description)
+            code = paTemplate.get(code).render(DESCRIPTION=token.description)
 
         return code
 
     def __cxxoptsPositionalOptions(self, tokens):
         template = "(\"%OPTIONS%\", std::string(R\"_(%DESCRIPTION% {%FREQUENCY%,type:%PTYPE%})_\") + \"\\n\", cxxopts::value<%TYPE%>(), \"--dummy-\")"
-        code = """
+        code = paTemplate.Builder("""
     options
     .add_options()
-"""
+""")
         positional = []
 
-        start = False
-        for token in tokens:
-            if token.directive == paTokenizer.pd_message and token.name == paTokenizer.pa_main:
-                start = True
-            elif start:
-                if token.directive == paTokenizer.pd_end:
-                    break
-                elif token.directive == paTokenizer.pd_field:
-                    isLinks = self.__getToken(tokens, paTokenizer.pd_message, paTokenizer.pa_links).valid()
-                    if isLinks:
-                        links = self.__getLinks(tokens, token.name)
-                        if len(links) == 0:
-                            positional.append(token)
+        for field in self.getFields():
+            token = field.token
+            if field.linked:
+                links = field.links
+                if len(links) == 0:
+                    positional.append(token)
 
         # add dummy positional long args, in order to preserve usage output style
         for token in positional:
-            logging.debug("Create dummy positional field name as long arg name: " + str(token))
+            log.debug("Create dummy positional field name as long arg name: %s", token)
             # add cxxopts option
             prefix = "dummy-"
-            code += "       "
-            code += template \
-                    .replace("%OPTIONS%",prefix + self.__convertToArgName(token.name)) \
-                    .replace("%DESCRIPTION%",token.description) \
-                    .replace("%PTYPE%", token.type) \
-                    .replace("%TYPE%", self.__convertToCCType(token)) \
-                    .replace("%ARGNAME%", token.name) \
-                    .replace("%FREQUENCY%", paTokenizer.pf_required.upper()) \
+            code.add("       ")
+            code.render(template,
+                    OPTIONS=prefix + self.convertToArgName(token.name),
+                    DESCRIPTION=token.description,
+                    PTYPE=token.type,
+                    TYPE=self.__convertToCCType(token),
+                    ARGNAME=token.name,
+                    FREQUENCY=paTokenizer.pf_required.upper())
 
-            code += "\n"
+            code.add("\n")
 
         # end options
-        code += "    ;\n\n"
+        code.add("    ;\n\n")
 
-        return code
+        return code.build()
 
     def __cxxoptsProgramOptions(self, tokens):
         template = "(\"%OPTIONS%\", std::string(R\"_(%DESCRIPTION% {%FREQUENCY%,type:%PTYPE%,default:'%DEFAULT%'})_\") + \"\\n\", cxxopts::value<%TYPE%>(), \"[%ARGNAME%]\")"
         templateRequired = "(\"%OPTIONS%\", std::string(R\"_(%DESCRIPTION% {%FREQUENCY%,type:%PTYPE%})_\") + \"\\n\", cxxopts::value<%TYPE%>(), \"[%ARGNAME%]\")"
-        code = """
+        code = paTemplate.Builder("""
     options
     .add_options()
-"""
+""")
         positional = []
 
-        start = False
-        for token in tokens:
-            if token.directive == paTokenizer.pd_message and token.name == paTokenizer.pa_main:
-                start = True
-            elif start:
-                if token.directive == paTokenizer.pd_end:
-                    break
-                elif token.directive == paTokenizer.pd_field:
-
-                    # set template
-                    t = template
-                    if token.field == paTokenizer.pf_required:
-                        t = templateRequired
-
-                    isLinks = self.__getToken(tokens, paTokenizer.pd_message, paTokenizer.pa_links).valid()
-                    if isLinks:
-                        links = self.__getLinks(tokens, token.name)
-                        if len(links) > 0:
-                            # add all links as options
-                            logging.debug("links found for: " + str(token) + "\n" + str(links))
-                            options = ""
-                            for link in links:
-                                if len(options) > 0 and len(link.name) > 1:
-                                    options += ","
-                                    options += self.__convertToArgName(link.name) # convert into args
-                                elif len(options) > 0 and len(link.name) == 1:
-                                    options = self.__convertToArgName(link.name) + "," + options # convert into args
-                                else:
-                                    options += self.__convertToArgName(link.name) # convert into args
-
-                            # add cxxopts option
-                            code += "       "
-                            code += t \
-                                    .replace("%OPTIONS%",options) \
-                                    .replace("%DESCRIPTION%",token.description) \
-                                    .replace("%PTYPE%", token.type) \
-                                    .replace("%TYPE%", self.__convertToCCType(token)) \
-                                    .replace("%ARGNAME%", token.name) \
-                                    .replace("%FREQUENCY%", token.field.upper()) \
-                                    .replace("%DEFAULT%", token.value)
-
-                            code += "\n"
+        for field in self.getFields():
+            token = field.token
+
+            # set template
+            t = template
+            if token.field == paTokenizer.pf_required:
+                t = templateRequired
+
+            if field.linked:
+                links = field.links
+                if len(links) > 0:
+                    # add all links as options
+                    log.debug("links found for: %s\n%s", token, links)
+                    options = ""
+                    for link in links:
+                        if len(options) > 0 and len(link.name) > 1:
+                            options += ","
+                            options += self.convertToArgName(link.name) # convert into args
+                        elif len(options) > 0 and len(link.name) == 1:
+                            options = self.convertToArgName(link.name) + "," + options # convert into args
                         else:
-                            logging.debug("positional arg found: " + str(token))
-                            positional.append(token)
-                    else:
-                        logging.debug("convert main protoargs field name into long arg name: " + str(token))
-                        # add cxxopts option
-                        code += "       "
-                        code += t \
-                                .replace("%OPTIONS%",self.__convertToArgName(token.name)) \
-                                .replace("%DESCRIPTION%",token.description) \
-                                .replace("%PTYPE%", token.type) \
-                                .replace("%TYPE%", self.__convertToCCType(token)) \
-                                .replace("%ARGNAME%", token.name) \
-                                .replace("%FREQUENCY%", token.field.upper()) \
-                                .replace("%DEFAULT%", token.value)
-                        code += "\n"
+                            options += self.convertToArgName(link.name) # convert into args
+
+                    # add cxxopts option
+                    code.add("       ")
+                    code.render(t,
+                            OPTIONS=options,
+                            DESCRIPTION=token.description,
+                            PTYPE=token.type,
+                            TYPE=self.__convertToCCType(token),
+                            ARGNAME=token.name,
+                            FREQUENCY=token.field.upper(),
+                            DEFAULT=token.value)
+
+                    code.add("\n")
                 else:
-                    logging.warn("unknown token inside protoargs structure: " + str(token))
+                    log.debug("positional arg found: %s", token)
+                    positional.append(token)
+            else:
+                log.debug("convert main protoargs field name into long arg name: %s", token)
+                # add cxxopts option
+                code.add("       ")
+                code.render(t,
+                        OPTIONS=self.convertToArgName(token.name),
+                        DESCRIPTION=token.description,
+                        PTYPE=token.type,
+                        TYPE=self.__convertToCCType(token),
+                        ARGNAME=token.name,
+                        FREQUENCY=token.field.upper(),
+                        DEFAULT=token.value)
+                code.add("\n")
 
         # do not add positional parsing if no positional args registered
         if len(positional) > 0:
             # add positional values holder
-            code += "       "
-            code += template \
-                    .replace("%OPTIONS%","positional") \
-                    .replace("%DESCRIPTION%","This holds all positional values") \
-                    .replace("%PTYPE%", "") \
-                    .replace("%TYPE%", "std::vector<std::string>") \
-                    .replace("%ARGNAME%", "") \
-                    .replace("%FREQUENCY%", token.field.upper()) \
-                    .replace("%DEFAULT%", "[]")
-            code += "\n"
+            code.add("       ")
+            code.render(template,
+                    OPTIONS="positional",
+                    DESCRIPTION="This holds all positional values",
+                    PTYPE="",
+                    TYPE="std::vector<std::string>",
+                    ARGNAME="",
+                    FREQUENCY="",
+                    DEFAULT="[]")
+            code.add("\n")
 
         # end options
-        code += "    ;\n\n"
+        code.add("    ;\n\n")
 
         if len(positional) > 0:
             # add better description for positional values
-            posCode = ""
+            posCode = []
             for pos in positional:
-                if posCode:
-                    posCode += " "
                 if pos.field == paTokenizer.pf_repeated:
-                    posCode += pos.name + " [" + pos.name + "...]" # psotional repeating, at least one should be present
+                    posCode.append(pos.name + " [" + pos.name + "...]") # psotional repeating, at least one should be present
                 else:
-                    posCode += pos.name
+                    posCode.append(pos.name)
 
-            code += "    "
-            code += "options.positional_help(\"" + posCode + "\");\n"
+            code.add("    ")
+            code.add("options.positional_help(\"" + " ".join(posCode) + "\");\n")
 
             # add positional parsing
-            code += "    "
-            code += "options.parse_positional({\"positional\"});\n"
+            code.add("    ")
+            code.add("options.parse_positional({\"positional\"});\n")
 
-        return code
+        return code.build()
 
     def __cxxoptsParsingBegin(self, tokens):
-        code = """
+        code = paTemplate.Builder("""
     auto options = prepareOptions(program);
-"""
+""")
         # add cxxopts parsing
-        code += """
+        code.add("""
     try
     {
         auto result = options.parse(argc, argv);
-"""
-        return code
+""")
+        return code.build()
 
     def __cxxoptsParsingEnd(self, tokens):
-        code = """
+        code = paTemplate.Builder("""
     auto options = prepareOptions(program);
-"""
+""")
         # add cxxopts parsing
-        code += """
+        code.add("""
     }
     catch (const std::exception& e)
     {
@@ -562,8 +467,8 @@ protoargs* ProtoArgs::parse(const std::string& program, int argc, char* argv[],
             return nullptr;
         }//if
     }//catch
-"""
-        return code
+""")
+        return code.build()
 
     def __cxxoptsRequiredParsing(self, tokens):
         template = """
@@ -594,35 +499,28 @@ protoargs* ProtoArgs::parse(const std::string& program, int argc, char* argv[],
         }//if
 """
 
-        code = ""
+        code = paTemplate.Builder()
 
         # fill proto object
-        start = False
-        for token in tokens:
-            if token.directive == paTokenizer.pd_message and token.name == paTokenizer.pa_main:
-                start = True
-            elif start:
-                if token.directive == paTokenizer.pd_end:
-                    break
-                elif token.directive == paTokenizer.pd_field:
-                    link = self.__convertToArgName(self.__convertToCCName(token.name)) # default link
-                    isLinks = self.__getToken(tokens, paTokenizer.pd_message, paTokenizer.pa_links).valid()
-                    if isLinks:
-                        links = self.__getLinks(tokens, token.name)
-                        if len(links) > 1:
-                            link = self.__convertToArgName(links[1].name) # take long option if available
-                        elif len(links) > 0:
-                            link = self.__convertToArgName(links[0].name)
-
-                    if (isLinks and len(links) > 0) or not isLinks: # avoid positional
-                        if token.field == paTokenizer.pf_required: # this parameter should be present
-                            code += template \
-                                    .replace("%ARGNAME%", link) \
-                                    .replace("%PNAME%", token.name) \
-                                    .replace("%TYPE%", self.__convertToCCType(token)) \
-                                    .replace("%SETTER%", self.__convertToCCName(token.name))
-
-        return code
+        for field in self.getFields():
+            token = field.token
+            link = self.convertToArgName(self.__convertToCCName(token.name)) # default link
+            if field.linked:
+                links = field.links
+                if len(links) > 1:
+                    link = self.convertToArgName(links[1].name) # take long option if available
+                elif len(links) > 0:
+                    link = self.convertToArgName(links[0].name)
+
+            if not field.positional: # avoid positional
+                if token.field == paTokenizer.pf_required: # this parameter should be present
+                    code.render(template,
+                            ARGNAME=link,
+                            PNAME=token.name,
+                            TYPE=self.__convertToCCType(token),
+                            SETTER=self.__convertToCCName(token.name))
+
+        return code.build()
 
     def __cxxoptsOptionalParsing(self, tokens):
         template = """
@@ -646,34 +544,27 @@ protoargs* ProtoArgs::parse(const std::string& program, int argc, char* argv[],
         }//if
 """
 
-        code = ""
+        code = paTemplate.Builder()
 
         # fill proto object
-        start = False
-        for token in tokens:
-            if token.directive == paTokenizer.pd_message and token.name == paTokenizer.pa_main:
-                start = True
-            elif start:
-                if token.directive == paTokenizer.pd_end:
-                    break
-                elif token.directive == paTokenizer.pd_field:
-                    link = self.__convertToArgName(self.__convertToCCName(token.name)) # default link
-                    isLinks = self.__getToken(tokens, paTokenizer.pd_message, paTokenizer.pa_links).valid()
-                    if isLinks:
-                        links = self.__getLinks(tokens, token.name)
-                        if len(links) > 1:
-                            link = self.__convertToArgName(links[1].name) # take long option if available
-                        elif len(links) > 0:
-                            link = self.__convertToArgName(links[0].name)
-
-                    if (isLinks and len(links) > 0) or not isLinks: # avoid positional
-                        if token.field == paTokenizer.pf_optional: # this parameter is optional
-                            code += template \
-                                    .replace("%ARGNAME%", link) \
-                                    .replace("%TYPE%", self.__convertToCCType(token)) \
-                                    .replace("%SETTER%", self.__convertToCCName(token.name))
-
-        return code
+        for field in self.getFields():
+            token = field.token
+            link = self.convertToArgName(self.__convertToCCName(token.name)) # default link
+            if field.linked:
+                links = field.links
+                if len(links) > 1:
+                    link = self.convertToArgName(links[1].name) # take long option if available
+                elif len(links) > 0:
+                    link = self.convertToArgName(links[0].name)
+
+            if not field.positional: # avoid positional
+                if token.field == paTokenizer.pf_optional: # this parameter is optional
+                    code.render(template,
+                            ARGNAME=link,
+                            TYPE=self.__convertToCCType(token),
+                            SETTER=self.__convertToCCName(token.name))
+
+        return code.build()
 
     def __cxxoptsRepeatedParsing(self, tokens):
         template = """
@@ -705,34 +596,27 @@ protoargs* ProtoArgs::parse(const std::string& program, int argc, char* argv[],
         }//if
 """
 
-        code = ""
+        code = paTemplate.Builder()
 
         # fill proto object
-        start = False
-        for token in tokens:
-            if token.directive == paTokenizer.pd_message and token.name == paTokenizer.pa_main:
-                start = True
-            elif start:
-                if token.directive == paTokenizer.pd_end:
-                    break
-                elif token.directive == paTokenizer.pd_field:
-                    link = self.__convertToArgName(self.__convertToCCName(token.name)) # default link
-                    isLinks = self.__getToken(tokens, paTokenizer.pd_message, paTokenizer.pa_links).valid()
-                    if isLinks:
-                        links = self.__getLinks(tokens, token.name)
-                        if len(links) > 1:
-                            link = self.__convertToArgName(links[1].name) # take long option if available
-                        elif len(links) > 0:
-                            link = self.__convertToArgName(links[0].name)
-
-                    if (isLinks and len(links) > 0) or not isLinks: # avoid positional
-                        if token.field == paTokenizer.pf_repeated: # this parameter is optional and may be specified multiple times
-                            code += template \
-                                    .replace("%ARGNAME%", link) \
-                                    .replace("%TYPE%", self.__convertToCCType(token)) \
-                                    .replace("%SETTER%", self.__convertToCCName(token.name))
-
-        return code
+        for field in self.getFields():
+            token = field.token
+            link = self.convertToArgName(self.__convertToCCName(token.name)) # default link
+            if field.linked:
+                links = field.links
+                if len(links) > 1:
+                    link = self.convertToArgName(links[1].name) # take long option if available
+                elif len(links) > 0:
+                    link = self.convertToArgName(links[0].name)
+
+            if not field.positional: # avoid positional
+                if token.field == paTokenizer.pf_repeated: # this parameter is optional and may be specified multiple times
+                    code.render(template,
+                            ARGNAME=link,
+                            TYPE=self.__convertToCCType(token),
+                            SETTER=self.__convertToCCName(token.name))
+
+        return code.build()
 
     def __cxxoptsPositionalParsing(self, tokens):
         templateSingle = """
@@ -794,36 +678,29 @@ protoargs* ProtoArgs::parse(const std::string& program, int argc, char* argv[],
             return nullptr;
         }//if
 """
-        code = ""
+        code = paTemplate.Builder()
 
         # fill proto object
-        start = False
         pos = 0
-        for token in tokens:
-            if token.directive == paTokenizer.pd_message and token.name == paTokenizer.pa_main:
-                start = True
-            elif start:
-                if token.directive == paTokenizer.pd_end:
-                    break
-                elif token.directive == paTokenizer.pd_field:
-                    isLinks = self.__getToken(tokens, paTokenizer.pd_message, paTokenizer.pa_links).valid()
-                    if isLinks:
-                        links = self.__getLinks(tokens, token.name)
-                        if len(links) == 0: # process positional
-                            if token.field == paTokenizer.pf_repeated: # this parameter should have at least one arg present, nothing is processed afterwards
-                                code += templateRepeated \
-                                        .replace("%ARGNAME%", token.name.upper()) \
-                                        .replace("%CONVERTER%", self.__converterFromString(token)) \
-                                        .replace("%SETTER%", self.__convertToCCName(token.name)) \
-                                        .replace("%EXPECTEDPOS%", str(pos))
-                                break # all positional next values will be inside this arg
-                            else: # no matter what is set, it is processed as required
-                                code += templateSingle \
-                                        .replace("%ARGNAME%", token.name.upper()) \
-                                        .replace("%CONVERTER%", self.__converterFromString(token)) \
-                                        .replace("%SETTER%", self.__convertToCCName(token.name)) \
-                                        .replace("%EXPECTEDPOS%", str(pos))
-                                pos += 1
-
-        return code
+        for field in self.getFields():
+            token = field.token
+            if field.linked:
+                links = field.links
+                if len(links) == 0: # process positional
+                    if token.field == paTokenizer.pf_repeated: # this parameter should have at least one arg present, nothing is processed afterwards
+                        code.render(templateRepeated,
+                                ARGNAME=token.name.upper(),
+                                CONVERTER=self.__converterFromString(token),
+                                SETTER=self.__convertToCCName(token.name),
+                                EXPECTEDPOS=str(pos))
+                        break # all positional next values will be inside this arg
+                    else: # no matter what is set, it is processed as required
+                        code.render(templateSingle,
+                                ARGNAME=token.name.upper(),
+                                CONVERTER=self.__converterFromString(token),
+                                SETTER=self.__convertToCCName(token.name),
+                                EXPECTEDPOS=str(pos))
+                        pos += 1
+
+        return code.build()
 
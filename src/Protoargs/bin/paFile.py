@@ -0,0 +1,53 @@
+import os
+import errno
+import binascii
+
+# rename replacing existing file, python 2 on posix replaces with rename too
+replace = getattr(os, "replace", os.rename)
+
+# check if file already contains exactly the data, so that writing it again
+# may be skipped and file keeps its modification time
+def sameFileData(path, data):
+    try:
+        with open(path, "r") as index:
+            return index.read() == data
+    except (IOError, OSError, UnicodeDecodeError):
+        return False # missing or unreadable file should be written
+
+# create temporary file next to path, kernel applies umask to its mode, like to any
+# file opened for writing, so process umask is never changed, returns descriptor and path
+def createTempFile(path):
+    dir, name = os.path.split(path)
+    for attempt in range(100):
+        tmp = os.path.join(dir, "." + name + "." + binascii.hexlify(os.urandom(4)).decode("ascii") + ".tmp")
+        try:
+            return os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666), tmp
+        except OSError as error:
+            if error.errno != errno.EEXIST:
+                raise
+    raise OSError(errno.EEXIST, "Could not create temporary file for '" + path + "'")
+
+# write file atomically, data is written into temporary file in the same directory
+# and renamed over the target, so concurrent readers and writers see either
+# previous or complete new file, but never partial one,
+# symbolic link is followed, so that file it points to is replaced instead of link
+def writeFileData(path, data):
+    path = os.path.realpath(path)
+    fd, tmp = createTempFile(path)
+    try:
+        with os.fdopen(fd, "w") as index:
+            index.write(data)
+
+        # keep mode of replaced file, new file has default one
+        try:
+            os.chmod(tmp, os.stat(path).st_mode & 0o7777)
+        except OSError:
+            pass
+
+        replace(tmp, path)
+    except:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,121 @@
+import paLogger
+import paSchema
+import paFile
+import paTimings
+
+log = paLogger.log
+
+
+# base of all language generators, generated files are rendered by generator
+# and saved here, analysed schema and its classified fields are shared
+class BaseGenerator:
+
+    __path = "" # path to proto file
+    __schema = None # analysed proto file, may be shared between generators
+    __symbols = None # index over analysed tokens
+    __written = [] # files written by generation
+    __skipped = [] # files not written, because they are not changed
+    __stopwatch = None # wall time of generation phases
+
+    def __init__(self, path, schema=None):
+        self.__path = path
+        self.__schema = schema
+        self.__written = []
+        self.__skipped = []
+        self.__stopwatch = paTimings.Stopwatch()
+
+    def getPath(self):
+        return self.__path
+
+    def getSchema(self):
+        return self.__schema
+
+    def getSymbols(self):
+        return self.__symbols
+
+    def getWrittenFiles(self):
+        return self.__written
+
+    def getSkippedFiles(self):
+        return self.__skipped
+
+    # wall time of render and write phases, phases not run are missing
+    def getTimings(self):
+        return self.__stopwatch.getPhases()
+
+    # get token by type and name
+    def getToken(self, directive, name):
+        return self.__symbols.getToken(directive, name)
+
+    # get link tokens by field name
+    def getLinks(self, name):
+        return self.__symbols.getLinks(name)
+
+    # get classified fields of protoargs message
+    def getFields(self):
+        return self.__symbols.getFields()
+
+    # convert protobuf config names into args
+    def convertToArgName(self, name):
+        return name.replace("_","-")
+
+    # convert argument to option
+    def convertToOptName(self, name):
+        if len(name) == 1:
+            return "-" + name
+        elif len(name) > 1:
+            return "--" + name
+        else:
+            return name
+
+    # convert protobuf type of token using table of language types, unknown type is kept
+    def convertToType(self, token, types):
+        return types.get(token.type, token.type)
+
+    def saveFileData(self, path, data):
+        # unchanged file is not touched, so that dependent sources are not rebuilt
+        if paFile.sameFileData(path, data):
+            log.info("Skip file: '" + path + "', it is not changed")
+            self.__skipped.append(path)
+            return True
+
+        log.info("Save file: '" + path + "'")
+        try:
+            paFile.writeFileData(path, data)
+            self.__written.append(path)
+            return True;
+        except:
+            log.error(" Could not write to file '" + path + "' because of error")
+            return False;
+
+    # generate files from analysed tokens, returns list of (path, content)
+    def render(self, tokens):
+        raise NotImplementedError()
+
+    # parse proto file and generate files without saving them, returns list of (path, content)
+    # or None if there is no valid protoargs configuration
+    def renderFiles(self):
+        # analyse proto file, unless analysed schema is shared
+        if self.__schema is None:
+            self.__schema = paSchema.Schema(self.__path).analyse()
+        schema = self.__schema
+
+        if not schema.valid():
+            return None
+        self.__stopwatch.restart() # analysis is timed by schema
+        self.__symbols = schema.getSymbols()
+        files = self.render(schema.getTokens())
+        self.__stopwatch.lap("render")
+        return files
+
+    # parse proto file, generate and save files, returns false if any file is not saved
+    def generate(self):
+        files = self.renderFiles()
+        if files is None:
+            return False
+
+        result = True
+        for path, data in files:
+            result = self.saveFileData(path, data) and result # other files are still saved
+        self.__stopwatch.lap("write")
+        return result
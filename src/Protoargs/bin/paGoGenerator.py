@@ -1,6 +1,10 @@
 import os
-import logging
+import paLogger
 import paTokenizer
+import paTemplate
+import paGenerator
+
+log = paLogger.log
 
 
 # GLOBAL DEFS ###################################3
@@ -25,18 +29,29 @@ go_uint64 = "uint64"
 go_bool = "bool"
 go_string = "string"
 
+# go types by protobuf types
+go_types = {
+    pt_float: go_float,
+    pt_double: go_double,
+    pt_int32: go_int32,
+    pt_uint32: go_uint32,
+    pt_int64: go_int64,
+    pt_uint64: go_uint64,
+    pt_bool: go_bool,
+    pt_string: go_string,
+}
+
 # END GLOBALS ###################################3
 
-class Generator:
+class Generator(paGenerator.BaseGenerator):
 
-    __path = "" # path to proto file
     __goCommonPath = "" # path to common source file
     __goPath = "" # path to source file
     __mod = "" # go package name
     __go = "" # source file content
 
-    def __init__(self, path, dst):
-        self.__path = path
+    def __init__(self, path, dst, schema=None):
+        paGenerator.BaseGenerator.__init__(self, path, schema)
         filename = os.path.splitext( os.path.basename(path) )[0]
         base = os.path.join(dst, filename)
         self.__goCommonPath = os.path.join(dst, "protoargs.go")
@@ -52,97 +67,18 @@ class Generator:
     def getCommonFilePath(self):
         return self.__goCommonPath
 
-    # load file entirely
-    def loadFileData(self, path):
-        logging.info("Load file: '" + path + "'")
-        try:
-            with open(path, "r") as index:
-                lines = index.readlines()
-                index.close()
-                return lines
-        except:
-            logging.error("Could not read file '" + path + "' because of error")
-            return ""
-
-    def __saveFileData(self, path, data):
-        logging.info("Save file: '" + path + "'")
-        try:
-            with open(path, "w") as index:
-                index.write(data)
-                index.close()
-                return True;
-        except:
-            logging.error(" Could not write to file '" + path + "' because of error")
-            return False;
-
-    # parse proto file and generate go files
-    def generate(self):
-        #load proto file
-        data = self.loadFileData(self.__path)
-        result = len(data) != 0
-        if result:
-            # tokenize proto file data
-            tokenizer = paTokenizer.Tokenizer() \
-                    .tokenize(data) \
-                    .excludeUnused() \
-
-            result = tokenizer.check() # check tokens
-            if result:
-                tokens = tokenizer.getTokens()
-
-                # DBG
-                for token in tokens:
-                    logging.debug(str(token))
-
-                # generate souce code
-                self.__go = self.__generateSourceFromTokens(tokens) + self.__generateCommonSource()
-
-                # save code to files
-                self.__saveFileData( self.getSourceFilePath(), self.__go )
-
-        return data
+    # generate go files
+    def render(self, tokens):
+        self.__go = self.__generateSourceFromTokens(tokens) + self.__generateCommonSource()
+        return [(self.getSourceFilePath(), self.__go)]
 
     # convert protobuf config names into go code names
     def __convertToGoName(self, name):
         return "Arg" + name
 
-    # convert protobuf config names into args
-    def __convertToArgName(self, name):
-        return name.replace("_","-")
-
-    # convert argument to option
-    def __convertToOptName(self, name):
-        if len(name) == 1:
-            return "-" + name
-        elif len(name) > 1:
-            return "--" + name
-        else:
-            return name
-
     # convert protobuf config types into go types
     def __convertToGoType(self, token):
-        pyType = token.type # if missing use original
-
-        # get correct type
-        protoType = token.type
-        if protoType == pt_int32:
-            pyType = go_int32
-        if protoType == pt_uint32:
-            pyType = go_uint32
-        if protoType == pt_int64:
-            pyType = go_int64
-        if protoType == pt_uint64:
-            pyType = go_uint64
-        if protoType == pt_bool:
-            pyType = go_bool
-        if protoType == pt_string:
-            pyType = go_string
-        if protoType == pt_float:
-            pyType = go_float
-        if protoType == pt_double:
-            pyType = go_double
-
-        return pyType
+        return self.convertToType(token, go_types)
 
     def __convertToDefaultValue(self, token):
         if not token.value:
@@ -159,7 +95,7 @@ class Generator:
 #)
 #
 #"""
-        code = r"""
+        code = paTemplate.Builder(r"""
 /// If flag was found among provided arguments
 ///
 /// # Arguments
@@ -182,11 +118,11 @@ func isFlagPassed(flags *flag.FlagSet, name string) bool {
 // Option types
 \***************************************************************************/
 
-"""
+""")
 
         types = [go_string, go_bool, go_int32, go_uint32, go_int64, go_uint64, go_float, go_double]
         for gotype in types:
-            code += r"""
+            code.render(r"""
 type (
     %Type%Value struct { // A %type% value for %Type%Option interface.
         val %type% // possible default value
@@ -230,11 +166,10 @@ func (i *Array%Type%Flags) Set(value string) error {
     *i = append(*i, %type%(typedValue))
     return err
 }
-""" \
-        .replace("%Type%", gotype.capitalize()) \
-        .replace("%type%", gotype) \
-        .replace("%CONVERTER%", \
-            (r"""typedValue, err := strconv.ParseBool(value)""" if gotype == go_bool \
+""",
+        Type=gotype.capitalize(),
+        type=gotype,
+        CONVERTER=(r"""typedValue, err := strconv.ParseBool(value)""" if gotype == go_bool \
             else r"""typedValue, err := strconv.ParseInt(value, 10, 32)""" if gotype == go_int32 \
             else r"""typedValue, err := strconv.ParseInt(value, 10, 64)""" if gotype == go_int64 \
             else r"""typedValue, err := strconv.ParseUint(value, 10, 32)""" if gotype == go_uint32 \
@@ -243,7 +178,7 @@ func (i *Array%Type%Flags) Set(value string) error {
             else r"""typedValue, err := strconv.ParseFloat(value, 64)""" if gotype == go_double \
             else r"""typedValue := value"""))
 
-        return code
+        return code.build()
 
     # generate go source file content
     def __generateSourceFromTokens(self, tokens):
@@ -263,22 +198,22 @@ import (
 """
 
         tail = ""
-        body = ""
+        body = paTemplate.Builder()
 
         # add configuration structure to store typed values
-        body += """
+        body.add("""
 /// Configuration structure to hold all parsed arguments as string typed entities
 type Config struct {
-"""
+""")
         # register fields
-        body += self.__flagStructureFields(tokens)
+        body.add(self.__flagStructureFields(tokens))
 
-        body += """
+        body.add("""
 }
-"""
+""")
 
         # add prepare_options function binding
-        body += """
+        body.add("""
 /// Options preparation
 ///
 /// # Arguments
@@ -288,22 +223,22 @@ type Config struct {
 /// returns FlagSet instance ready to do parsing and configuration structure which memory is used
 func PrepareOptions(program string) (*flag.FlagSet, *Config) {
     flags := flag.NewFlagSet(program, flag.ContinueOnError)
-"""
+""")
         # initialize default config memory
-        body += self.__flagInitConfig(tokens)
+        body.add(self.__flagInitConfig(tokens))
 
         # register arguments
-        body += self.__flagProgramOptions(tokens)
+        body.add(self.__flagProgramOptions(tokens))
 
-        body += """
+        body.add("""
 
     return flags, config
 }
-"""
+""")
 
 
         # add usage function binding
-        body += r"""
+        body.add(r"""
 /// Get usage string
 ///
 /// # Arguments
@@ -327,19 +262,19 @@ func Usage(program string, description string) string {
 /// returns String with usage information
 func UsageExt(program string, description string, limit uint32) string {
 
-"""
+""")
         # register usage arguments
-        body += self.__flagProgramUsage(tokens)
+        body.add(self.__flagProgramUsage(tokens))
 
-        body += r"""
+        body.add(r"""
 
     return usage
 }
 
-"""
+""")
 
         # add parsing functions
-        body += """
+        body.add("""
 /// Parse command line arguments, and return filled configuration
 /// Simple and straight forward, thus recommended
 ///
@@ -377,12 +312,12 @@ func ParseExt(program string, args []string, description string, allow_incomplet
         return config, err
     }
 
-"""
+""")
 
         # register fields
-        body += self.__flagStructureFill(tokens)
+        body.add(self.__flagStructureFill(tokens))
 
-        body += r"""
+        body.add(r"""
     return config, nil
 }
 
@@ -521,71 +456,41 @@ func split(tokens []string, shift uint32, limit uint32) string {
     result += line
     return result
 }
-"""
+""")
 
-        return head + body + tail
-
-    # get token by type and name
-    def __getToken(self, tokens, directive, name):
-        result = paTokenizer.ProtoToken()
-        for token in tokens:
-            if token.directive == directive and token.name == name:
-                result = token
-                break
-        return result
-
-    # get link tokens by field name
-    def __getLinks(self, tokens, name):
-        result = []
-        start = False
-        for token in tokens:
-            if token.directive == paTokenizer.pd_message and token.name == paTokenizer.pa_links:
-                start = True
-            elif start:
-                if token.directive == paTokenizer.pd_end:
-                    break
-                elif token.directive == paTokenizer.pd_field and token.value == name: # default link value should be the name of args
-                    result.append(token)
-        return result
+        return head + body.build() + tail
 
     def __flagStructureFields(self, tokens):
         template = """    /// %DESCRIPTION%
     %NAME% %TYPE%\n"""
-        code = ""
-
-        start = False
-        for token in tokens:
-            if token.directive == paTokenizer.pd_message and token.name == paTokenizer.pa_main:
-                start = True
-            elif start:
-                if token.directive == paTokenizer.pd_end:
-                    break
-                elif token.directive == paTokenizer.pd_field:
-                    append = True
-                    isLinks = self.__getToken(tokens, paTokenizer.pd_message, paTokenizer.pa_links).valid()
-                    #if isLinks:
-                    #    links = sorted(self.__getLinks(tokens, token.name), key=lambda link: link.name)
-                    #    for link in links:
-                    #        if link.name == "h" or link.name == "help": # exclude predefined args
-                    #            append = False
-                    #            break
-
-                    if append:
-                        logging.debug("Create struct field name: " + str(token))
-                        goType = self.__convertToGoType(token)
-                        if token.field == paTokenizer.pf_repeated:
-                            goType = "Array" + goType.capitalize() + "Flags"
-                        elif token.field == paTokenizer.pf_optional:
-                            goType = goType.capitalize() + "Value"
-                        elif token.field == paTokenizer.pf_required:
-                            goType = goType.capitalize() + "Value"
-
-                        code += template \
-                                .replace("%NAME%", self.__convertToGoName(token.name)) \
-                                .replace("%TYPE%", goType) \
-                                .replace("%DESCRIPTION%", token.description)
-
-        return code
+        code = paTemplate.Builder()
+
+        for field in self.getFields():
+            token = field.token
+            append = True
+            #if field.linked:
+            #    links = field.sortedLinks
+            #    for link in links:
+            #        if link.name == "h" or link.name == "help": # exclude predefined args
+            #            append = False
+            #            break
+
+            if append:
+                log.debug("Create struct field name: %s", token)
+                goType = self.__convertToGoType(token)
+                if token.field == paTokenizer.pf_repeated:
+                    goType = "Array" + goType.capitalize() + "Flags"
+                elif token.field == paTokenizer.pf_optional:
+                    goType = goType.capitalize() + "Value"
+                elif token.field == paTokenizer.pf_required:
+                    goType = goType.capitalize() + "Value"
+
+                code.render(template,
+                        NAME=self.__convertToGoName(token.name),
+                        TYPE=goType,
+                        DESCRIPTION=token.description)
+
+        return code.build()
 
     def __flagStructureFill(self, tokens):
         templateOptional = r""""""
@@ -634,103 +539,88 @@ func split(tokens []string, shift uint32, limit uint32) string {
         }
     }
 """
-        code = """"""
+        code = paTemplate.Builder()
         position = 0
 
-        start = False
-        for token in tokens:
-            if token.directive == paTokenizer.pd_message and token.name == paTokenizer.pa_main:
-                start = True
-            elif start:
-                if token.directive == paTokenizer.pd_end:
-                    break
-                elif token.directive == paTokenizer.pd_field:
-                    append = True
-                    positional = False
-                    isLinks = self.__getToken(tokens, paTokenizer.pd_message, paTokenizer.pa_links).valid()
-                    argument = self.__convertToArgName(token.name)
-                    if isLinks:
-                        links = sorted(self.__getLinks(tokens, token.name), key=lambda link: link.name)
-                        if len(links) == 0:
-                            positional = True
-                        else:
-                            argument = self.__convertToArgName(links[0].name)
-
-                    if append:
-                        logging.debug("Fill struct field name: " + str(token))
-                        goType = self.__convertToGoType(token)
-
-                        if positional:
-                            position += 1
-
-                        template = templateOptional
-                        if positional and token.field == paTokenizer.pf_repeated:
-                            template = templateRepeatedPositional
-                        elif positional:
-                            template = templatePositional
-                        elif token.field == paTokenizer.pf_optional and token.type == pt_bool:
-                            template = templateOptionalBool
-                        elif token.field == paTokenizer.pf_required and token.type == pt_bool:
-                            template = templateOptionalBool + templateRequired
-                        elif token.field == paTokenizer.pf_repeated:
-                            template = templateRepeated
-                        elif token.field == paTokenizer.pf_required:
-                            template = templateRequired
-
-                        code += template \
-                                .replace("%NAME%", self.__convertToGoName(token.name)) \
-                                .replace("%ARGUMENT%", argument) \
-                                .replace("%OPTION%", self.__convertToArgName(token.name)) \
-                                .replace("%TYPE%", goType) \
-                                .replace("%VARIABLE%", "config." + self.__convertToGoName(token.name)) \
-                                .replace("%POSITION%", str(position)) \
-                                .replace("%INDEX%", str(position-1))
-
-        return code
+        for field in self.getFields():
+            token = field.token
+            append = True
+            positional = False
+            argument = self.convertToArgName(token.name)
+            if field.linked:
+                links = field.sortedLinks
+                if len(links) == 0:
+                    positional = True
+                else:
+                    argument = self.convertToArgName(links[0].name)
+
+            if append:
+                log.debug("Fill struct field name: %s", token)
+                goType = self.__convertToGoType(token)
+
+                if positional:
+                    position += 1
+
+                template = templateOptional
+                if positional and token.field == paTokenizer.pf_repeated:
+                    template = templateRepeatedPositional
+                elif positional:
+                    template = templatePositional
+                elif token.field == paTokenizer.pf_optional and token.type == pt_bool:
+                    template = templateOptionalBool
+                elif token.field == paTokenizer.pf_required and token.type == pt_bool:
+                    template = templateOptionalBool + templateRequired
+                elif token.field == paTokenizer.pf_repeated:
+                    template = templateRepeated
+                elif token.field == paTokenizer.pf_required:
+                    template = templateRequired
+
+                code.render(template,
+                        NAME=self.__convertToGoName(token.name),
+                        ARGUMENT=argument,
+                        OPTION=self.convertToArgName(token.name),
+                        TYPE=goType,
+                        VARIABLE="config." + self.__convertToGoName(token.name),
+                        POSITION=str(position),
+                        INDEX=str(position-1))
+
+        return code.build()
 
     def __flagInitConfig(self, tokens):
         template = """    config.%NAME% = %TYPE%{%DEFAULTVAL%, false}\n"""
 
-        code = """
+        code = paTemplate.Builder("""
     config := new(Config)
-"""
-
-        start = False
-        for token in tokens:
-            if token.directive == paTokenizer.pd_message and token.name == paTokenizer.pa_main:
-                start = True
-            elif start:
-                if token.directive == paTokenizer.pd_end:
-                    break
-                elif token.directive == paTokenizer.pd_field:
-                    append = True
-                    isLinks = self.__getToken(tokens, paTokenizer.pd_message, paTokenizer.pa_links).valid()
-                    #if isLinks:
-                    #    links = sorted(self.__getLinks(tokens, token.name), key=lambda link: link.name)
-                    #    for link in links:
-                    #        if link.name == "h" or link.name == "help": # exclude predefined args
-                    #            append = False
-                    #            break
-
-                    if append:
-                        logging.debug("Create struct field name: " + str(token))
-                        goType = self.__convertToGoType(token)
-                        if token.field == paTokenizer.pf_repeated:
-                            goType = "Array" + goType.capitalize() + "Flags"
-                        elif token.field == paTokenizer.pf_optional:
-                            goType = goType.capitalize() + "Value"
-                        elif token.field == paTokenizer.pf_required:
-                            goType = goType.capitalize() + "Value"
-
-                        if token.field != paTokenizer.pf_repeated:
-                            code += template \
-                                    .replace("%NAME%", self.__convertToGoName(token.name)) \
-                                    .replace("%TYPE%", goType) \
-                                    .replace("%DESCRIPTION%", token.description) \
-                                    .replace("%DEFAULTVAL%", \
-                                    ("`" + token.value + "`" if token.type == pt_string else "false" if len(token.value) == 0 and token.type == pt_bool else "0" if len(token.value) == 0 else token.value) ) \
-
-        return code
+""")
+
+        for field in self.getFields():
+            token = field.token
+            append = True
+            #if field.linked:
+            #    links = field.sortedLinks
+            #    for link in links:
+            #        if link.name == "h" or link.name == "help": # exclude predefined args
+            #            append = False
+            #            break
+
+            if append:
+                log.debug("Create struct field name: %s", token)
+                goType = self.__convertToGoType(token)
+                if token.field == paTokenizer.pf_repeated:
+                    goType = "Array" + goType.capitalize() + "Flags"
+                elif token.field == paTokenizer.pf_optional:
+                    goType = goType.capitalize() + "Value"
+                elif token.field == paTokenizer.pf_required:
+                    goType = goType.capitalize() + "Value"
+
+                if token.field != paTokenizer.pf_repeated:
+                    code.render(template,
+                            NAME=self.__convertToGoName(token.name),
+                            TYPE=goType,
+                            DESCRIPTION=token.description,
+                            DEFAULTVAL=("`" + token.value + "`" if token.type == pt_string else "false" if len(token.value) == 0 and token.type == pt_bool else "0" if len(token.value) == 0 else token.value))
+
+        return code.build()
 
     def __flagProgramOptions(self, tokens):
         templateOptional = r"""
@@ -744,87 +634,68 @@ func split(tokens []string, shift uint32, limit uint32) string {
         templateRequiredBool = r"""
     flags.BoolVar(&%VARIABLE%.val, `%OPTIONS%`, %DEFAULT%, `%DESCRIPTION% {%FREQUENCY%,type:%PTYPE%}`)"""
 
-        code = ""
+        code = paTemplate.Builder()
         positional = []
 
-        start = False
-        for token in tokens:
-            if token.directive == paTokenizer.pd_message and token.name == paTokenizer.pa_main:
-                start = True
-            elif start:
-                if token.directive == paTokenizer.pd_end:
-                    break
-                elif token.directive == paTokenizer.pd_field:
-
-                    # set template
-                    t = templateOptional
-                    if token.field == paTokenizer.pf_required and token.type == pt_bool:
-                        t = templateRequiredBool
-                    elif token.field == paTokenizer.pf_optional and token.type == pt_bool:
-                        t = templateOptionalBool
-                    elif token.field == paTokenizer.pf_required:
-                        t = templateRequired
-                    elif token.field == paTokenizer.pf_repeated:
-                        t = templateRepeated
-
-                    isLinks = self.__getToken(tokens, paTokenizer.pd_message, paTokenizer.pa_links).valid()
-                    if isLinks:
-                        links = sorted(self.__getLinks(tokens, token.name), key=lambda link: link.name)
-                        if len(links) > 0:
-                            # add all links as options
-                            logging.debug("links found for: " + str(token) + "\n" + str(links))
-                            for link in links:
-                                code += t \
-                                        .replace("%OPTIONS%", self.__convertToArgName(link.name)) \
-                                        .replace("%DESCRIPTION%",token.description) \
-                                        .replace("%PTYPE%", token.type) \
-                                        .replace("%ARGNAME%", token.name) \
-                                        .replace("%FREQUENCY%", token.field.upper()) \
-                                        .replace("%DEFAULT%", \
-                                        ("\"" + token.value + "\"" if token.type == pt_string else "false" if len(token.value) == 0 and token.type == pt_bool else "0" if len(token.value) == 0 else token.value) ) \
-                                        .replace("%TYPE%", \
-                                        (", type=" + self.__convertToGoType(token) if token.type != pt_bool else "") ) \
-                                        .replace("%REQUIRED%", \
-                                        ("true" if token.field == paTokenizer.pf_required else "false") ) \
-                                        .replace("%REPEATED%", \
-                                        ("true" if token.field == paTokenizer.pf_repeated else "false") ) \
-                                        .replace("%WITHVALUE%", \
-                                        ("true" if token.type != pt_bool else "false") ) \
-                                        .replace("%VARIABLE%", "config." + self.__convertToGoName(token.name))
-                        else:
-                            logging.debug("positional arg found: " + str(token))
-                            positional.append(token)
-                    else:
-                        logging.debug("convert main protoargs field name into long arg name: " + str(token))
-                        code += t \
-                                .replace("%FUNCTION%", self.__convertToGoType(token).capitalize() + "Var") \
-                                .replace("%OPTIONS%", self.__convertToArgName(token.name) ) \
-                                .replace("%DESCRIPTION%",token.description) \
-                                .replace("%PTYPE%", token.type) \
-                                .replace("%ARGNAME%", token.name) \
-                                .replace("%FREQUENCY%", token.field.upper()) \
-                                .replace("%DEFAULT%", \
-                                ("\"" + token.value + "\"" if token.type == pt_string else "false" if len(token.value) == 0 and token.type == pt_bool else "0" if len(token.value) == 0 else token.value) ) \
-                                .replace("%TYPE%", \
-                                (", type=" + self.__convertToGoType(token) if token.type != pt_bool else "") ) \
-                                .replace("%REQUIRED%", \
-                                ("true" if token.field == paTokenizer.pf_required else "false") ) \
-                                .replace("%REPEATED%", \
-                                ("true" if token.field == paTokenizer.pf_repeated else "false") ) \
-                                .replace("%WITHVALUE%", \
-                                ("true" if token.type != pt_bool or token.field == paTokenizer.pf_repeated else "false") ) \
-                                .replace("%VARIABLE%", "config." + self.__convertToGoName(token.name))
-
-                        #if len(token.name) == 1:
-                        #    code += "\n                   .short('" + self.__convertToArgName(token.name) + "')" # convert into args
-                        #else:
-                        #    code += "\n                   .long(r#\"" + self.__convertToArgName(token.name) + "\"#)" # convert into args
-
-                        #code += ")\n"
+        for field in self.getFields():
+            token = field.token
+
+            # set template
+            t = templateOptional
+            if token.field == paTokenizer.pf_required and token.type == pt_bool:
+                t = templateRequiredBool
+            elif token.field == paTokenizer.pf_optional and token.type == pt_bool:
+                t = templateOptionalBool
+            elif token.field == paTokenizer.pf_required:
+                t = templateRequired
+            elif token.field == paTokenizer.pf_repeated:
+                t = templateRepeated
+
+            if field.linked:
+                links = field.sortedLinks
+                if len(links) > 0:
+                    # add all links as options
+                    log.debug("links found for: %s\n%s", token, links)
+                    for link in links:
+                        code.render(t,
+                                OPTIONS=self.convertToArgName(link.name),
+                                DESCRIPTION=token.description,
+                                PTYPE=token.type,
+                                ARGNAME=token.name,
+                                FREQUENCY=token.field.upper(),
+                                DEFAULT=("\"" + token.value + "\"" if token.type == pt_string else "false" if len(token.value) == 0 and token.type == pt_bool else "0" if len(token.value) == 0 else token.value),
+                                TYPE=(", type=" + self.__convertToGoType(token) if token.type != pt_bool else ""),
+                                REQUIRED=("true" if token.field == paTokenizer.pf_required else "false"),
+                                REPEATED=("true" if token.field == paTokenizer.pf_repeated else "false"),
+                                WITHVALUE=("true" if token.type != pt_bool else "false"),
+                                VARIABLE="config." + self.__convertToGoName(token.name))
                 else:
-                    logging.warn("unknown token inside protoargs structure: " + str(token))
-
-        return code
+                    log.debug("positional arg found: %s", token)
+                    positional.append(token)
+            else:
+                log.debug("convert main protoargs field name into long arg name: %s", token)
+                code.render(t,
+                        FUNCTION=self.__convertToGoType(token).capitalize() + "Var",
+                        OPTIONS=self.convertToArgName(token.name),
+                        DESCRIPTION=token.description,
+                        PTYPE=token.type,
+                        ARGNAME=token.name,
+                        FREQUENCY=token.field.upper(),
+                        DEFAULT=("\"" + token.value + "\"" if token.type == pt_string else "false" if len(token.value) == 0 and token.type == pt_bool else "0" if len(token.value) == 0 else token.value),
+                        TYPE=(", type=" + self.__convertToGoType(token) if token.type != pt_bool else ""),
+                        REQUIRED=("true" if token.field == paTokenizer.pf_required else "false"),
+                        REPEATED=("true" if token.field == paTokenizer.pf_repeated else "false"),
+                        WITHVALUE=("true" if token.type != pt_bool or token.field == paTokenizer.pf_repeated else "false"),
+                        VARIABLE="config." + self.__convertToGoName(token.name))
+
+                #if len(token.name) == 1:
+                #    code += "\n                   .short('" + self.convertToArgName(token.name) + "')" # convert into args
+                #else:
+                #    code += "\n                   .long(r#\"" + self.convertToArgName(token.name) + "\"#)" # convert into args
+
+                #code += ")\n"
+
+        return code.build()
 
     def __flagProgramUsage(self, tokens):
         template = r"""
@@ -841,229 +712,190 @@ func split(tokens []string, shift uint32, limit uint32) string {
         for x in range(0,shift):
             shiftSpace += " "
 
-        shortOptional = "" # short usage for optional arguments
-        shortRequired = "" # short usage required arguments
-        shortPositional = "" # short usage positional arguments
-        optional = "" # optional detailed description
-        required = "" # required detailed description
-        positional = "" # positional detailed description
-
-        start = False
-        for token in tokens:
-            if token.directive == paTokenizer.pd_message and token.name == paTokenizer.pa_main:
-                start = True
-            elif start:
-                if token.directive == paTokenizer.pd_end:
-                    break
-                elif token.directive == paTokenizer.pd_field:
-
-                    # set template
-                    t = template
-                    if token.field == paTokenizer.pf_required:
-                        t = templateRequired
-                    elif token.field == paTokenizer.pf_repeated:
-                        t = templateRepeated
-
-                    isLinks = self.__getToken(tokens, paTokenizer.pd_message, paTokenizer.pa_links).valid()
-                    if isLinks:
-                        links = sorted(self.__getLinks(tokens, token.name), key=lambda link: link.name)
-                        if len(links) > 0:
-                            # add all links as options
-                            logging.debug("links found for: " + str(token) + "\n" + str(links))
-                            options = ""
-                            argument = ""
-                            for link in links:
-                                if len(options) > 0:
-                                    options += ", "
-                                    argument += "|"
-                                #options += self.__convertToArgName(link.name) # convert into args
-                                if len(link.name) == 1:
-                                    options += "-" + self.__convertToArgName(link.name)
-                                    argument += "-" + self.__convertToArgName(link.name)
-                                else:
-                                    options += "--" + self.__convertToArgName(link.name)
-                                    argument += "--" + self.__convertToArgName(link.name)
-
-                            if token.type != pt_bool:
-                                options += " " + token.name
-
-                            if options:
-                                spaces = shift - (1 + len(options)) # calculate needed spaces
-                                for x in range(1,spaces):
-                                    options += " "
-                                updated = t \
-                                        .replace("%OPTIONS%", options) \
-                                        .replace("%NEWLINE%", "\n" + shiftSpace if spaces < 3 else "") \
-                                        .replace("%DESCRIPTION%",token.description) \
-                                        .replace("%PTYPE%", token.type) \
-                                        .replace("%ARGNAME%", token.name) \
-                                        .replace("%FREQUENCY%", token.field.upper()) \
-                                        .replace("%DEFAULT%", \
-                                        ("\"" + token.value + "\"" if token.type == pt_string else "false" if len(token.value) == 0 and token.type == pt_bool else "0" if len(token.value) == 0 else token.value) ) \
-                                        .replace("%TYPE%", \
-                                        (", type=" + self.__convertToGoType(token) if token.type != pt_bool else "") ) \
-                                        .replace("%REQUIRED%", \
-                                        ("true" if token.field == paTokenizer.pf_required else "false") ) \
-                                        .replace("%REPEATED%", \
-                                        ("true" if token.field == paTokenizer.pf_repeated else "false") ) \
-                                        .replace("%WITHVALUE%", \
-                                        ("true" if token.type != pt_bool else "false") ) \
-                                        .replace("%VARIABLE%", "config." + token.name)
-
-
-                                if token.field == paTokenizer.pf_required:
-                                    if len(shortRequired) > 0:
-                                        shortRequired += " "
-                                    shortRequired += argument
-                                    if token.type != pt_bool:
-                                        shortRequired += " " + token.name
-                                    required += updated
-                                elif token.field == paTokenizer.pf_repeated:
-                                    if len(shortOptional) > 0:
-                                        shortOptional += " "
-                                    shortOptional += "[" + argument
-                                    if token.type != pt_bool:
-                                        shortOptional += " " + token.name + " [" + argument + " " + token.name + " ...]" + "]"
-                                    else:
-                                        shortOptional += " [" + argument + " ...]" + "]"
-                                    optional += updated
-                                else:
-                                    if len(shortOptional) > 0:
-                                        shortOptional += " "
-                                    shortOptional += "[" + argument
-                                    if token.type != pt_bool:
-                                        shortOptional += " " + token.name + "]"
-                                    else:
-                                        shortOptional += "]"
-                                    optional += updated
+        shortOptional = [] # short usage for optional arguments
+        shortRequired = [] # short usage required arguments
+        shortPositional = [] # short usage positional arguments
+        optional = [] # optional detailed description
+        required = [] # required detailed description
+        positional = [] # positional detailed description
+
+        for field in self.getFields():
+            token = field.token
+
+            # set template
+            t = template
+            if token.field == paTokenizer.pf_required:
+                t = templateRequired
+            elif token.field == paTokenizer.pf_repeated:
+                t = templateRepeated
+
+            if field.linked:
+                links = field.sortedLinks
+                if len(links) > 0:
+                    # add all links as options
+                    log.debug("links found for: %s\n%s", token, links)
+                    options = ""
+                    argument = ""
+                    for link in links:
+                        if len(options) > 0:
+                            options += ", "
+                            argument += "|"
+                        #options += self.convertToArgName(link.name) # convert into args
+                        if len(link.name) == 1:
+                            options += "-" + self.convertToArgName(link.name)
+                            argument += "-" + self.convertToArgName(link.name)
                         else:
-                            options = token.name
-                            spaces = shift - (1 + len(options)) # calculate needed spaces
-                            for x in range(1,spaces):
-                                options += " "
-                            updated = templateRequired \
-                                    .replace("%OPTIONS%", options) \
-                                    .replace("%NEWLINE%", "\n" + shiftSpace if spaces < 3 else "") \
-                                    .replace("%DESCRIPTION%",token.description) \
-                                    .replace("%PTYPE%", token.type) \
-                                    .replace("%ARGNAME%", token.name) \
-                                    .replace("%FREQUENCY%", paTokenizer.pf_required.upper()) \
-                                    .replace("%DEFAULT%", \
-                                    ("\"" + token.value + "\"" if token.type == pt_string else token.value) ) \
-                                    .replace("%TYPE%", \
-                                    (", type=" + self.__convertToGoType(token) if token.type != pt_bool else "") ) \
-                                    .replace("%REQUIRED%", \
-                                    ("true" if token.field == paTokenizer.pf_required else "false") ) \
-                                    .replace("%REPEATED%", \
-                                    ("true" if token.field == paTokenizer.pf_repeated else "false") ) \
-                                    .replace("%WITHVALUE%", \
-                                    ("true" if token.type != pt_bool else "false") ) \
-                                    .replace("%VARIABLE%", "config." + token.name)
-
-                            logging.debug("positional arg found: " + str(token))
-                            if len(shortPositional) > 0:
-                                shortPositional += " "
-                            shortPositional += token.name
-                            if token.field == paTokenizer.pf_repeated:
-                                shortPositional += " [" + token.name + " ...]"
-                            positional += updated
-                    else:
-                        logging.debug("convert main protoargs field name into long arg name: " + str(token))
-                        if len(token.name) == 1:
-                            argument = "-" + self.__convertToArgName(token.name)
-                        else:
-                            argument = "--" + self.__convertToArgName(token.name)
-                        options = argument
-                        if token.type != pt_bool:
-                            options += " value"
+                            options += "--" + self.convertToArgName(link.name)
+                            argument += "--" + self.convertToArgName(link.name)
+
+                    if token.type != pt_bool:
+                        options += " " + token.name
+
+                    if options:
                         spaces = shift - (1 + len(options)) # calculate needed spaces
                         for x in range(1,spaces):
                             options += " "
-                        updated = t \
-                                .replace("%FUNCTION%", self.__convertToGoType(token).capitalize() + "Var") \
-                                .replace("%OPTIONS%", options) \
-                                .replace("%NEWLINE%", "\n" + shiftSpace if spaces < 3 else "") \
-                                .replace("%DESCRIPTION%",token.description) \
-                                .replace("%PTYPE%", token.type) \
-                                .replace("%ARGNAME%", token.name) \
-                                .replace("%FREQUENCY%", token.field.upper()) \
-                                .replace("%DEFAULT%", \
-                                ("\"" + token.value + "\"" if token.type == pt_string else "false" if len(token.value) == 0 and token.type == pt_bool else "0" if len(token.value) == 0 else token.value) ) \
-                                .replace("%TYPE%", \
-                                (", type=" + self.__convertToGoType(token) if token.type != pt_bool else "") ) \
-                                .replace("%REQUIRED%", \
-                                ("true" if token.field == paTokenizer.pf_required else "false") ) \
-                                .replace("%REPEATED%", \
-                                ("true" if token.field == paTokenizer.pf_repeated else "false") ) \
-                                .replace("%WITHVALUE%", \
-                                ("true" if token.type != pt_bool or token.field == paTokenizer.pf_repeated else "false") ) \
-                                .replace("%VARIABLE%", "config." + token.name)
+                        updated = paTemplate.get(t).render(
+                                OPTIONS=options,
+                                NEWLINE=("\n" + shiftSpace if spaces < 3 else ""),
+                                DESCRIPTION=token.description,
+                                PTYPE=token.type,
+                                ARGNAME=token.name,
+                                FREQUENCY=token.field.upper(),
+                                DEFAULT=("\"" + token.value + "\"" if token.type == pt_string else "false" if len(token.value) == 0 and token.type == pt_bool else "0" if len(token.value) == 0 else token.value),
+                                TYPE=(", type=" + self.__convertToGoType(token) if token.type != pt_bool else ""),
+                                REQUIRED=("true" if token.field == paTokenizer.pf_required else "false"),
+                                REPEATED=("true" if token.field == paTokenizer.pf_repeated else "false"),
+                                WITHVALUE=("true" if token.type != pt_bool else "false"),
+                                VARIABLE="config." + token.name)
+
 
                         if token.field == paTokenizer.pf_required:
-                            if len(shortRequired) > 0:
-                                shortRequired += " "
-                            shortRequired += argument
                             if token.type != pt_bool:
-                                shortRequired += " value"
-                            required += updated
+                                shortRequired.append(argument + " " + token.name)
+                            else:
+                                shortRequired.append(argument)
+                            required.append(updated)
                         elif token.field == paTokenizer.pf_repeated:
-                            if len(shortOptional) > 0:
-                                shortOptional += " "
-                            shortOptional += "[" + argument
                             if token.type != pt_bool:
-                                shortOptional += " value [" + argument + " value ...]" + "]"
+                                shortOptional.append("[" + argument + " " + token.name + " [" + argument + " " + token.name + " ...]" + "]")
                             else:
-                                shortOptional += " [" + argument + " ...]" + "]"
-                            optional += updated
+                                shortOptional.append("[" + argument + " [" + argument + " ...]" + "]")
+                            optional.append(updated)
                         else:
-                            if len(shortOptional) > 0:
-                                shortOptional += " "
-                            shortOptional += "[" + argument
                             if token.type != pt_bool:
-                                shortOptional += " value]"
+                                shortOptional.append("[" + argument + " " + token.name + "]")
                             else:
-                                shortOptional += "]"
-                            optional += updated
-
+                                shortOptional.append("[" + argument + "]")
+                            optional.append(updated)
+                else:
+                    options = token.name
+                    spaces = shift - (1 + len(options)) # calculate needed spaces
+                    for x in range(1,spaces):
+                        options += " "
+                    updated = paTemplate.get(templateRequired).render(
+                            OPTIONS=options,
+                            NEWLINE=("\n" + shiftSpace if spaces < 3 else ""),
+                            DESCRIPTION=token.description,
+                            PTYPE=token.type,
+                            ARGNAME=token.name,
+                            FREQUENCY=paTokenizer.pf_required.upper(),
+                            DEFAULT=("\"" + token.value + "\"" if token.type == pt_string else token.value),
+                            TYPE=(", type=" + self.__convertToGoType(token) if token.type != pt_bool else ""),
+                            REQUIRED=("true" if token.field == paTokenizer.pf_required else "false"),
+                            REPEATED=("true" if token.field == paTokenizer.pf_repeated else "false"),
+                            WITHVALUE=("true" if token.type != pt_bool else "false"),
+                            VARIABLE="config." + token.name)
+
+                    log.debug("positional arg found: %s", token)
+                    if token.field == paTokenizer.pf_repeated:
+                        shortPositional.append(token.name + " [" + token.name + " ...]")
+                    else:
+                        shortPositional.append(token.name)
+                    positional.append(updated)
+            else:
+                log.debug("convert main protoargs field name into long arg name: %s", token)
+                if len(token.name) == 1:
+                    argument = "-" + self.convertToArgName(token.name)
                 else:
-                    logging.warn("unknown token inside protoargs structure: " + str(token))
+                    argument = "--" + self.convertToArgName(token.name)
+                options = argument
+                if token.type != pt_bool:
+                    options += " value"
+                spaces = shift - (1 + len(options)) # calculate needed spaces
+                for x in range(1,spaces):
+                    options += " "
+                updated = paTemplate.get(t).render(
+                        FUNCTION=self.__convertToGoType(token).capitalize() + "Var",
+                        OPTIONS=options,
+                        NEWLINE=("\n" + shiftSpace if spaces < 3 else ""),
+                        DESCRIPTION=token.description,
+                        PTYPE=token.type,
+                        ARGNAME=token.name,
+                        FREQUENCY=token.field.upper(),
+                        DEFAULT=("\"" + token.value + "\"" if token.type == pt_string else "false" if len(token.value) == 0 and token.type == pt_bool else "0" if len(token.value) == 0 else token.value),
+                        TYPE=(", type=" + self.__convertToGoType(token) if token.type != pt_bool else ""),
+                        REQUIRED=("true" if token.field == paTokenizer.pf_required else "false"),
+                        REPEATED=("true" if token.field == paTokenizer.pf_repeated else "false"),
+                        WITHVALUE=("true" if token.type != pt_bool or token.field == paTokenizer.pf_repeated else "false"),
+                        VARIABLE="config." + token.name)
+
+                if token.field == paTokenizer.pf_required:
+                    if token.type != pt_bool:
+                        shortRequired.append(argument + " value")
+                    else:
+                        shortRequired.append(argument)
+                    required.append(updated)
+                elif token.field == paTokenizer.pf_repeated:
+                    if token.type != pt_bool:
+                        shortOptional.append("[" + argument + " value [" + argument + " value ...]" + "]")
+                    else:
+                        shortOptional.append("[" + argument + " [" + argument + " ...]" + "]")
+                    optional.append(updated)
+                else:
+                    if token.type != pt_bool:
+                        shortOptional.append("[" + argument + " value]")
+                    else:
+                        shortOptional.append("[" + argument + "]")
+                    optional.append(updated)
+
 
         # generate final usage code
-        code = r"""    block := "\n" + `usage: ` + program + `"""
+        code = paTemplate.Builder(r"""    block := "\n" + `usage: ` + program + `""")
         if len(shortRequired):
-            code += " " + shortRequired
+            code.add(" " + " ".join(shortRequired))
         if len(shortOptional):
-            code += " " + shortOptional
+            code.add(" " + " ".join(shortOptional))
         if len(shortPositional):
-            code += " " + shortPositional
-        code += "`"
-        code += r"""
+            code.add(" " + " ".join(shortPositional))
+        code.add("`")
+        code.add(r"""
     usage := splitShortUsage(block, limit)
-"""
+""")
 
-        code += r"""
+        code.add(r"""
     usage += "\n\n"
     usage += description
-"""
+""")
 
         if len(required) > 0:
-            code += r"""    usage += "\n\n" + `required arguments:`""" + "\n"
-            code += r"""    block = `""" + required + r"""`""" + "\n"
-            code += r"""    usage += splitUsage(block, limit)""" + "\n"
+            code.add(r"""    usage += "\n\n" + `required arguments:`""" + "\n")
+            code.add(r"""    block = `""" + "".join(required) + r"""`""" + "\n")
+            code.add(r"""    usage += splitUsage(block, limit)""" + "\n")
 
         if len(positional) > 0:
-            code += r"""    usage += "\n\n" + `required positional arguments:`""" + "\n"
-            code += r"""    block = `""" + positional + r"""`""" + "\n"
-            code += r"""    usage += splitUsage(block, limit)""" + "\n"
+            code.add(r"""    usage += "\n\n" + `required positional arguments:`""" + "\n")
+            code.add(r"""    block = `""" + "".join(positional) + r"""`""" + "\n")
+            code.add(r"""    usage += splitUsage(block, limit)""" + "\n")
 
         if len(optional) > 0:
             #code += r"""    usage += "\n\n" + `optional arguments:`""" + "\n"
             #code += r"""    usage += `""" + optional + r"""`""" + "\n"
 
-            code += r"""    usage += "\n\n" + `optional arguments:`""" + "\n"
-            code += r"""    block = `""" + optional + r"""`""" + "\n"
-            code += r"""    usage += splitUsage(block, limit)""" + "\n"
+            code.add(r"""    usage += "\n\n" + `optional arguments:`""" + "\n")
+            code.add(r"""    block = `""" + "".join(optional) + r"""`""" + "\n")
+            code.add(r"""    usage += splitUsage(block, limit)""" + "\n")
 
-        code += r"""    usage += "\n" """
-        return code
+        code.add(r"""    usage += "\n" """)
+        return code.build()
 
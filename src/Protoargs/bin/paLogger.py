@@ -2,8 +2,16 @@ import os
 import sys
 import logging
 
-'''Initialize logger'''
-def init(level, logDir, logFilename='protoargs.log'):
+# logger of protoargs modules, messages propagate to logging configured by application
+# and are dropped if there is none, root logger is never configured implicitly
+log = logging.getLogger("protoargs")
+log.addHandler(logging.NullHandler())
+
+# handlers added by init, repeated init replaces them instead of adding more
+handlers = []
+
+'''Initialize logger, without log directory no log file is written'''
+def init(level, logDir=None, logFilename='protoargs.log'):
 
     loggingLevel = logging.INFO;
     if level == "ERROR":
@@ -16,11 +24,19 @@ def init(level, logDir, logFilename='protoargs.log'):
         loggingLevel = logging.DEBUG
 
     logFormat = '%(asctime)s [%(threadName)-12.12s] %(filename)s:%(lineno)d [%(levelname)-5.5s] %(message)s'
-    logging.basicConfig(filename=os.path.join(logDir,logFilename), level=loggingLevel, format=logFormat)
-
     logFormatter = logging.Formatter(logFormat)
     rootLogger = logging.getLogger()
+    rootLogger.setLevel(loggingLevel)
+
+    for handler in handlers:
+        rootLogger.removeHandler(handler)
+        handler.close()
+    del handlers[:]
+
+    if logDir is not None:
+        handlers.append(logging.FileHandler(os.path.join(logDir, logFilename)))
+    handlers.append(logging.StreamHandler(sys.stdout))
 
-    consoleHandler = logging.StreamHandler(sys.stdout)
-    consoleHandler.setFormatter(logFormatter)
-    rootLogger.addHandler(consoleHandler)
+    for handler in handlers:
+        handler.setFormatter(logFormatter)
+        rootLogger.addHandler(handler)
@@ -1,6 +1,10 @@
 import os
-import logging
+import paLogger
 import paTokenizer
+import paTemplate
+import paGenerator
+
+log = paLogger.log
 
 
 # GLOBAL DEFS ###################################3
@@ -25,16 +29,27 @@ py_uint64 = "int"
 py_bool = "str2bool"
 py_string = "str"
 
+# python types by protobuf types
+py_types = {
+    pt_float: py_float,
+    pt_double: py_double,
+    pt_int32: py_int32,
+    pt_uint32: py_uint32,
+    pt_int64: py_int64,
+    pt_uint64: py_uint64,
+    pt_bool: py_bool,
+    pt_string: py_string,
+}
+
 # END GLOBALS ###################################3
 
-class Generator:
+class Generator(paGenerator.BaseGenerator):
 
-    __path = "" # path to proto file
     __pyPath = "" # path to source file
     __py = "" # source file content
 
-    def __init__(self, path, dst):
-        self.__path = path
+    def __init__(self, path, dst, schema=None):
+        paGenerator.BaseGenerator.__init__(self, path, schema)
         filename = os.path.splitext( os.path.basename(path) )[0]
         base = os.path.join(dst, filename)
         self.__pyPath = base + "_pa.py"
@@ -45,97 +60,18 @@ class Generator:
     def getSourceFilePath(self):
         return self.__pyPath
 
-    # load file entirely
-    def loadFileData(self, path):
-        logging.info("Load file: '" + path + "'")
-        try:
-            with open(path, "r") as index:
-                lines = index.readlines()
-                index.close()
-                return lines
-        except:
-            logging.error("Could not read file '" + path + "' because of error")
-            return ""
-
-    def __saveFileData(self, path, data):
-        logging.info("Save file: '" + path + "'")
-        try:
-            with open(path, "w") as index:
-                index.write(data)
-                index.close()
-                return True;
-        except:
-            logging.error(" Could not write to file '" + path + "' because of error")
-            return False;
-
-    # parse proto file and generate python files
-    def generate(self):
-        #load proto file
-        data = self.loadFileData(self.__path)
-        result = len(data) != 0
-        if result:
-            # tokenize proto file data
-            tokenizer = paTokenizer.Tokenizer() \
-                    .tokenize(data) \
-                    .excludeUnused() \
-
-            result = tokenizer.check() # check tokens
-            if result:
-                tokens = tokenizer.getTokens()
-
-                # DBG
-                for token in tokens:
-                    logging.debug(str(token))
-
-                # generate souce code
-                self.__py = self.__generateSourceFromTokens(tokens)
-
-                # save code to files
-                self.__saveFileData( self.getSourceFilePath(), self.__py )
-
-        return data
+    # generate python files
+    def render(self, tokens):
+        self.__py = self.__generateSourceFromTokens(tokens)
+        return [(self.getSourceFilePath(), self.__py)]
 
     # convert protobuf config names into c code names
     def __convertToPyName(self, name):
         return name.lower()
 
-    # convert protobuf config names into args
-    def __convertToArgName(self, name):
-        return name.replace("_","-")
-
-    # convert argument to option
-    def __convertToOptName(self, name):
-        if len(name) == 1:
-            return "-" + name
-        elif len(name) > 1:
-            return "--" + name
-        else:
-            return name
-
     # convert protobuf config types into python types
     def __convertToPyType(self, token):
-        pyType = token.type # if missing use original
-
-        # get correct type
-        protoType = token.type
-        if protoType == pt_int32:
-            pyType = py_int32
-        if protoType == pt_uint32:
-            pyType = py_uint32
-        if protoType == pt_int64:
-            pyType = py_int64
-        if protoType == pt_uint64:
-            pyType = py_uint64
-        if protoType == pt_bool:
-            pyType = py_bool
-        if protoType == pt_string:
-            pyType = py_string
-        if protoType == pt_float:
-            pyType = py_float
-        if protoType == pt_double:
-            pyType = py_double
-
-        return pyType
+        return self.convertToType(token, py_types)
 
     def __convertToDefaultValue(self, token):
         if not token.value:
@@ -159,223 +95,174 @@ def str2bool(v):
 """
 
         tail = ""
-        body = ""
+        body = paTemplate.Builder()
         prefix = ""
         for token in tokens:
             if token.directive == paTokenizer.pd_package:
-                logging.debug(str(token))
+                log.debug("%s", token)
                 namespaces = token.name.split(".") #discover namespaces
                 prefix = "_".join(namespaces)
 
         # add prepareOptions function binding
-        body += """
+        body.add("""
 def prepareOptions(program, description):
-"""
+""")
         # register arguments
-        body += self.__argparseProgramDescription(tokens)
+        body.add(self.__argparseProgramDescription(tokens))
 
-        body += self.__argparseProgramOptions(tokens)
+        body.add(self.__argparseProgramOptions(tokens))
 
-        body += self.__argparsePositionalOptions(tokens)
+        body.add(self.__argparsePositionalOptions(tokens))
 
-        body += """
+        body.add("""
     return parser
-"""
+""")
 
 
         # add usage function binding
-        body += """
+        body.add("""
 def usage(program, description=""):
     return prepareOptions(program, description).format_help()
-"""
+""")
 
         # add prepareOptions function binding
-        body += """
+        body.add("""
 def parse(program, description, argv, known=False):
-"""
+""")
         # add arguments parsing using argparse
-        body += self.__argparseParsingBegin(tokens)
+        body.add(self.__argparseParsingBegin(tokens))
 
-        body += """
+        body.add("""
     return args;
-"""
+""")
 
-        return head + body + tail
-
-    # get token by type and name
-    def __getToken(self, tokens, directive, name):
-        result = paTokenizer.ProtoToken()
-        for token in tokens:
-            if token.directive == directive and token.name == name:
-                result = token
-                break
-        return result
-
-    # get link tokens by field name
-    def __getLinks(self, tokens, name):
-        result = []
-        start = False
-        for token in tokens:
-            if token.directive == paTokenizer.pd_message and token.name == paTokenizer.pa_links:
-                start = True
-            elif start:
-                if token.directive == paTokenizer.pd_end:
-                    break
-                elif token.directive == paTokenizer.pd_field and token.value == name: # default link value should be the name of args
-                    result.append(token)
-        return result
+        return head + body.build() + tail
 
 
     def __argparseProgramDescription(self, tokens):
         code = """
     parser = argparse.ArgumentParser(description=description, prog=program)
 """
-        token = self.__getToken(tokens, paTokenizer.pd_message, paTokenizer.pa_main)
+        token = self.getToken(paTokenizer.pd_message, paTokenizer.pa_main)
         if token.valid():
-            code = code.replace("%DESCRIPTION%", token.description)
+            code = paTemplate.get(code).render(DESCRIPTION=token.description)
 
         code += "\n"
         return code
 
     def __argparsePositionalOptions(self, tokens):
         template = r'parser.add_argument(r"""%OPTIONS%""", type=%TYPE%, %NARGS% help=r"""%DESCRIPTION% {%FREQUENCY%,type:%PTYPE%}""")'
-        code = ""
+        code = paTemplate.Builder()
         positional = []
 
-        start = False
-        for token in tokens:
-            if token.directive == paTokenizer.pd_message and token.name == paTokenizer.pa_main:
-                start = True
-            elif start:
-                if token.directive == paTokenizer.pd_end:
-                    break
-                elif token.directive == paTokenizer.pd_field:
-                    isLinks = self.__getToken(tokens, paTokenizer.pd_message, paTokenizer.pa_links).valid()
-                    if isLinks:
-                        links = self.__getLinks(tokens, token.name)
-                        if len(links) == 0:
-                            positional.append(token)
+        for field in self.getFields():
+            token = field.token
+            if field.linked:
+                links = field.links
+                if len(links) == 0:
+                    positional.append(token)
 
         # add positional long args
         for token in positional:
-            logging.debug("Create positional field name: " + str(token))
-            code += "    "
-            code += template \
-                    .replace("%OPTIONS%", token.name) \
-                    .replace("%DESCRIPTION%", token.description) \
-                    .replace("%PTYPE%", token.type) \
-                    .replace("%TYPE%", self.__convertToPyType(token)) \
-                    .replace("%ARGNAME%", token.name) \
-                    .replace("%FREQUENCY%", paTokenizer.pf_required.upper()) \
-                    .replace("%NARGS%", (r'nargs="+",' if token.field == paTokenizer.pf_repeated else "") )
-
-            code += "\n"
+            log.debug("Create positional field name: %s", token)
+            code.add("    ")
+            code.render(template,
+                    OPTIONS=token.name,
+                    DESCRIPTION=token.description,
+                    PTYPE=token.type,
+                    TYPE=self.__convertToPyType(token),
+                    ARGNAME=token.name,
+                    FREQUENCY=paTokenizer.pf_required.upper(),
+                    NARGS=(r'nargs="+",' if token.field == paTokenizer.pf_repeated else ""))
 
-        return code
+            code.add("\n")
+
+        return code.build()
 
     def __argparseProgramOptions(self, tokens):
         template = r'parser.add_argument(r"""%OPTIONS%""" %TYPE%, help=r"""%DESCRIPTION% {%FREQUENCY%,type:%PTYPE%,default:"%DEFAULT%"}""", metavar=r"""%ARGNAME%""", dest=r"""%ARGNAME%""" %NARGS% %ACTIONS% %DEFAULTVAL% %CONST%)'
         templateRequired = r'parser.add_argument(r"""%OPTIONS%""" %TYPE%, required=True, help=r"""%DESCRIPTION% {%FREQUENCY%,type:%PTYPE%,default:"%DEFAULT%"}""", metavar=r"""%ARGNAME%""", dest=r"""%ARGNAME%""" %NARGS% %ACTIONS% %DEFAULTVAL% %CONST%)'
-        code = ""
+        code = paTemplate.Builder()
         positional = []
 
-        start = False
-        for token in tokens:
-            if token.directive == paTokenizer.pd_message and token.name == paTokenizer.pa_main:
-                start = True
-            elif start:
-                if token.directive == paTokenizer.pd_end:
-                    break
-                elif token.directive == paTokenizer.pd_field:
-
-                    # set template
-                    t = template
-                    if token.field == paTokenizer.pf_required:
-                        t = templateRequired
-
-                    isLinks = self.__getToken(tokens, paTokenizer.pd_message, paTokenizer.pa_links).valid()
-                    if isLinks:
-                        links = sorted(self.__getLinks(tokens, token.name), key=lambda link: link.name)
-                        if len(links) > 0:
-                            # add all links as options
-                            logging.debug("links found for: " + str(token) + "\n" + str(links))
-                            options = ""
-                            for link in links:
-                                if link.name != "h" and link.name != "help": # exclude predefined args
-                                    if options:
-                                        options += r'""",r"""'
-                                    options += self.__convertToOptName( self.__convertToArgName(link.name) ) # convert into args
-                                else:
-                                    logging.warn("'" + link.name + "' conflicts with predefined argument");
-
+        for field in self.getFields():
+            token = field.token
+
+            # set template
+            t = template
+            if token.field == paTokenizer.pf_required:
+                t = templateRequired
+
+            if field.linked:
+                links = field.sortedLinks
+                if len(links) > 0:
+                    # add all links as options
+                    log.debug("links found for: %s\n%s", token, links)
+                    options = ""
+                    for link in links:
+                        if link.name != "h" and link.name != "help": # exclude predefined args
                             if options:
-                                code += "    "
-                                code += t \
-                                        .replace("%OPTIONS%",options) \
-                                        .replace("%DESCRIPTION%",token.description) \
-                                        .replace("%PTYPE%", token.type) \
-                                        .replace("%ARGNAME%", token.name) \
-                                        .replace("%FREQUENCY%", token.field.upper()) \
-                                        .replace("%DEFAULT%", token.value) \
-                                        .replace("%TYPE%", \
-                                        (", type=" + self.__convertToPyType(token) if token.field == paTokenizer.pf_repeated or (token.value and token.value == "true") or token.type != pt_bool else "") ) \
-                                        .replace("%DEFAULTVAL%", \
-                                        (", default=" + self.__convertToDefaultValue(token) if token.value else "") ) \
-                                        .replace("%NARGS%", \
-                                        (r', nargs="?"' if token.field == paTokenizer.pf_repeated and token.type != pt_bool else "") ) \
-                                        .replace("%ACTIONS%", \
-                                        (r', action="append"' if token.field == paTokenizer.pf_repeated else \
-                                        (r', action="store_const"' if (not token.value or token.value == "false") and token.type == pt_bool else "")) ) \
-                                        .replace("%CONST%", \
-                                        (r', const=True' if token.type == pt_bool and (not token.value or token.value == "false") and token.field != paTokenizer.pf_repeated else "") ) \
-
-                                code += "\n"
-                        else:
-                            logging.debug("positional arg found: " + str(token))
-                            positional.append(token)
-                    else:
-                        if token.name != "h" and token.name != "help": # exclude predefined args
-                            logging.debug("convert main protoargs field name into long arg name: " + str(token))
-                            code += "    "
-                            code += t \
-                                    .replace("%OPTIONS%", self.__convertToOptName( self.__convertToArgName(token.name)) ) \
-                                    .replace("%DESCRIPTION%",token.description) \
-                                    .replace("%PTYPE%", token.type) \
-                                    .replace("%ARGNAME%", token.name) \
-                                    .replace("%FREQUENCY%", token.field.upper()) \
-                                    .replace("%DEFAULT%", token.value) \
-                                    .replace("%TYPE%", \
-                                    (", type=" + self.__convertToPyType(token) if token.field == paTokenizer.pf_repeated or (token.value  and token.value == "true") or token.type != pt_bool else "") ) \
-                                    .replace("%DEFAULTVAL%", \
-                                    (", default=" + self.__convertToDefaultValue(token) if token.value else "") ) \
-                                    .replace("%NARGS%", \
-                                    (r', nargs="?"' if token.field == paTokenizer.pf_repeated and token.type != pt_bool else "") ) \
-                                    .replace("%ACTIONS%", \
-                                    (r', action="append"' if token.field == paTokenizer.pf_repeated else \
-                                    (r', action="store_const"' if (not token.value or token.value == "false") and token.type == pt_bool else "")) ) \
-                                    .replace("%CONST%", \
-                                    (r', const=True' if token.type == pt_bool and (not token.value or token.value == "false") and token.field != paTokenizer.pf_repeated else "") ) \
-
-                            code += "\n"
+                                options += r'""",r"""'
+                            options += self.convertToOptName( self.convertToArgName(link.name) ) # convert into args
                         else:
-                            logging.warn("'" + token.name + "' conflicts with predefined argument");
+                            log.warning("'" + link.name + "' conflicts with predefined argument");
+
+                    if options:
+                        code.add("    ")
+                        code.render(t,
+                                OPTIONS=options,
+                                DESCRIPTION=token.description,
+                                PTYPE=token.type,
+                                ARGNAME=token.name,
+                                FREQUENCY=token.field.upper(),
+                                DEFAULT=token.value,
+                                TYPE=(", type=" + self.__convertToPyType(token) if token.field == paTokenizer.pf_repeated or (token.value and token.value == "true") or token.type != pt_bool else ""),
+                                DEFAULTVAL=(", default=" + self.__convertToDefaultValue(token) if token.value else ""),
+                                NARGS=(r', nargs="?"' if token.field == paTokenizer.pf_repeated and token.type != pt_bool else ""),
+                                ACTIONS=(r', action="append"' if token.field == paTokenizer.pf_repeated else \
+                                (r', action="store_const"' if (not token.value or token.value == "false") and token.type == pt_bool else "")),
+                                CONST=(r', const=True' if token.type == pt_bool and (not token.value or token.value == "false") and token.field != paTokenizer.pf_repeated else ""))
+
+                        code.add("\n")
+                else:
+                    log.debug("positional arg found: %s", token)
+                    positional.append(token)
+            else:
+                if token.name != "h" and token.name != "help": # exclude predefined args
+                    log.debug("convert main protoargs field name into long arg name: %s", token)
+                    code.add("    ")
+                    code.render(t,
+                            OPTIONS=self.convertToOptName( self.convertToArgName(token.name)),
+                            DESCRIPTION=token.description,
+                            PTYPE=token.type,
+                            ARGNAME=token.name,
+                            FREQUENCY=token.field.upper(),
+                            DEFAULT=token.value,
+                            TYPE=(", type=" + self.__convertToPyType(token) if token.field == paTokenizer.pf_repeated or (token.value  and token.value == "true") or token.type != pt_bool else ""),
+                            DEFAULTVAL=(", default=" + self.__convertToDefaultValue(token) if token.value else ""),
+                            NARGS=(r', nargs="?"' if token.field == paTokenizer.pf_repeated and token.type != pt_bool else ""),
+                            ACTIONS=(r', action="append"' if token.field == paTokenizer.pf_repeated else \
+                            (r', action="store_const"' if (not token.value or token.value == "false") and token.type == pt_bool else "")),
+                            CONST=(r', const=True' if token.type == pt_bool and (not token.value or token.value == "false") and token.field != paTokenizer.pf_repeated else ""))
+
+                    code.add("\n")
                 else:
-                    logging.warn("unknown token inside protoargs structure: " + str(token))
+                    log.warning("'" + token.name + "' conflicts with predefined argument");
 
-        code += "\n"
-        return code
+        code.add("\n")
+        return code.build()
 
     def __argparseParsingBegin(self, tokens):
-        code = """
+        code = paTemplate.Builder("""
     parser = prepareOptions(program, description)
-"""
+""")
         # add argparse parsing
-        code += """
+        code.add("""
     args = None
     if known:
         args, _ = parser.parse_known_args(argv)
     else:
         args = parser.parse_args(argv)
-"""
-        return code
+""")
+        return code.build()
 
@@ -1,6 +1,10 @@
 import os
-import logging
+import paLogger
 import paTokenizer
+import paTemplate
+import paGenerator
+
+log = paLogger.log
 
 
 # GLOBAL DEFS ###################################3
@@ -25,17 +29,28 @@ rust_uint64 = "u64"
 rust_bool = "bool"
 rust_string = "String"
 
+# rust types by protobuf types
+rust_types = {
+    pt_float: rust_float,
+    pt_double: rust_double,
+    pt_int32: rust_int32,
+    pt_uint32: rust_uint32,
+    pt_int64: rust_int64,
+    pt_uint64: rust_uint64,
+    pt_bool: rust_bool,
+    pt_string: rust_string,
+}
+
 # END GLOBALS ###################################3
 
-class Generator:
+class Generator(paGenerator.BaseGenerator):
 
-    __path = "" # path to proto file
     __rustPath = "" # path to source file
     __mod = "" # rust module name
     __rust = "" # source file content
 
-    def __init__(self, path, dst):
-        self.__path = path
+    def __init__(self, path, dst, schema=None):
+        paGenerator.BaseGenerator.__init__(self, path, schema)
         filename = os.path.splitext( os.path.basename(path) )[0]
         base = os.path.join(dst, filename)
         self.__rustPath = base + "_pa.rs"
@@ -47,97 +62,18 @@ class Generator:
     def getSourceFilePath(self):
         return self.__rustPath
 
-    # load file entirely
-    def loadFileData(self, path):
-        logging.info("Load file: '" + path + "'")
-        try:
-            with open(path, "r") as index:
-                lines = index.readlines()
-                index.close()
-                return lines
-        except:
-            logging.error("Could not read file '" + path + "' because of error")
-            return ""
-
-    def __saveFileData(self, path, data):
-        logging.info("Save file: '" + path + "'")
-        try:
-            with open(path, "w") as index:
-                index.write(data)
-                index.close()
-                return True;
-        except:
-            logging.error(" Could not write to file '" + path + "' because of error")
-            return False;
-
-    # parse proto file and generate rust files
-    def generate(self):
-        #load proto file
-        data = self.loadFileData(self.__path)
-        result = len(data) != 0
-        if result:
-            # tokenize proto file data
-            tokenizer = paTokenizer.Tokenizer() \
-                    .tokenize(data) \
-                    .excludeUnused() \
-
-            result = tokenizer.check() # check tokens
-            if result:
-                tokens = tokenizer.getTokens()
-
-                # DBG
-                for token in tokens:
-                    logging.debug(str(token))
-
-                # generate souce code
-                self.__rust = self.__generateSourceFromTokens(tokens)
-
-                # save code to files
-                self.__saveFileData( self.getSourceFilePath(), self.__rust )
-
-        return data
+    # generate rust files
+    def render(self, tokens):
+        self.__rust = self.__generateSourceFromTokens(tokens)
+        return [(self.getSourceFilePath(), self.__rust)]
 
     # convert protobuf config names into c code names
     def __convertToRustName(self, name):
         return name.lower()
 
-    # convert protobuf config names into args
-    def __convertToArgName(self, name):
-        return name.replace("_","-")
-
-    # convert argument to option
-    def __convertToOptName(self, name):
-        if len(name) == 1:
-            return "-" + name
-        elif len(name) > 1:
-            return "--" + name
-        else:
-            return name
-
     # convert protobuf config types into rust types
     def __convertToRustType(self, token):
-        pyType = token.type # if missing use original
-
-        # get correct type
-        protoType = token.type
-        if protoType == pt_int32:
-            pyType = rust_int32
-        if protoType == pt_uint32:
-            pyType = rust_uint32
-        if protoType == pt_int64:
-            pyType = rust_int64
-        if protoType == pt_uint64:
-            pyType = rust_uint64
-        if protoType == pt_bool:
-            pyType = rust_bool
-        if protoType == pt_string:
-            pyType = rust_string
-        if protoType == pt_float:
-            pyType = rust_float
-        if protoType == pt_double:
-            pyType = rust_double
-
-        return pyType
+        return self.convertToType(token, rust_types)
 
     def __convertToDefaultValue(self, token):
         if not token.value:
@@ -153,35 +89,35 @@ extern crate clap;
         head += "pub mod " + self.__mod + " {\n";
 
         tail = "\n}"
-        body = ""
+        body = paTemplate.Builder()
 
         # add configuration structure to store typed values
-        body += """
+        body.add("""
 /// Configuration structure to hold all parsed arguments as strong typed entities
 #[derive(Default)]
 pub struct Config {
-"""
+""")
         # register fields
-        body += self.__clapStructureFields(tokens)
+        body.add(self.__clapStructureFields(tokens))
 
-        body += """
+        body.add("""
 }
-"""
+""")
 
         # add configuration structure implementation
-        body += """
+        body.add("""
 impl Config {
-"""
+""")
         # register fields
-        body += self.__clapStructureImpl(tokens)
+        body.add(self.__clapStructureImpl(tokens))
 
-        body += """
+        body.add("""
 }
-"""
+""")
 
 
         # add prepare_options function binding
-        body += """
+        body.add("""
 /// Options preparation
 ///
 /// # Arguments
@@ -208,21 +144,21 @@ pub fn prepare_options<'a>(program: &'a str, description: &'a str) -> clap::Comm
 /// returns Command instance ready to do parsing
 #[allow(dead_code)]
 pub fn prepare_options_ext<'a>(command: clap::Command<'a>) -> clap::Command<'a> {
-"""
+""")
         # register arguments
-        body += self.__clapProgramDescription(tokens)
+        body.add(self.__clapProgramDescription(tokens))
 
-        body += self.__clapProgramOptions(tokens)
+        body.add(self.__clapProgramOptions(tokens))
 
-        body += self.__clapPositionalOptions(tokens)
+        body.add(self.__clapPositionalOptions(tokens))
 
-        body += """               ;
+        body.add("""               ;
 }
-"""
+""")
 
 
         # add usage function binding
-        body += """
+        body.add("""
 /// Get usage string
 ///
 /// # Arguments
@@ -235,10 +171,10 @@ pub fn prepare_options_ext<'a>(command: clap::Command<'a>) -> clap::Command<'a>
 pub fn usage(program: &str, description: &str) -> String {
     prepare_options(program, description).render_usage()
 }
-"""
+""")
 
         # add parsing functions
-        body += """
+        body.add("""
 /// Parse command line arguments, and return filled configuration
 /// Simple and straight forward, thus recommended
 ///
@@ -346,79 +282,49 @@ pub fn parse_command(args: &[&str], command: clap::Command, allow_incomplete: bo
 pub fn parse_matches(matches: &clap::ArgMatches, allow_incomplete: bool) -> Result<Config, String> {
     let mut config = Config { ..Default::default() };
 
-"""
+""")
 
         # register fields
-        body += self.__clapStructureFill(tokens)
+        body.add(self.__clapStructureFill(tokens))
 
-        body += """
+        body.add("""
     Ok(config)
 }
-"""
+""")
 
-        return head + body + tail
-
-    # get token by type and name
-    def __getToken(self, tokens, directive, name):
-        result = paTokenizer.ProtoToken()
-        for token in tokens:
-            if token.directive == directive and token.name == name:
-                result = token
-                break
-        return result
-
-    # get link tokens by field name
-    def __getLinks(self, tokens, name):
-        result = []
-        start = False
-        for token in tokens:
-            if token.directive == paTokenizer.pd_message and token.name == paTokenizer.pa_links:
-                start = True
-            elif start:
-                if token.directive == paTokenizer.pd_end:
-                    break
-                elif token.directive == paTokenizer.pd_field and token.value == name: # default link value should be the name of args
-                    result.append(token)
-        return result
+        return head + body.build() + tail
 
     def __clapStructureFields(self, tokens):
         template = """    /// %DESCRIPTION%
     %NAME%: %TYPE%,\n"""
-        code = ""
-
-        start = False
-        for token in tokens:
-            if token.directive == paTokenizer.pd_message and token.name == paTokenizer.pa_main:
-                start = True
-            elif start:
-                if token.directive == paTokenizer.pd_end:
-                    break
-                elif token.directive == paTokenizer.pd_field:
-                    append = True
-                    isLinks = self.__getToken(tokens, paTokenizer.pd_message, paTokenizer.pa_links).valid()
-                    if isLinks:
-                        links = sorted(self.__getLinks(tokens, token.name), key=lambda link: link.name)
-                        for link in links:
-                            if link.name == "h" or link.name == "help": # exclude predefined args
-                                append = False
-                                break
-
-                    if append:
-                        logging.debug("Create struct field name: " + str(token))
-                        rustType = self.__convertToRustType(token)
-                        if token.field == paTokenizer.pf_repeated:
-                            rustType = "Vec<" + rustType + ">"
-                        elif token.field == paTokenizer.pf_optional:
-                            rustType = "Option<" + rustType + ">"
-                        elif token.field == paTokenizer.pf_required:
-                            rustType = "Option<" + rustType + ">"
-
-                        code += template \
-                                .replace("%NAME%", self.__convertToRustName(token.name)) \
-                                .replace("%TYPE%", rustType) \
-                                .replace("%DESCRIPTION%", token.description)
-
-        return code
+        code = paTemplate.Builder()
+
+        for field in self.getFields():
+            token = field.token
+            append = True
+            if field.linked:
+                links = field.sortedLinks
+                for link in links:
+                    if link.name == "h" or link.name == "help": # exclude predefined args
+                        append = False
+                        break
+
+            if append:
+                log.debug("Create struct field name: %s", token)
+                rustType = self.__convertToRustType(token)
+                if token.field == paTokenizer.pf_repeated:
+                    rustType = "Vec<" + rustType + ">"
+                elif token.field == paTokenizer.pf_optional:
+                    rustType = "Option<" + rustType + ">"
+                elif token.field == paTokenizer.pf_required:
+                    rustType = "Option<" + rustType + ">"
+
+                code.render(template,
+                        NAME=self.__convertToRustName(token.name),
+                        TYPE=rustType,
+                        DESCRIPTION=token.description)
+
+        return code.build()
 
     def __clapStructureImpl(self, tokens):
         templateOptional = r"""
@@ -469,48 +375,41 @@ pub fn parse_matches(matches: &clap::ArgMatches, allow_incomplete: bool) -> Resu
     }
 """
 
-        code = ""
-
-        start = False
-        for token in tokens:
-            if token.directive == paTokenizer.pd_message and token.name == paTokenizer.pa_main:
-                start = True
-            elif start:
-                if token.directive == paTokenizer.pd_end:
-                    break
-                elif token.directive == paTokenizer.pd_field:
-                    append = True
-                    isLinks = self.__getToken(tokens, paTokenizer.pd_message, paTokenizer.pa_links).valid()
-                    if isLinks:
-                        links = sorted(self.__getLinks(tokens, token.name), key=lambda link: link.name)
-                        for link in links:
-                            if link.name == "h" or link.name == "help": # exclude predefined args
-                                append = False
-                                break
-
-                    if append:
-                        logging.debug("Fill struct field name: " + str(token))
-                        rustType = self.__convertToRustType(token)
-
-                        template = templateOptional
-                        if token.field == paTokenizer.pf_repeated:
-                            template = templateRepeated
-                        elif token.field == paTokenizer.pf_required:
-                            template = templateRequired;
-
-                        default = token.value
-                        if (token.type == pt_string):
-                            default = "\"" + token.value + "\".to_string()"
-                        elif (template == templateOptional and len(token.value) == 0):
-                            template = templateOptionalNoDefault
-
-                        code += template \
-                                .replace("%NAME%", self.__convertToRustName(token.name)) \
-                                .replace("%DEFAULT%", default) \
-                                .replace("%OPTION%", self.__convertToArgName(token.name)) \
-                                .replace("%TYPE%", rustType)
+        code = paTemplate.Builder()
 
-        return code
+        for field in self.getFields():
+            token = field.token
+            append = True
+            if field.linked:
+                links = field.sortedLinks
+                for link in links:
+                    if link.name == "h" or link.name == "help": # exclude predefined args
+                        append = False
+                        break
+
+            if append:
+                log.debug("Fill struct field name: %s", token)
+                rustType = self.__convertToRustType(token)
+
+                template = templateOptional
+                if token.field == paTokenizer.pf_repeated:
+                    template = templateRepeated
+                elif token.field == paTokenizer.pf_required:
+                    template = templateRequired;
+
+                default = token.value
+                if (token.type == pt_string):
+                    default = "\"" + token.value + "\".to_string()"
+                elif (template == templateOptional and len(token.value) == 0):
+                    template = templateOptionalNoDefault
+
+                code.render(template,
+                        NAME=self.__convertToRustName(token.name),
+                        DEFAULT=default,
+                        OPTION=self.convertToArgName(token.name),
+                        TYPE=rustType)
+
+        return code.build()
 
 
     def __clapStructureFill(self, tokens):
@@ -586,50 +485,43 @@ pub fn parse_matches(matches: &clap::ArgMatches, allow_incomplete: bool) -> Resu
     }
 
 """
-        code = ""
-
-        start = False
-        for token in tokens:
-            if token.directive == paTokenizer.pd_message and token.name == paTokenizer.pa_main:
-                start = True
-            elif start:
-                if token.directive == paTokenizer.pd_end:
-                    break
-                elif token.directive == paTokenizer.pd_field:
-                    append = True
-                    positional = False
-                    isLinks = self.__getToken(tokens, paTokenizer.pd_message, paTokenizer.pa_links).valid()
-                    if isLinks:
-                        links = sorted(self.__getLinks(tokens, token.name), key=lambda link: link.name)
-                        if len(links) == 0:
-                            positional = True
-                        for link in links:
-                            if link.name == "h" or link.name == "help": # exclude predefined args
-                                append = False
-                                break
-
-                    if append:
-                        logging.debug("Fill struct field name: " + str(token))
-                        rustType = self.__convertToRustType(token)
-
-                        template = templateOptional
-                        if positional and token.field == paTokenizer.pf_repeated:
-                            template = templateRepeatedPositional
-                        elif token.field == paTokenizer.pf_repeated:
-                            template = templateRepeated
-                        elif token.type == pt_bool and token.field == paTokenizer.pf_optional:
-                            template = templateBoolOptional
-                        elif token.type == pt_bool and token.field == paTokenizer.pf_required:
-                            template = templateBoolRequired
-                        elif token.field == paTokenizer.pf_required:
-                            template = templateRequired
-
-                        code += template \
-                                .replace("%NAME%", self.__convertToRustName(token.name)) \
-                                .replace("%OPTION%", self.__convertToArgName(token.name)) \
-                                .replace("%TYPE%", rustType)
-
-        return code
+        code = paTemplate.Builder()
+
+        for field in self.getFields():
+            token = field.token
+            append = True
+            positional = False
+            if field.linked:
+                links = field.sortedLinks
+                if len(links) == 0:
+                    positional = True
+                for link in links:
+                    if link.name == "h" or link.name == "help": # exclude predefined args
+                        append = False
+                        break
+
+            if append:
+                log.debug("Fill struct field name: %s", token)
+                rustType = self.__convertToRustType(token)
+
+                template = templateOptional
+                if positional and token.field == paTokenizer.pf_repeated:
+                    template = templateRepeatedPositional
+                elif token.field == paTokenizer.pf_repeated:
+                    template = templateRepeated
+                elif token.type == pt_bool and token.field == paTokenizer.pf_optional:
+                    template = templateBoolOptional
+                elif token.type == pt_bool and token.field == paTokenizer.pf_required:
+                    template = templateBoolRequired
+                elif token.field == paTokenizer.pf_required:
+                    template = templateRequired
+
+                code.render(template,
+                        NAME=self.__convertToRustName(token.name),
+                        OPTION=self.convertToArgName(token.name),
+                        TYPE=rustType)
+
+        return code.build()
 
 
 
@@ -637,9 +529,9 @@ pub fn parse_matches(matches: &clap::ArgMatches, allow_incomplete: bool) -> Resu
         code = """
     return command
 """
-        token = self.__getToken(tokens, paTokenizer.pd_message, paTokenizer.pa_main)
+        token = self.getToken(paTokenizer.pd_message, paTokenizer.pa_main)
         if token.valid():
-            code = code.replace("%DESCRIPTION%", token.description)
+            code = paTemplate.get(code).render(DESCRIPTION=token.description)
 
         code += "\n"
         return code
@@ -652,43 +544,35 @@ pub fn parse_matches(matches: &clap::ArgMatches, allow_incomplete: bool) -> Resu
            .index(%INDEX%)
            .multiple_occurrences(%REPEATED%))
 """
-        code = ""
+        code = paTemplate.Builder()
         positional = []
 
-        start = False
-        for token in tokens:
-            if token.directive == paTokenizer.pd_message and token.name == paTokenizer.pa_main:
-                start = True
-            elif start:
-                if token.directive == paTokenizer.pd_end:
-                    break
-                elif token.directive == paTokenizer.pd_field:
-                    isLinks = self.__getToken(tokens, paTokenizer.pd_message, paTokenizer.pa_links).valid()
-                    if isLinks:
-                        links = self.__getLinks(tokens, token.name)
-                        if len(links) == 0:
-                            positional.append(token)
+        for field in self.getFields():
+            token = field.token
+            if field.linked:
+                links = field.links
+                if len(links) == 0:
+                    positional.append(token)
 
         # add positional long args
         index = 1;
         for token in positional:
-            logging.debug("Create positional field name: " + str(token))
-            code += template \
-                    .replace("%OPTIONS%", self.__convertToArgName(token.name)) \
-                    .replace("%DESCRIPTION%", token.description) \
-                    .replace("%PTYPE%", token.type) \
-                    .replace("%TYPE%", self.__convertToRustType(token)) \
-                    .replace("%ARGNAME%", token.name) \
-                    .replace("%FREQUENCY%", paTokenizer.pf_required.upper()) \
-                    .replace("%NARGS%", (r'nargs="+",' if token.field == paTokenizer.pf_repeated else "") ) \
-                    .replace("%INDEX%", str(index)) \
-                    .replace("%REPEATED%", \
-                    ("true" if token.field == paTokenizer.pf_repeated else "false") )
-
-            code += "\n"
+            log.debug("Create positional field name: %s", token)
+            code.render(template,
+                    OPTIONS=self.convertToArgName(token.name),
+                    DESCRIPTION=token.description,
+                    PTYPE=token.type,
+                    TYPE=self.__convertToRustType(token),
+                    ARGNAME=token.name,
+                    FREQUENCY=paTokenizer.pf_required.upper(),
+                    NARGS=(r'nargs="+",' if token.field == paTokenizer.pf_repeated else ""),
+                    INDEX=str(index),
+                    REPEATED=("true" if token.field == paTokenizer.pf_repeated else "false"))
+
+            code.add("\n")
             index += 1
 
-        return code
+        return code.build()
 
     def __clapProgramOptions(self, tokens):
         template = r"""
@@ -698,88 +582,71 @@ pub fn parse_matches(matches: &clap::ArgMatches, allow_incomplete: bool) -> Resu
                    .required(%REQUIRED%)
                    .multiple_occurrences(%REPEATED%)"""
 
-        code = ""
+        code = paTemplate.Builder()
         positional = []
 
-        start = False
-        for token in tokens:
-            if token.directive == paTokenizer.pd_message and token.name == paTokenizer.pa_main:
-                start = True
-            elif start:
-                if token.directive == paTokenizer.pd_end:
-                    break
-                elif token.directive == paTokenizer.pd_field:
-
-                    # set template
-                    t = template
-
-                    isLinks = self.__getToken(tokens, paTokenizer.pd_message, paTokenizer.pa_links).valid()
-                    if isLinks:
-                        links = sorted(self.__getLinks(tokens, token.name), key=lambda link: link.name)
-                        if len(links) > 0:
-                            # add all links as options
-                            logging.debug("links found for: " + str(token) + "\n" + str(links))
-                            options = ""
-                            for link in links:
-                                if link.name != "h" and link.name != "help": # exclude predefined args
-                                    if len(link.name) == 1:
-                                        options += "\n                   .short('" + self.__convertToArgName(link.name) + "')" # convert into args
-                                    else:
-                                        options += "\n                   .long(r#\"" + self.__convertToArgName(link.name) + "\"#)" # convert into args
-                                else:
-                                    logging.warn("'" + link.name + "' conflicts with predefined argument");
-
-                            if options:
-                                code += t \
-                                        .replace("%OPTIONS%", self.__convertToArgName(token.name)) \
-                                        .replace("%DESCRIPTION%",token.description) \
-                                        .replace("%PTYPE%", token.type) \
-                                        .replace("%ARGNAME%", token.name) \
-                                        .replace("%FREQUENCY%", token.field.upper()) \
-                                        .replace("%DEFAULT%", token.value) \
-                                        .replace("%TYPE%", \
-                                        (", type=" + self.__convertToRustType(token) if token.type != pt_bool else "") ) \
-                                        .replace("%REQUIRED%", \
-                                        ("true" if token.field == paTokenizer.pf_required else "false") ) \
-                                        .replace("%REPEATED%", \
-                                        ("true" if token.field == paTokenizer.pf_repeated else "false") ) \
-                                        .replace("%WITHVALUE%", \
-                                        ("true" if token.type != pt_bool else "false") ) \
-
-                                code += options
-                                code += ")\n"
+        for field in self.getFields():
+            token = field.token
+
+            # set template
+            t = template
+
+            if field.linked:
+                links = field.sortedLinks
+                if len(links) > 0:
+                    # add all links as options
+                    log.debug("links found for: %s\n%s", token, links)
+                    options = ""
+                    for link in links:
+                        if link.name != "h" and link.name != "help": # exclude predefined args
+                            if len(link.name) == 1:
+                                options += "\n                   .short('" + self.convertToArgName(link.name) + "')" # convert into args
+                            else:
+                                options += "\n                   .long(r#\"" + self.convertToArgName(link.name) + "\"#)" # convert into args
                         else:
-                            logging.debug("positional arg found: " + str(token))
-                            positional.append(token)
+                            log.warning("'" + link.name + "' conflicts with predefined argument");
+
+                    if options:
+                        code.render(t,
+                                OPTIONS=self.convertToArgName(token.name),
+                                DESCRIPTION=token.description,
+                                PTYPE=token.type,
+                                ARGNAME=token.name,
+                                FREQUENCY=token.field.upper(),
+                                DEFAULT=token.value,
+                                TYPE=(", type=" + self.__convertToRustType(token) if token.type != pt_bool else ""),
+                                REQUIRED=("true" if token.field == paTokenizer.pf_required else "false"),
+                                REPEATED=("true" if token.field == paTokenizer.pf_repeated else "false"),
+                                WITHVALUE=("true" if token.type != pt_bool else "false"))
+
+                        code.add(options)
+                        code.add(")\n")
+                else:
+                    log.debug("positional arg found: %s", token)
+                    positional.append(token)
+            else:
+                if token.name != "h" and token.name != "help": # exclude predefined args
+                    log.debug("convert main protoargs field name into long arg name: %s", token)
+                    code.render(t,
+                            OPTIONS=self.convertToArgName(token.name),
+                            DESCRIPTION=token.description,
+                            PTYPE=token.type,
+                            ARGNAME=token.name,
+                            FREQUENCY=token.field.upper(),
+                            DEFAULT=token.value,
+                            TYPE=(", type=" + self.__convertToRustType(token) if token.type != pt_bool else ""),
+                            REQUIRED=("true" if token.field == paTokenizer.pf_required else "false"),
+                            REPEATED=("true" if token.field == paTokenizer.pf_repeated else "false"),
+                            WITHVALUE=("true" if token.type != pt_bool or token.field == paTokenizer.pf_repeated else "false"))
+
+                    if len(token.name) == 1:
+                        code.add("\n                   .short('" + self.convertToArgName(token.name) + "')") # convert into args
                     else:
-                        if token.name != "h" and token.name != "help": # exclude predefined args
-                            logging.debug("convert main protoargs field name into long arg name: " + str(token))
-                            code += t \
-                                    .replace("%OPTIONS%", self.__convertToArgName(token.name) ) \
-                                    .replace("%DESCRIPTION%",token.description) \
-                                    .replace("%PTYPE%", token.type) \
-                                    .replace("%ARGNAME%", token.name) \
-                                    .replace("%FREQUENCY%", token.field.upper()) \
-                                    .replace("%DEFAULT%", token.value) \
-                                    .replace("%TYPE%", \
-                                    (", type=" + self.__convertToRustType(token) if token.type != pt_bool else "") ) \
-                                    .replace("%REQUIRED%", \
-                                    ("true" if token.field == paTokenizer.pf_required else "false") ) \
-                                    .replace("%REPEATED%", \
-                                    ("true" if token.field == paTokenizer.pf_repeated else "false") ) \
-                                    .replace("%WITHVALUE%", \
-                                    ("true" if token.type != pt_bool or token.field == paTokenizer.pf_repeated else "false") ) \
-
-                            if len(token.name) == 1:
-                                code += "\n                   .short('" + self.__convertToArgName(token.name) + "')" # convert into args
-                            else:
-                                code += "\n                   .long(r#\"" + self.__convertToArgName(token.name) + "\"#)" # convert into args
+                        code.add("\n                   .long(r#\"" + self.convertToArgName(token.name) + "\"#)") # convert into args
 
-                            code += ")\n"
-                        else:
-                            logging.warn("'" + token.name + "' conflicts with predefined argument");
+                    code.add(")\n")
                 else:
-                    logging.warn("unknown token inside protoargs structure: " + str(token))
+                    log.warning("'" + token.name + "' conflicts with predefined argument");
 
-        return code
+        return code.build()
 
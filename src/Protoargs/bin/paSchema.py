@@ -0,0 +1,219 @@
+import sys
+import mmap
+import logging
+import paLogger
+import paTokenizer
+import paTimings
+
+log = paLogger.log
+
+
+# map opened file into memory, empty file, pipe or fifo can not be mapped
+def mapFile(index):
+    try:
+        return mmap.mmap(index.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, EnvironmentError):
+        return None
+
+# iterate over lines of memory mapped file, file is never read entirely
+def mapLines(data):
+    if data is None:
+        return
+    if sys.version_info[0] >= 3:
+        for line in iter(data.readline, b""):
+            yield line.decode("utf-8")
+    else:
+        for line in iter(data.readline, b""):
+            yield line
+
+# iterate over lines of opened file, which could not be mapped, e.g. pipe or fifo
+def readLines(index):
+    if sys.version_info[0] >= 3:
+        for line in index:
+            yield line.decode("utf-8")
+    else:
+        for line in index:
+            yield line
+
+
+# protoargs configuration field, classified once per schema and shared by all generators
+class Field(object):
+    __slots__ = ("token", "linked", "links", "sortedLinks", "positional")
+
+    def __init__(self, token, linked, links):
+        self.token = token # field token of protoargs message
+        self.linked = linked # true if protoargs_links message exists
+        self.links = links # link tokens in schema order
+        self.sortedLinks = sorted(links, key=lambda link: link.name) # link tokens ordered by name
+        self.positional = linked and not links # field without links is positional argument
+
+
+class SymbolTable:
+
+    def __init__(self, tokens):
+        self.__tokens = tokens
+        self.__messages = {} # message name -> message token
+        self.__ranges = {} # message name -> [start, end) range of message body tokens
+        self.__links = {} # link target -> link tokens
+        self.__fields = [] # classified fields of protoargs message
+
+        # find message bodies, nested message ends together with outer one
+        opened = []
+        for index, token in enumerate(tokens):
+            if token.directive == paTokenizer.pd_message:
+                if token.name not in self.__messages: # first message wins
+                    self.__messages[token.name] = token
+                    self.__ranges[token.name] = [index + 1, len(tokens)]
+                    opened.append(token.name)
+            elif token.directive == paTokenizer.pd_end:
+                for name in opened:
+                    self.__ranges[name][1] = index
+                opened = []
+
+        # group links by configuration field they point to
+        for token in self.getMessage(paTokenizer.pa_links):
+            if token.directive == paTokenizer.pd_field: # default link value should be the name of args
+                self.__links.setdefault(token.value, []).append(token)
+
+        # classify configuration fields
+        linked = paTokenizer.pa_links in self.__messages
+        for token in self.getMessage(paTokenizer.pa_main):
+            if token.directive == paTokenizer.pd_field:
+                self.__fields.append(Field(token, linked, self.getLinks(token.name)))
+            else:
+                log.warning("unknown token inside protoargs structure: %s", token)
+
+    # get token by type and name
+    def getToken(self, directive, name):
+        if directive == paTokenizer.pd_message:
+            return self.__messages.get(name, paTokenizer.ProtoToken())
+        for token in self.__tokens:
+            if token.directive == directive and token.name == name:
+                return token
+        return paTokenizer.ProtoToken()
+
+    # get message body tokens by message name
+    def getMessage(self, name):
+        if name not in self.__ranges:
+            return []
+        start, end = self.__ranges[name]
+        return self.__tokens[start:end]
+
+    # get link tokens by field name
+    def getLinks(self, name):
+        return list(self.__links.get(name, []))
+
+    # get classified fields of protoargs message in schema order
+    def getFields(self):
+        return self.__fields
+
+
+class Schema:
+
+    __path = "" # path to proto file
+    __tokens = [] # tokens left after analysis
+    __symbols = None # index over tokens
+    __valid = False # true if protoargs configuration was found
+    __cache = None # cache of analysed schemas, optional
+    __timings = {} # phase -> seconds spent analysing proto file
+
+    def __init__(self, path, cache=None):
+        self.__path = path
+        self.__cache = cache
+        self.__timings = {}
+
+    # tokens are pickled as plain tuples and index is rebuilt on load,
+    # schemas are sent to worker processes for every generated parser
+    def __getstate__(self):
+        return (self.__path, self.__valid, self.__cache, self.__timings,
+                [(token.directive, token.field, token.type, token.name,
+                    token.position, token.value, token.description) for token in self.__tokens])
+
+    def __setstate__(self, state):
+        self.__path, self.__valid, self.__cache, self.__timings, tokens = state
+        self.__tokens = [paTokenizer.ProtoToken(*fields) for fields in tokens]
+        self.__symbols = None
+        if self.__valid:
+            self.__symbols = SymbolTable(self.__tokens)
+
+    def getPath(self):
+        return self.__path
+
+    def getTokens(self):
+        return self.__tokens
+
+    def getSymbols(self):
+        return self.__symbols
+
+    def valid(self):
+        return self.__valid
+
+    # wall time of analysis phases, phases not run are missing
+    def getTimings(self):
+        return self.__timings
+
+    # load and tokenize proto file, result is shared between all generators,
+    # any iterable over proto lines may be analysed instead of file
+    def analyse(self, lines=None):
+        self.__tokens = []
+        self.__symbols = None
+        self.__valid = False
+        stopwatch = paTimings.Stopwatch()
+        self.__timings = stopwatch.getPhases()
+        if lines is None:
+            log.info("Load file: '" + self.__path + "'")
+            try:
+                with open(self.__path, "rb") as index:
+                    data = mapFile(index)
+                    try:
+                        if data is None:
+                            # streamed input has no content to hash, so cache is not used
+                            stopwatch.lap("load")
+                            return self.__analyse(readLines(index), stopwatch)
+                        if self.__cache is not None:
+                            return self.__analyseCached(data, stopwatch)
+                        stopwatch.lap("load") # lines are read while tokenized
+                        return self.__analyse(mapLines(data), stopwatch)
+                    finally:
+                        if data is not None:
+                            data.close()
+            except (IOError, OSError, UnicodeDecodeError):
+                log.error("Could not read file '" + self.__path + "' because of error")
+                return self
+        return self.__analyse(lines, stopwatch)
+
+    # unchanged proto file is not tokenized again, its tokens are taken from cache
+    def __analyseCached(self, data, stopwatch):
+        key = self.__cache.key(data)
+        tokens = self.__cache.load(key)
+        stopwatch.lap("load")
+        if tokens is None:
+            self.__analyse(mapLines(data), stopwatch)
+            if self.__valid: # only valid schemas are stored
+                self.__cache.store(key, self.__tokens)
+        else:
+            self.__valid = True
+            self.__tokens = tokens
+            self.__symbols = SymbolTable(self.__tokens)
+            stopwatch.lap("check")
+        return self
+
+    def __analyse(self, lines, stopwatch):
+        # tokenize proto lines while they are read
+        tokenizer = paTokenizer.Tokenizer().tokenize(lines)
+        stopwatch.lap("tokenize")
+        tokenizer.excludeUnused()
+        stopwatch.lap("excludeUnused")
+
+        self.__valid = tokenizer.check() # check tokens
+        if self.__valid:
+            self.__tokens = tokenizer.getTokens()
+            self.__symbols = SymbolTable(self.__tokens)
+
+            # DBG, tokens are not even iterated unless they are logged
+            if log.isEnabledFor(logging.DEBUG):
+                for token in self.__tokens:
+                    log.debug("%s", token)
+
+        stopwatch.lap("check") # symbol table is built as part of check
+        return self
@@ -0,0 +1,65 @@
+import re
+
+# slot is a name between percent signs, e.g. %NAME%
+re_slot = re.compile(r"%([A-Za-z_][A-Za-z0-9_]*)%")
+
+
+class Template:
+
+    __parts = [] # literals at even indexes, slots at odd ones
+    __slots = [] # (index, name) of every slot
+
+    # split template text into literals and slots once
+    def __init__(self, text):
+        self.__parts = re_slot.split(text)
+        self.__slots = []
+        for index in range(1, len(self.__parts), 2):
+            name = self.__parts[index]
+            self.__parts[index] = "%" + name + "%" # slot without value stays as is
+            self.__slots.append((index, name))
+
+    # fill slots with values in a single pass, values are never searched for slots
+    def fill(self, values):
+        parts = list(self.__parts)
+        for index, name in self.__slots:
+            value = values.get(name)
+            if value is not None:
+                parts[index] = value
+        return parts
+
+    # render template into text
+    def render(self, **values):
+        return "".join(self.fill(values))
+
+
+# append-only output builder, fragments are joined once when output is complete,
+# so output grows linearly with number of fields
+class Builder:
+
+    __fragments = [] # output text fragments in order
+
+    def __init__(self, text=""):
+        self.__fragments = [text]
+
+    # append text fragments
+    def add(self, *fragments):
+        self.__fragments.extend(fragments)
+
+    # append template filled with values, template parts are not joined separately
+    def render(self, text, **values):
+        self.__fragments.extend(get(text).fill(values))
+
+    # join all fragments into output text
+    def build(self):
+        return "".join(self.__fragments)
+
+
+# parsed templates by their text
+templates = {}
+
+# get parsed template, each template text is parsed only once
+def get(text):
+    template = templates.get(text)
+    if template is None:
+        template = templates[text] = Template(text)
+    return template
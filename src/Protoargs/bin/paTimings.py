@@ -0,0 +1,115 @@
+import json
+import time
+
+# high resolution wall clock, python 2 has only time
+clock = getattr(time, "perf_counter", time.time)
+
+# phases of proto file analysis and of parser generation in order they run
+schemaPhases = ["load", "tokenize", "excludeUnused", "check"]
+parserPhases = ["render", "write"]
+phases = schemaPhases + parserPhases
+
+
+# wall time spent in phases, time since previous lap is added to the phase
+class Stopwatch:
+
+    __start = 0.0 # clock value of previous lap
+    __phases = {} # phase -> seconds
+
+    def __init__(self, phases=None):
+        self.__phases = dict(phases or {})
+        self.restart()
+
+    # start measuring from now, time elapsed before is not added to any phase
+    def restart(self):
+        self.__start = clock()
+
+    def lap(self, phase):
+        now = clock()
+        self.__phases[phase] = self.__phases.get(phase, 0.0) + now - self.__start
+        self.__start = now
+
+    def getPhases(self):
+        return self.__phases
+
+
+# timings of one run by proto file and language, proto file repeated in run adds up
+class Report:
+
+    __paths = [] # proto files in order of analysis
+    __schemas = {} # proto file -> phase -> seconds
+    __parsers = {} # proto file -> [(language, phase -> seconds)]
+
+    def __init__(self):
+        self.__paths = []
+        self.__schemas = {}
+        self.__parsers = {}
+
+    # add analysis timings of proto file
+    def addSchema(self, path, phases):
+        if path not in self.__schemas:
+            self.__paths.append(path)
+            self.__schemas[path] = {}
+            self.__parsers[path] = []
+        self.__add(self.__schemas[path], phases)
+
+    # add generation timings of parser generated from proto file
+    def addParser(self, path, language, phases):
+        parsers = self.__parsers[path]
+        for name, total in parsers:
+            if name == language:
+                self.__add(total, phases)
+                return
+        parsers.append((language, dict(phases)))
+
+    def __add(self, total, phases):
+        for phase, seconds in phases.items():
+            total[phase] = total.get(phase, 0.0) + seconds
+
+    # seconds by phase summed over all proto files and parsers
+    def getTotals(self):
+        totals = dict((phase, 0.0) for phase in phases)
+        for path in self.__paths:
+            self.__add(totals, self.__schemas[path])
+            for language, parser in self.__parsers[path]:
+                self.__add(totals, parser)
+        return totals
+
+    # report as json, times are in seconds
+    def toJson(self):
+        files = []
+        for path in self.__paths:
+            files.append({
+                "path" : path,
+                "phases" : self.__schemas[path],
+                "parsers" : [{"language" : language, "phases" : parser} for language, parser in self.__parsers[path]],
+                })
+        totals = self.getTotals()
+        return json.dumps({
+            "unit" : "seconds",
+            "files" : files,
+            "phases" : totals,
+            "total" : sum(totals.values()),
+            }, indent=2, sort_keys=True) + "\n"
+
+    # report as table for humans, times are in milliseconds,
+    # proto file rows have analysis phases and its language rows have generation ones
+    def format(self):
+        rows = []
+        for path in self.__paths:
+            rows.append((path, self.__schemas[path]))
+            rows += [("  " + language, parser) for language, parser in self.__parsers[path]]
+        rows.append(("total", self.getTotals()))
+
+        header = ["time, ms"] + phases + ["total"]
+        table = [header]
+        for name, row in rows:
+            cells = [("%.2f" % (row[phase] * 1000)) if phase in row else "-" for phase in phases]
+            table.append([name] + cells + ["%.2f" % (sum(row.values()) * 1000)])
+
+        widths = [max([len(line[column]) for line in table]) for column in range(len(header))]
+        lines = []
+        for line in table:
+            lines.append("  ".join([line[0].ljust(widths[0])]
+                + [cell.rjust(width) for cell, width in zip(line[1:], widths[1:])]))
+        return "\n".join(lines) + "\n"
@@ -1,4 +1,13 @@
+import re
 import logging
+import paLogger
+
+log = paLogger.log
+
+try:
+    from sys import intern # python 3
+except ImportError:
+    pass # python 2 builtin
 
 # GLOBAL DEFS ###################################3
 
@@ -20,15 +29,45 @@ pf_repeated = "repeated"
 
 # END GLOBALS ###################################3
 
+# LEXER ###################################3
+
+# classifies stripped or not proto line and extracts all needed parts in one match,
+# comments, empty lines and statements protoargs does not need do not match
+re_line = re.compile(r"""\s*(?:
+    (?P<field>required|optional|repeated)\s+(?P<type>[\w.]+)\s+(?P<name>\w+)\s*=\s*(?P<position>\d+)\s*
+        (?:\[(?P<options>(?:[^\]"]|"(?:[^"\\]|\\.)*")*)\]\s*)?;\s*(?P<description>.*)
+    |(?P<invalid>(?:required|optional|repeated)\b.*)
+    |package\s+(?P<package>[\w.]+)\s*;.*
+    |message\s+(?P<message>\w+)\s*(?:\{(?P<body>.*)|.*)
+    |(?P<end>\}).*
+    )$""", re.VERBOSE)
+
+# field inside of message body written on one line, several fields may follow each other
+re_inline_field = re.compile(r"""(?P<field>required|optional|repeated)\s+(?P<type>[\w.]+)\s+(?P<name>\w+)\s*=\s*(?P<position>\d+)\s*
+        (?:\[(?P<options>(?:[^\]"]|"(?:[^"\\]|\\.)*")*)\]\s*)?;(?P<description>)""", re.VERBOSE)
+
+# braces of message body, strings and comments are matched too, so that braces inside of them are not counted
+re_brace = re.compile(r""""(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'|//.*|[{}]""")
+
+# default value inside of field options, e.g. [default = "value"]
+re_default = re.compile(r"""(?:^|,)\s*default\s*=\s*(?:"(?P<string>(?:[^"\\]|\\.)*)"|(?P<value>[^,\s]+))""")
+
+# END LEXER ###################################3
+
 
-class ProtoToken:
-    directive = ""
-    field = ""
-    type = ""
-    name= ""
-    position = ""
-    value = ""
-    description = ""
+class ProtoToken(object):
+    # slots keep token small, schemas may have tens of thousands of fields
+    # on python 3.11 token object takes 88 bytes instead of 352 with __dict__
+    __slots__ = ("directive", "field", "type", "name", "position", "value", "description")
+
+    def __init__(self, directive="", field="", type="", name="", position="", value="", description=""):
+        self.directive = directive
+        self.field = field
+        self.type = type
+        self.name = name
+        self.position = position
+        self.value = value
+        self.description = description
 
     def valid(self):
         return bool(self.directive)
@@ -39,7 +78,13 @@ class ProtoToken:
 
 class Tokenizer:
 
-    __tokens = [] # result of lines parsing
+    def __init__(self):
+        self.__tokens = [] # result of lines parsing, owned by instance
+
+    # forget previous results, so the same instance may tokenize next data
+    def reset(self):
+        self.__tokens = []
+        return self
 
     def getTokens(self):
         return self.__tokens
@@ -63,25 +108,30 @@ class Tokenizer:
             self.__tokens = filteredTokens
         return self
 
-    # Exclude unused structures from tokens
+    # Exclude unused structures from tokens in a single pass
     def excludeUnused(self):
-        tokens = self.__tokens
-        unusedTokens = []
-        for token in tokens:
-            if token.directive == pd_enum:
-                logging.warn("enums are not supported, exclude '" + token.name + "'")
-                unusedTokens.apend(token)
-            elif token.directive == pd_message:
-                if token.name.find(pa_main) == -1 and token.name.find(pa_links) == -1: # Check for predefined messages
-                    logging.warn("other messages are not needed, exclude '" + token.name + "'")
-                    unusedTokens.append(token)
-
-        # removing structures
-        for unused in unusedTokens:
-            self.excludeDirective(unused.directive, unused.name)
+        filteredTokens = []
+        skip = False
+        for token in self.__tokens:
+            if skip:
+                if token.directive == pd_end:
+                    skip = False # skipping ends on structure end
+            elif token.directive == pd_enum:
+                log.warning("enums are not supported, exclude '%s'", token.name)
+                skip = True
+            elif token.directive == pd_message and not self.__isUsedMessage(token.name):
+                log.warning("other messages are not needed, exclude '%s'", token.name)
+                skip = True
+            else:
+                filteredTokens.append(token) # let the token stay
+        self.__tokens = filteredTokens
 
         return self
 
+    # check if message is one of predefined protoargs messages
+    def __isUsedMessage(self, name):
+        return name.find(pa_main) != -1 or name.find(pa_links) != -1
+
     def getToken(self, directive, name):
         found = False
         tokens = self.__tokens
@@ -97,103 +147,113 @@ class Tokenizer:
         foundProtoargs = self.getToken(pd_message, pa_main).valid()
         foundProtoargsLinks = self.getToken(pd_message, pa_links).valid()
 
-        logging.debug("-----------------------------------------------------")
-        logging.debug(pa_main + " message: " + str(foundProtoargs))
-        logging.debug(pa_links +" message: " + str(foundProtoargsLinks))
-        logging.debug("-----------------------------------------------------")
+        log.debug("-----------------------------------------------------")
+        log.debug("%s message: %s", pa_main, foundProtoargs)
+        log.debug("%s message: %s", pa_links, foundProtoargsLinks)
+        log.debug("-----------------------------------------------------")
 
         return foundProtoargs
 
     # parse field line and return token for it
     def createFieldToken(self, line):
-        line = line.replace("\t"," ");
-        chunks = line.split(" ")
+        match = re_line.match(line)
+        if match is None or not match.group("field"):
+            return ProtoToken() # not a field
+        return self.__createFieldToken(match)
+
+    # parse package line and return token for it
+    def createPackageToken(self, line):
+        match = re_line.match(line)
+        if match is None or not match.group("package"):
+            return ProtoToken() # not a package
+        return self.__createPackageToken(match)
 
-        token = ProtoToken()
-        token.directive = pd_field
-        token.field = chunks[0].strip()
-        token.type = chunks[1].strip()
-        token.name = chunks[2].strip()
-        token.position = chunks[4].replace(";","").strip()
+    def __createFieldToken(self, match):
+        field, type, name, position, options, description = \
+                match.group("field", "type", "name", "position", "options", "description")
+        token = ProtoToken(pd_field, intern(field), intern(type), intern(name), position)
 
         # discover default value
-        nocomment = self.__removeComment(line)
-        if nocomment.find("]") != -1:
-            token.value = nocomment \
-                    .split("]")[0] \
-                    .split("[")[1] \
-                    .split("=")[1] \
-                    .strip()
-            if token.value[0] == '"': # remove " from string
-                token.value = token.value[1:len(token.value)-1]
+        if options and options.find("default") != -1:
+            default = re_default.search(options)
+            if default:
+                token.value = default.group("value") or default.group("string") or ""
 
         # comment on the same line is our description
-        token.description = line.split(";")[1].strip()
-        token.description = token.description[2:len(token.description)].strip() # remove starting //
+        if description:
+            if description.startswith("//"):
+                description = description[2:].lstrip() # remove starting //
+            token.description = description.rstrip().replace("\t", " ")
 
         return token
 
-    def createPackageToken(self, line):
-        line = self.__removeComment(line)
-        token = ProtoToken()
-        token.directive = pd_package
-        token.name = line \
-                .replace(";","") \
-                .replace(pd_package,"") \
-                .strip()
-        return token
-
-    def __createMessageToken(self, line):
-        line = self.__removeComment(line)
-        token = ProtoToken()
-        token.directive = pd_message
-        token.name = line \
-                .replace(";","") \
-                .replace(pd_message,"") \
-                .strip()
-        return token
-
-    def __createEndToken(self, line):
-        token = ProtoToken()
-        token.directive = pd_end
-        return token
-
-    def __removeComment(self, line):
-        if line.find(";") == -1:
-            return self.__isEntireLineComment(line)
-        else:
-            return line.split(";")[0] + ";"
-
-    # remove what we think is a comment, and check if this entire line comment
-    def __isEntireLineComment(self, line):
-        fieldChunks = line.split("//")
-        return fieldChunks[0].strip()
-
-    def tokenize(self, data):
-        # tokenizing line by line
+    def __createPackageToken(self, match):
+        return ProtoToken(pd_package, name=intern(match.group("package")))
+
+    def __createMessageToken(self, match):
+        return ProtoToken(pd_message, name=intern(match.group("message")))
+
+    def __createEndToken(self):
+        return ProtoToken(pd_end)
+
+    # body of message, which is closed on the same line as it is opened,
+    # None if message continues on the next lines
+    def __inlineBody(self, rest):
+        if rest is None:
+            return None # opening brace is on the next line
+        depth = 1
+        for match in re_brace.finditer(rest):
+            brace = match.group(0)
+            if brace == "{":
+                depth += 1
+            elif brace == "}":
+                depth -= 1
+                if depth == 0:
+                    return rest[:match.start()]
+            elif brace.startswith("//"):
+                break # the rest of line is comment
+        return None
+
+    # tokenize proto file lines, bodies of messages not needed by protoargs are skipped
+    # without tokenizing, unless skipUnused is False
+    def tokenize(self, data, skipUnused=True):
+        skip = False # inside of not needed message, until its end
+        debug = log.isEnabledFor(logging.DEBUG)
+        # tokenizing line by line, single match classifies line
         for line in data:
-            sline = line.strip() # make striped line
-            # remove what we think is a comment, and check if this entire line comment
-            # Note: we still need comments for fields, it is out field description
-            if self.__isEntireLineComment(sline):
-                if sline.find(pf_required) != -1 or \
-                   sline.find(pf_optional) != -1 or \
-                   sline.find(pf_repeated) != -1:
-                    logging.debug(sline)
-                    token = self.createFieldToken(sline)
-                    self.__tokens.append(token)
-                elif sline.find(pd_package) != -1:
-                    logging.debug(sline)
-                    token = self.createPackageToken(sline)
-                    self.__tokens.append(token)
-                elif sline.find(pd_message) != -1:
-                    logging.debug(sline)
-                    token = self.__createMessageToken(sline)
-                    self.__tokens.append(token)
-                elif sline.find(pd_end) != -1:
-                    logging.debug(sline)
-                    token = self.__createEndToken(sline)
-                    self.__tokens.append(token)
+            if skip and line.find(pd_end) == -1:
+                continue # only end of not needed message matters
+            match = re_line.match(line)
+            if match is None:
+                continue # empty line, comment or not needed statement
+            if debug:
+                log.debug(match.group(0).strip())
+
+            if match.group("field"):
+                if not skip:
+                    self.__tokens.append(self.__createFieldToken(match))
+            elif match.group("invalid"):
+                if not skip:
+                    log.warning("could not parse field '%s', ignore it", match.group("invalid").rstrip())
+            elif match.group("package"):
+                if not skip:
+                    self.__tokens.append(self.__createPackageToken(match))
+            elif match.group("message"):
+                if not skip:
+                    token = self.__createMessageToken(match)
+                    body = self.__inlineBody(match.group("body"))
+                    if skipUnused and not self.__isUsedMessage(token.name):
+                        log.warning("other messages are not needed, exclude '%s'", token.name)
+                        skip = body is None # skip message body up to its end
+                    else:
+                        self.__tokens.append(token)
+                        if body is not None: # message ends on the same line
+                            for field in re_inline_field.finditer(body):
+                                self.__tokens.append(self.__createFieldToken(field))
+                            self.__tokens.append(self.__createEndToken())
+            elif skip:
+                skip = False
+            else:
+                self.__tokens.append(self.__createEndToken())
 
         return self
-
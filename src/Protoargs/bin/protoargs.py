@@ -2,16 +2,20 @@
 
 import os
 import sys
+import time
+import shlex
 import logging
 from tempfile import gettempdir
 
 import protoargs_pa
 import paLogger
-import paCppGenerator
-import paPyGenerator
-import paRustGenerator
-import paGoGenerator
-import paBashGenerator
+import paSchema
+import paFile
+import paApi
+import paTimings
+
+# number of the most expensive functions printed after profiled run
+profileTop = 25
 
 class ArgsParser:
 
@@ -19,54 +23,303 @@ class ArgsParser:
         self.config = protoargs_pa.parse("protoargs", 
                 "Protoargs program generates command line arguments parsers, using proto file as configuration.", argv)
 
-if __name__ == "__main__":
-    #import sys
-    #reload(sys)
-    #sys.setdefaultencoding('utf8')
+# read manifest file, each line contains proto file path and optional output directory,
+# returns list of (proto file, output directory) pairs or None on error
+def loadManifest(path, dst):
+    jobs = []
+    base = os.path.dirname(path)
+    try:
+        with open(path, "r") as index:
+            for number, line in enumerate(index, 1):
+                fields = shlex.split(line, comments=True)
+                if not fields:
+                    continue # empty line or comment
+                if len(fields) > 2:
+                    logging.critical("Manifest '" + path + "' line " + str(number) + " should contain proto file and output directory only")
+                    return None
+                out = dst
+                if len(fields) > 1:
+                    out = os.path.join(base, fields[1])
+                jobs.append((os.path.join(base, fields[0]), out))
+    except (IOError, OSError, ValueError):
+        logging.critical("Could not read manifest '" + path + "'")
+        return None
+    return jobs
+
+# escape path for depfile in Make format
+def escapeDepfilePath(path):
+    return path \
+            .replace(" ", "\\ ") \
+            .replace("#", "\\#") \
+            .replace("$", "$$")
+
+# write depfile in Make format, all outputs depend on all inputs
+def saveDepfile(path, outputs, inputs):
+    logging.info("Save depfile: '" + path + "'")
+    data = " \\\n".join([escapeDepfilePath(output) for output in outputs]) + ": \\\n" \
+            + " \\\n".join(["  " + escapeDepfilePath(input) for input in inputs]) + "\n"
+    try:
+        paFile.writeFileData(path, data)
+        return True
+    except (IOError, OSError):
+        logging.error("Could not write depfile '" + path + "'")
+        return False
+
+# initialize logger, quiet run writes no log file into temporary directory
+def initLogger(loglevel, quiet):
+    paLogger.init(loglevel, None if quiet else gettempdir())
+
+# prepare logging in worker process, forked workers already have it
+def initWorker(loglevel, quiet):
+    if not logging.getLogger().handlers:
+        initLogger(loglevel, quiet)
+
+# load and tokenize proto file, task of worker process
+def analyseSchema(job):
+    path, cache = job
+    return paSchema.Schema(path, cache).analyse(), cache
+
+# generate parser of one language from analysed proto file, task of worker process,
+# returns result with written and skipped files and timings of generation phases
+def generateParser(task):
+    language, path, dst, schema = task
+    name = paApi.generators[language][0]
+    module = paApi.loadGenerator(language)
+    logging.info("Generate " + name + " parser from proto file '" + path + "'")
+    generator = module.Generator(path, dst, schema)
+    result = generator.generate()
+    return result, generator.getWrittenFiles(), generator.getSkippedFiles(), generator.getTimings()
+
+# number of CPU cores, python 2 has only multiprocessing to tell it
+def cpuCount():
+    if hasattr(os, "cpu_count"):
+        return os.cpu_count() or 1
+    import multiprocessing
+    return multiprocessing.cpu_count()
+
+# run tasks in pool if there is one, results are in order of tasks
+def runTasks(pool, function, tasks):
+    if pool is None or len(tasks) < 2:
+        return [function(task) for task in tasks]
+    return pool.map(function, tasks, 1)
+
+# analyse proto files once and generate parsers of selected languages from them,
+# returns analysed schemas by path, generation results and number of failed proto files,
+# phase timings are added to timings report if there is one
+def generateParsers(pool, jobs, selected, cache, timings=None):
+    tasks = []
+    schemas = {}
+    failed = 0
+    for (path, dst), (schema, used) in zip(jobs, runTasks(pool, analyseSchema, [(path, cache) for path, dst in jobs])):
+        if cache is not None and used is not cache:
+            cache.merge(used) # cache usage in worker process
+        if timings is not None:
+            timings.addSchema(path, schema.getTimings())
+        if schema.valid():
+            schemas[path] = schema
+            tasks += [(language, path, dst, schema) for language in selected]
+        else:
+            logging.error("Skip proto file '" + path + "', it could not be read or has no protoargs message")
+            failed += 1
+
+    results = runTasks(pool, generateParser, tasks)
+
+    # proto file fails if any of its parsers could not be written
+    unsaved = []
+    for (language, path, dst, schema), result in zip(tasks, results):
+        if not result[0] and path not in unsaved:
+            logging.error("Parsers of proto file '" + path + "' could not be written")
+            unsaved.append(path)
+    failed += len(unsaved)
+    if timings is not None:
+        for (language, path, dst, schema), result in zip(tasks, results):
+            timings.addParser(path, language, result[3])
+    return schemas, results, failed
+
+# report files left untouched, they do not trigger rebuilds
+def reportResults(results):
+    written = sum([len(result[1]) for result in results])
+    skipped = sum([len(result[2]) for result in results])
+    logging.info("Files written: " + str(written) + ", not changed and skipped: " + str(skipped))
+
+# file modification stamp, None if file is missing, e.g. while editor replaces it
+def fileStamp(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (getattr(stat, "st_mtime_ns", stat.st_mtime), stat.st_size, stat.st_ino)
+
+# poll proto files until interrupted and regenerate parsers of changed ones only,
+# analysed schemas stay in memory, so unchanged proto files are never read again
+# and parsers are not generated if protoargs configuration did not change
+def watchParsers(jobs, selected, cache, interval, schemas):
+    stamps = dict((path, fileStamp(path)) for path, dst in jobs)
+    logging.info("Watching " + str(len(stamps)) + " proto file(s) for changes, press Ctrl+C to stop")
+    try:
+        while True:
+            time.sleep(interval)
+            changed = []
+            for path in stamps:
+                stamp = fileStamp(path)
+                if stamp is not None and stamp != stamps[path]:
+                    stamps[path] = stamp
+                    changed.append(path)
+            if not changed:
+                continue
+
+            updated = []
+            for path in changed:
+                schema = paSchema.Schema(path, cache).analyse()
+                if not schema.valid():
+                    logging.error("Proto file '" + path + "' could not be read or has no protoargs message, parsers are not updated")
+                elif path in schemas and str(schema.getTokens()) == str(schemas[path].getTokens()):
+                    logging.info("Protoargs configuration in '" + path + "' is not changed")
+                else:
+                    schemas[path] = schema
+                    updated.append(path)
+
+            tasks = [(language, path, dst, schemas[path]) for path, dst in jobs if path in updated for language in selected]
+            if tasks:
+                reportResults(runTasks(None, generateParser, tasks))
+    except KeyboardInterrupt:
+        logging.info("Watching stopped")
+
+# generate parsers as configured, returns exit code
+def run(config):
+    if config.cpp \
+            or config.py \
+            or config.go \
+            or config.rust \
+            or config.bash:
+        # proto files from command line and from manifest, all in one run
+        jobs = [(path, config.dst) for path in (config.src or []) if path]
+        if config.manifest:
+            manifest = loadManifest(config.manifest, config.dst)
+            if manifest is None:
+                return 1
+            jobs += manifest
+
+        if not jobs:
+            logging.critical("Specify at least one proto file with '-i' or '--manifest'. Use '-h|--help' for help.")
+            return 1
+        for path, dst in jobs:
+            if not dst:
+                logging.critical("Specify output directory for proto file '" + path + "' with '-o' or inside of manifest. Use '-h|--help' for help.")
+                return 1
+
+        selected = [language for language in paApi.languages if getattr(config, language)]
 
+        # analysed proto files may be reused between runs
+        cache = None
+        if config.cache:
+            import paCache # imported only when used, it is not needed for most of runs
+            cache = paCache.Cache(config.cache)
+
+        # each proto file and then each proto file and language pair is a separate task
+        pool = None
+        processes = config.jobs or cpuCount()
+        processes = min(processes, len(jobs) * len(selected))
+        if processes > 1:
+            import multiprocessing # imported only when used, single process runs start faster
+            pool = multiprocessing.Pool(processes, initWorker, (config.loglevel, config.quiet))
+
+        # wall time of phases is reported on request only
+        timings = None
+        if config.timings or config.timings_json:
+            timings = paTimings.Report()
+
+        try:
+            # load and tokenize proto files once, all generators share the result
+            schemas, results, failed = generateParsers(pool, jobs, selected, cache, timings)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+        # generated files with everything read to generate them, each file once in order of generation
+        if config.depfile and results:
+            outputs = []
+            for result in results:
+                outputs += [output for output in result[1] + result[2] if output not in outputs]
+            inputs = [path for path, dst in jobs]
+            if config.manifest:
+                inputs.append(config.manifest)
+            if not saveDepfile(config.depfile, outputs, inputs):
+                failed += 1
+
+        reportResults(results)
+
+        if cache is not None:
+            cache.report()
+
+        if config.timings:
+            sys.stderr.write(timings.format())
+        if config.timings_json:
+            logging.info("Save timings: '" + config.timings_json + "'")
+            try:
+                paFile.writeFileData(config.timings_json, timings.toJson())
+            except (IOError, OSError):
+                logging.error("Could not write timings '" + config.timings_json + "'")
+                failed += 1
+
+        # keep regenerating parsers while proto files are edited
+        if config.watch:
+            watchParsers(jobs, selected, cache, config.interval, schemas)
+
+        if failed:
+            logging.critical(str(failed) + " of " + str(len(jobs)) + " proto file(s) failed")
+            return 1
+        return 0
+
+    else:
+        logging.critical("Specify at least one parser language to proceed (e.g '--cpp'). Use '-h|--help' for help.")
+        return 1
+
+# run generation under profiler, statistics are saved into file readable by pstats
+# and the most expensive functions are printed, returns exit code of generation
+def profile(config):
+    import cProfile # imported only when used, profiling is rare
+    import pstats
+    profiler = cProfile.Profile()
+    code = profiler.runcall(run, config)
+
+    logging.info("Save profile: '" + config.profile + "'")
+    try:
+        profiler.dump_stats(config.profile)
+    except (IOError, OSError):
+        logging.error("Could not write profile '" + config.profile + "'")
+        code = 1
+
+    stats = pstats.Stats(profiler, stream=sys.stderr)
+    stats.sort_stats("cumulative").print_stats(profileTop)
+    return code
+
+# parse arguments and generate parsers, returns exit code instead of exiting,
+# so that protoargs may be run from python code and profiled
+def main(argv):
     parser = ArgsParser()
-    parser.parse(sys.argv[1:])
+    try:
+        parser.parse(argv)
+    except SystemExit as error:
+        return error.code or 0 # help printed or wrong arguments
 
     # initialize logger
-    paLogger.init(parser.config.loglevel, gettempdir());
+    initLogger(parser.config.loglevel, parser.config.quiet)
     logging.info("Arguments parsed")
 
     # print configuration
     logging.debug(parser.config)
 
-    if parser.config.cpp \
-            or parser.config.py \
-            or parser.config.go \
-            or parser.config.rust \
-            or parser.config.bash:
-        path = parser.config.src
-        dst = parser.config.dst
-
-        if parser.config.cpp:
-            logging.info("Generate c++ parser from proto file '" + path + "'")
-            generator = paCppGenerator.Generator(path, dst)
-            generator.generate()
-
-        if parser.config.py:
-            logging.info("Generate python parser from proto file '" + path + "'")
-            generator = paPyGenerator.Generator(path, dst)
-            generator.generate()
-
-        if parser.config.rust:
-            logging.info("Generate rust parser from proto file '" + path + "'")
-            generator = paRustGenerator.Generator(path, dst)
-            generator.generate()
-
-        if parser.config.go:
-            logging.info("Generate go parser from proto file '" + path + "'")
-            generator = paGoGenerator.Generator(path, dst)
-            generator.generate()
-
-        if parser.config.bash:
-            logging.info("Generate bash parser from proto file '" + path + "'")
-            generator = paBashGenerator.Generator(path, dst)
-            generator.generate()
+    if parser.config.profile:
+        if parser.config.jobs != 1:
+            logging.warning("Only main process is profiled, use '-j 1' to profile generation of parsers")
+        return profile(parser.config)
+    return run(parser.config)
 
-    else:
-        logging.critical("Specify at least one parser language to proceed (e.g '--cpp'). Use '-h|--help' for help.")
-        sys.exit(1)
+if __name__ == "__main__":
+    #import sys
+    #reload(sys)
+    #sys.setdefaultencoding('utf8')
+
+    sys.exit(main(sys.argv[1:]))
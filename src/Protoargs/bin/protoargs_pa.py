@@ -16,9 +16,19 @@ def prepareOptions(program, description):
 
     parser = argparse.ArgumentParser(description=description, prog=program)
 
-    parser.add_argument(r"""-i""" , type=str, required=True, help=r"""Path to proto file with protoargs configuration {REQUIRED,type:string,default:""}""", metavar=r"""src""", dest=r"""src"""    )
-    parser.add_argument(r"""-o""" , type=str, required=True, help=r"""Path to output directory, where parser will be placed. {REQUIRED,type:string,default:""}""", metavar=r"""dst""", dest=r"""dst"""    )
+    parser.add_argument(r"""-i""" , type=str, help=r"""Path to proto file with protoargs configuration. May be repeated to generate parsers for several proto files at once {REPEATED,type:string,default:""}""", metavar=r"""src""", dest=r"""src""" , nargs="?" , action="append"  )
+    parser.add_argument(r"""-o""" , type=str, help=r"""Path to output directory, where parser will be placed. Required unless manifest specifies output directories {OPTIONAL,type:string,default:""}""", metavar=r"""dst""", dest=r"""dst"""    )
     parser.add_argument(r"""--loglevel""" , type=str, help=r"""Log level, possible values [ERROR|WARNING|INFO|DEBUG] {OPTIONAL,type:string,default:"INFO"}""", metavar=r"""loglevel""", dest=r"""loglevel"""   , default=r"""INFO""" )
+    parser.add_argument(r"""-q""",r"""--quiet""" , help=r"""Do not write log file into temporary directory, log goes to console only {OPTIONAL,type:bool,default:"false"}""", metavar=r"""quiet""", dest=r"""quiet"""  , action="store_const" , default=False , const=True)
+    parser.add_argument(r"""--cache""" , type=str, help=r"""Path to cache directory, where analysed proto files are stored. Unchanged proto files are not tokenized again {OPTIONAL,type:string,default:""}""", metavar=r"""cache""", dest=r"""cache"""    )
+    parser.add_argument(r"""--manifest""" , type=str, help=r"""Path to manifest file, each line contains path to proto file and optional output directory separated by space, paths are relative to manifest location. Lines starting with '#' are ignored {OPTIONAL,type:string,default:""}""", metavar=r"""manifest""", dest=r"""manifest"""    )
+    parser.add_argument(r"""-j""" , type=int, help=r"""Number of processes generating parsers in parallel, each proto file and language pair is a separate task. Use 0 for number of CPU cores {OPTIONAL,type:uint32,default:"1"}""", metavar=r"""jobs""", dest=r"""jobs"""   , default=1 )
+    parser.add_argument(r"""--depfile""" , type=str, help=r"""Path to depfile in Make format, generated files are listed as targets which depend on all read proto files and manifest. Useful for CMake and Ninja DEPFILE {OPTIONAL,type:string,default:""}""", metavar=r"""depfile""", dest=r"""depfile"""    )
+    parser.add_argument(r"""--watch""" , help=r"""Keep running after generation, poll proto files and regenerate parsers of changed ones. Stop with Ctrl+C {OPTIONAL,type:bool,default:"false"}""", metavar=r"""watch""", dest=r"""watch"""  , action="store_const" , default=False , const=True)
+    parser.add_argument(r"""--interval""" , type=float, help=r"""Seconds between checks of proto files in watch mode {OPTIONAL,type:float,default:"1.0"}""", metavar=r"""interval""", dest=r"""interval"""   , default=1.0 )
+    parser.add_argument(r"""--timings""" , help=r"""Print wall time of each phase (load, tokenize, excludeUnused, check, render, write) per proto file and language after generation {OPTIONAL,type:bool,default:"false"}""", metavar=r"""timings""", dest=r"""timings"""  , action="store_const" , default=False , const=True)
+    parser.add_argument(r"""--timings-json""" , type=str, help=r"""Path to file, where phase timings are written as json, times are in seconds {OPTIONAL,type:string,default:""}""", metavar=r"""timings_json""", dest=r"""timings_json"""    )
+    parser.add_argument(r"""--profile""" , type=str, help=r"""Path to file, where cProfile statistics of the whole run are written, the most expensive functions are printed too. Only main process is profiled {OPTIONAL,type:string,default:""}""", metavar=r"""profile""", dest=r"""profile"""    )
     parser.add_argument(r"""--cpp""" , help=r"""Generate c++11 arguments parser (Note: you need generate files with protoc compiler additionally, so that parser will work). Parser will have name of proto file name, e.g. [protoargs.proto]->[protoargs.pa.cc] {OPTIONAL,type:bool,default:"false"}""", metavar=r"""cpp""", dest=r"""cpp"""  , action="store_const" , default=False , const=True)
     parser.add_argument(r"""--py""" , help=r"""Generate python arguments parser. Parser will have name of proto file name, e.g. [protoargs.proto]->[protoargs_pa.py] {OPTIONAL,type:bool,default:"false"}""", metavar=r"""py""", dest=r"""py"""  , action="store_const" , default=False , const=True)
     parser.add_argument(r"""--rust""" , help=r"""Generate rust arguments parser. Parser will have name of proto file name, e.g. [protoargs.proto]->[protoargs_pa.rs] {OPTIONAL,type:bool,default:"false"}""", metavar=r"""rust""", dest=r"""rust"""  , action="store_const" , default=False , const=True)
@@ -0,0 +1,51 @@
+import os
+import shutil
+import logging
+import tempfile
+import unittest
+
+import paApi
+import protoargs
+
+SCHEMA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Schema", "src")
+
+class TestApi(unittest.TestCase):
+
+    def setUp(self):
+        self.dst = tempfile.mkdtemp()
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+        shutil.rmtree(self.dst)
+
+    # in memory parsers are the same as generated into files
+    def test_generate(self):
+        path = os.path.join(SCHEMA_DIR, "schema.proto")
+        handlers = list(logging.getLogger().handlers)
+        with open(path, "r") as index:
+            files = paApi.generate(index.read(), paApi.languages, "schema")
+        self.assertEqual(logging.getLogger().handlers, handlers) # logging of application is not configured
+
+        self.assertEqual(sorted(files.keys()), ["schema.pa.cc", "schema.pa.h",
+            "schema_pa.go", "schema_pa.py", "schema_pa.rs", "schema_pa.sh"])
+        self.assertEqual(os.listdir(self.dst), [])
+
+        protoargs.generateParsers(None, [(path, self.dst)], paApi.languages, None)
+        for name, data in files.items():
+            with open(os.path.join(self.dst, name), "r") as index:
+                self.assertEqual(index.read(), data, name)
+
+    # usage of bash parser belongs to its own proto file, even if file names are the same
+    def test_bash_usage(self):
+        columns = os.environ.get("COLUMNS")
+        first = paApi.generate("message protoargs {\n optional bool first = 1; // First\n}\n", ["bash"], "same")
+        second = paApi.generate("message protoargs {\n optional bool second = 1; // Second\n}\n", ["bash"], "same")
+        self.assertTrue("--first" in first["same_pa.sh"])
+        self.assertTrue("--second" in second["same_pa.sh"])
+        self.assertFalse("--first" in second["same_pa.sh"])
+        self.assertEqual(os.environ.get("COLUMNS"), columns)
+
+    def test_invalid(self):
+        self.assertEqual(paApi.generate("message dummy {}\n", ["py"]), None)
+        self.assertRaises(ValueError, paApi.generate, "", ["java"])
@@ -0,0 +1,91 @@
+import os
+import shutil
+import types
+import tempfile
+import unittest
+
+import paCache
+import paSchema
+import paTokenizer
+
+SCHEMA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Schema", "src")
+
+class TestCache(unittest.TestCase):
+
+    def setUp(self):
+        self.dst = tempfile.mkdtemp()
+        self.cache = paCache.Cache(os.path.join(self.dst, "cache"))
+        self.path = os.path.join(self.dst, "schema.proto")
+        shutil.copy(os.path.join(SCHEMA_DIR, "schema.proto"), self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.dst)
+
+    def analyse(self):
+        return paSchema.Schema(self.path, self.cache).analyse()
+
+    def test_hit(self):
+        expected = paSchema.Schema(self.path).analyse()
+
+        first = self.analyse()
+        self.assertEqual((self.cache.getHits(), self.cache.getMisses()), (0, 1))
+        second = self.analyse()
+        self.assertEqual((self.cache.getHits(), self.cache.getMisses()), (1, 1))
+
+        self.assertTrue(second.valid())
+        self.assertEqual(str(first.getTokens()), str(expected.getTokens()))
+        self.assertEqual(str(second.getTokens()), str(expected.getTokens()))
+        self.assertEqual([token.name for token in second.getSymbols().getLinks("paramC")], ["c", "c_long_param"])
+
+    def test_changed_content(self):
+        self.analyse()
+        with open(self.path, "a") as index:
+            index.write("// changed\n")
+        self.analyse()
+        self.assertEqual((self.cache.getHits(), self.cache.getMisses()), (0, 2))
+
+    def test_broken_entry(self):
+        self.analyse()
+        for name in os.listdir(self.cache.getDir()):
+            with open(os.path.join(self.cache.getDir(), name), "w") as index:
+                index.write("[[")
+        self.assertTrue(self.analyse().valid())
+        self.assertEqual((self.cache.getHits(), self.cache.getMisses()), (0, 2))
+
+    # cached tokens are as compact as tokenized ones
+    def test_interned(self):
+        expected = paSchema.Schema(self.path).analyse().getTokens()
+        self.analyse()
+        tokens = self.analyse().getTokens()
+        self.assertEqual(self.cache.getHits(), 1)
+        self.assertTrue(all(token.name is original.name for token, original in zip(tokens, expected)))
+
+    # changed source of tokenizer, schema or cache gives other version, so nothing stale is loaded
+    def test_version(self):
+        module = types.ModuleType("module")
+        module.__file__ = os.path.join(self.dst, "module.py")
+        with open(module.__file__, "w") as index:
+            index.write("old = True\n")
+        old = paCache.sourcesDigest([paTokenizer, module])
+        with open(module.__file__, "w") as index:
+            index.write("new = True\n")
+        self.assertNotEqual(paCache.sourcesDigest([paTokenizer, module]), old)
+        self.assertTrue(paCache.version.endswith(paCache.sourcesDigest([paTokenizer, paSchema, paCache])))
+
+    # directory created by concurrent worker does not prevent storing
+    def test_existing_dir(self):
+        os.mkdir(self.cache.getDir())
+        self.analyse()
+        self.assertEqual(len(os.listdir(self.cache.getDir())), 1)
+        self.analyse()
+        self.assertEqual((self.cache.getHits(), self.cache.getMisses()), (1, 1))
+
+    def test_invalid_not_stored(self):
+        with open(self.path, "w") as index:
+            index.write("message other {}\n")
+        self.assertFalse(self.analyse().valid())
+        self.assertFalse(self.analyse().valid())
+        self.assertEqual((self.cache.getHits(), self.cache.getMisses()), (0, 2))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import os
+import stat
+import shutil
+import tempfile
+import threading
+import unittest
+
+import paFile
+
+class TestFile(unittest.TestCase):
+
+    def setUp(self):
+        self.dst = tempfile.mkdtemp()
+        self.path = os.path.join(self.dst, "parser_pa.py")
+
+    def tearDown(self):
+        shutil.rmtree(self.dst)
+
+    def test_write(self):
+        paFile.writeFileData(self.path, "data")
+        self.assertTrue(paFile.sameFileData(self.path, "data"))
+        umask = os.umask(0) # new file gets default mode
+        os.umask(umask)
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o666 & ~umask)
+        self.assertEqual(os.listdir(self.dst), ["parser_pa.py"]) # no temporary files left
+
+    def test_keep_mode(self):
+        paFile.writeFileData(self.path, "old")
+        os.chmod(self.path, 0o640)
+        paFile.writeFileData(self.path, "new")
+        self.assertTrue(paFile.sameFileData(self.path, "new"))
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o640)
+
+    @unittest.skipUnless(hasattr(os, "symlink"), "symbolic links are not supported")
+    def test_symlink(self):
+        real = os.path.join(self.dst, "real")
+        os.mkdir(real)
+        target = os.path.join(real, "parser_pa.py")
+        paFile.writeFileData(target, "old")
+        os.symlink(os.path.join("real", "parser_pa.py"), self.path)
+
+        paFile.writeFileData(self.path, "new")
+        self.assertTrue(os.path.islink(self.path)) # link is kept and its target is written
+        self.assertTrue(paFile.sameFileData(target, "new"))
+        self.assertEqual(sorted(os.listdir(self.dst)), ["parser_pa.py", "real"])
+        self.assertEqual(os.listdir(real), ["parser_pa.py"])
+
+    def test_failure(self):
+        os.mkdir(self.path) # directory can not be replaced by file
+        self.assertRaises(OSError, paFile.writeFileData, self.path, "data")
+        self.assertEqual(os.listdir(self.dst), ["parser_pa.py"])
+
+    # reader never sees partially written file
+    def test_concurrent_read(self):
+        contents = ["a" * 1000000, "b" * 1000000]
+        paFile.writeFileData(self.path, contents[0])
+        partial = []
+        done = threading.Event()
+
+        def read():
+            while not done.is_set():
+                with open(self.path, "r") as index:
+                    data = index.read()
+                if data not in contents:
+                    partial.append(len(data))
+
+        reader = threading.Thread(target=read)
+        reader.start()
+        try:
+            for i in range(100):
+                paFile.writeFileData(self.path, contents[i % 2])
+        finally:
+            done.set()
+            reader.join()
+        self.assertEqual(partial, [])
@@ -0,0 +1,41 @@
+import os
+import shutil
+import logging
+import tempfile
+import unittest
+
+import paLogger
+
+class TestLogger(unittest.TestCase):
+
+    def setUp(self):
+        self.dst = tempfile.mkdtemp()
+        self.root = logging.getLogger()
+        self.handlers = list(self.root.handlers)
+        self.level = self.root.level
+
+    def tearDown(self):
+        for handler in paLogger.handlers:
+            self.root.removeHandler(handler)
+            handler.close()
+        del paLogger.handlers[:]
+        self.root.setLevel(self.level)
+        shutil.rmtree(self.dst)
+
+    def test_repeated_init(self):
+        paLogger.init("INFO", self.dst)
+        paLogger.init("DEBUG", self.dst)
+        added = [handler for handler in self.root.handlers if handler not in self.handlers]
+        self.assertEqual(len(added), 2) # file and console
+        self.assertEqual(self.root.level, logging.DEBUG)
+        self.assertTrue(os.path.exists(os.path.join(self.dst, "protoargs.log")))
+
+    def test_quiet(self):
+        paLogger.init("ERROR", self.dst)
+        paLogger.init("ERROR", None)
+        added = [handler for handler in self.root.handlers if handler not in self.handlers]
+        self.assertEqual(len(added), 1)
+        self.assertFalse(isinstance(added[0], logging.FileHandler))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,199 @@
+import os
+import sys
+import json
+import pstats
+import shutil
+import logging
+import filecmp
+import tempfile
+import unittest
+import multiprocessing
+
+import paSchema
+import paApi
+import paLogger
+import paTimings
+import protoargs
+
+SCHEMA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Schema", "src")
+
+class TestProtoargs(unittest.TestCase):
+
+    def setUp(self):
+        self.dst = tempfile.mkdtemp()
+        self.level = logging.getLogger().level
+        logging.disable(logging.CRITICAL) # broken manifests are reported
+
+    def tearDown(self):
+        # main initializes logger, its handlers should not leak into other tests
+        for handler in paLogger.handlers:
+            logging.getLogger().removeHandler(handler)
+            handler.close()
+        del paLogger.handlers[:]
+        logging.getLogger().setLevel(self.level)
+        logging.disable(logging.NOTSET)
+        shutil.rmtree(self.dst)
+
+    def manifest(self, text):
+        path = os.path.join(self.dst, "schemas.manifest")
+        with open(path, "w") as index:
+            index.write(text)
+        return path
+
+    def test_manifest(self):
+        path = self.manifest("# proto file and output directory\n"
+                "\n"
+                "a.proto out/a\n"
+                "  \"with space.proto\"   # default output directory\n")
+        self.assertEqual(protoargs.loadManifest(path, "/default"), [
+            (os.path.join(self.dst, "a.proto"), os.path.join(self.dst, "out/a")),
+            (os.path.join(self.dst, "with space.proto"), "/default"),
+            ])
+
+    def test_broken_manifest(self):
+        self.assertEqual(protoargs.loadManifest(self.manifest("a.proto out extra\n"), ""), None)
+        self.assertEqual(protoargs.loadManifest(os.path.join(self.dst, "missing"), ""), None)
+
+    def test_depfile(self):
+        path = os.path.join(self.dst, "deps.d")
+        self.assertTrue(protoargs.saveDepfile(path, ["out/a b.pa.h", "out/a b.pa.cc"], ["a b.proto", "#1$.manifest"]))
+        with open(path, "r") as index:
+            self.assertEqual(index.read(),
+                    "out/a\\ b.pa.h \\\n"
+                    "out/a\\ b.pa.cc: \\\n"
+                    "  a\\ b.proto \\\n"
+                    "  \\#1$$.manifest\n")
+
+    def test_parallel_is_identical(self):
+        serial = os.path.join(self.dst, "serial")
+        parallel = os.path.join(self.dst, "parallel")
+        os.mkdir(serial)
+        os.mkdir(parallel)
+
+        tasks = []
+        for name in ["simple.proto", "schema.proto", "multy_command.proto"]:
+            path = os.path.join(SCHEMA_DIR, name)
+            schema = paSchema.Schema(path).analyse()
+            tasks += [(language, path, serial, schema) for language in paApi.languages]
+
+        self.assertTrue(all([result[0] for result in protoargs.runTasks(None, protoargs.generateParser, tasks)]))
+
+        pool = multiprocessing.Pool(2)
+        try:
+            tasks = [(language, path, parallel, schema) for language, path, dst, schema in tasks]
+            self.assertTrue(all([result[0] for result in protoargs.runTasks(pool, protoargs.generateParser, tasks)]))
+        finally:
+            pool.close()
+            pool.join()
+
+        files = sorted(os.listdir(serial))
+        self.assertEqual(len(files), 3 * 6) # c++ parser has header
+        self.assertEqual(filecmp.cmpfiles(serial, parallel, files, shallow=False)[0], files)
+
+    def test_unchanged_not_written(self):
+        path = os.path.join(SCHEMA_DIR, "schema.proto")
+        schema = paSchema.Schema(path).analyse()
+        tasks = [(language, path, self.dst, schema) for language in paApi.languages]
+
+        first = protoargs.runTasks(None, protoargs.generateParser, tasks)
+        files = sum([written for result, written, skipped, timings in first], [])
+        self.assertEqual(sum([skipped for result, written, skipped, timings in first], []), [])
+        self.assertEqual(len(files), 6)
+
+        # pretend files are old, to see if they are touched
+        for name in files:
+            os.utime(name, (1, 1))
+        with open(files[0], "a") as index:
+            index.write("\n") # the only changed file
+
+        second = protoargs.runTasks(None, protoargs.generateParser, tasks)
+        self.assertEqual(sum([written for result, written, skipped, timings in second], []), files[:1])
+        self.assertEqual(sum([skipped for result, written, skipped, timings in second], []), files[1:])
+        self.assertEqual([os.path.getmtime(name) for name in files[1:]], [1] * 5)
+
+    def test_unwritable_output(self):
+        jobs = [(os.path.join(SCHEMA_DIR, "simple.proto"), os.path.join(self.dst, "missing"))]
+        schemas, results, failed = protoargs.generateParsers(None, jobs, ["cpp", "py"], None)
+        self.assertEqual([result[0] for result in results], [False, False])
+        self.assertEqual(failed, 1) # failed proto files are counted, not parsers
+
+    def test_timings(self):
+        jobs = [(os.path.join(SCHEMA_DIR, name), self.dst) for name in ["simple.proto", "missing.proto"]]
+        timings = paTimings.Report()
+        schemas, results, failed = protoargs.generateParsers(None, jobs, ["cpp", "py"], None, timings)
+        self.assertEqual(failed, 1)
+
+        report = json.loads(timings.toJson())
+        self.assertEqual([entry["path"] for entry in report["files"]], [path for path, dst in jobs])
+        simple, missing = report["files"]
+        self.assertEqual(sorted(simple["phases"]), sorted(paTimings.schemaPhases))
+        self.assertEqual([parser["language"] for parser in simple["parsers"]], ["cpp", "py"])
+        self.assertEqual(sorted(simple["parsers"][0]["phases"]), sorted(paTimings.parserPhases))
+        self.assertEqual(missing["parsers"], []) # proto file could not be read
+        self.assertEqual(sorted(report["phases"]), sorted(paTimings.phases))
+        self.assertAlmostEqual(report["total"], sum(report["phases"].values()))
+
+        lines = timings.format().splitlines()
+        self.assertEqual(lines[0].split()[2:], paTimings.phases + ["total"])
+        self.assertEqual([line.split()[0] for line in lines[1:]], [jobs[0][0], "cpp", "py", jobs[1][0], "total"])
+
+    def test_main(self):
+        simple = os.path.join(SCHEMA_DIR, "simple.proto")
+        self.assertEqual(protoargs.main(["-q", "-i", simple, "-o", self.dst]), 1) # no language
+        self.assertEqual(protoargs.main(["--unknown"]), 2)
+        self.assertEqual(protoargs.main(["-q", "-i", simple, "-o", os.path.join(self.dst, "missing"), "--py"]), 1)
+
+        # batch of proto files profiled in one run, summary goes to stderr
+        manifest = self.manifest(simple + "\n" + os.path.join(SCHEMA_DIR, "schema.proto") + "\n")
+        stats = os.path.join(self.dst, "protoargs.prof")
+        stderr, sys.stderr = sys.stderr, open(os.devnull, "w")
+        try:
+            code = protoargs.main(["--quiet", "--manifest", manifest, "-o", self.dst, "--py", "--profile", stats, "--loglevel", "ERROR"])
+        finally:
+            sys.stderr.close()
+            sys.stderr = stderr
+        self.assertEqual(code, 0)
+        self.assertTrue(os.path.exists(os.path.join(self.dst, "simple_pa.py")))
+        self.assertTrue(os.path.exists(os.path.join(self.dst, "schema_pa.py")))
+        functions = [function for filename, line, function in pstats.Stats(stats).stats]
+        self.assertTrue("generateParsers" in functions)
+
+    def test_watch(self):
+        path = os.path.join(self.dst, "schema.proto")
+        shutil.copy(os.path.join(SCHEMA_DIR, "schema.proto"), path)
+        output = os.path.join(self.dst, "schema_pa.py")
+        jobs = [(path, self.dst)]
+        schemas, results, failed = protoargs.generateParsers(None, jobs, ["py"], None)
+
+        # every poll edits proto file, stops watching after the last edit
+        mtimes = []
+        edits = [
+                lambda data: data + "\n// comment outside of protoargs messages\n",
+                lambda data: data.replace("paramA", "paramZ"),
+                ]
+        def sleep(interval):
+            mtimes.append(os.path.getmtime(output))
+            if not edits:
+                raise KeyboardInterrupt()
+            with open(path, "r") as index:
+                data = edits.pop(0)(index.read())
+            with open(path, "w") as index:
+                index.write(data)
+            os.utime(path, (1, len(edits) + 1)) # mtime changes with each edit
+            os.utime(output, (1, 1))
+
+        sleep, protoargs.time.sleep = protoargs.time.sleep, sleep
+        try:
+            protoargs.watchParsers(jobs, ["py"], None, 0, schemas)
+        finally:
+            protoargs.time.sleep = sleep
+
+        # comment does not regenerate parser, renamed field does
+        self.assertEqual(mtimes[1], 1)
+        self.assertNotEqual(mtimes[2], 1)
+        with open(output, "r") as index:
+            self.assertTrue("paramZ" in index.read())
+        self.assertTrue("paramZ" in str(schemas[path].getTokens()))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import os
+import time
+import shutil
+import logging
+import tempfile
+import unittest
+
+import paSchema
+import paCppGenerator
+import paPyGenerator
+import paRustGenerator
+import paGoGenerator
+import paBashGenerator
+
+generators = [paCppGenerator, paPyGenerator, paRustGenerator, paGoGenerator, paBashGenerator]
+
+class TestScaling(unittest.TestCase):
+
+    def setUp(self):
+        self.dst = tempfile.mkdtemp()
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+        shutil.rmtree(self.dst)
+
+    def schema(self, fields):
+        path = os.path.join(self.dst, "scaling%d.proto" % fields)
+        with open(path, "w") as index:
+            index.write("package scaling;\nmessage protoargs\n{\n")
+            for f in range(fields):
+                index.write("    optional string param_%d = %d; // Param %d\n" % (f, f + 1, f))
+            index.write("}//protoargs\nmessage protoargs_links\n{\n")
+            for f in range(fields):
+                index.write("    optional string p%d = %d [default = \"param_%d\"];\n" % (f, f + 1, f))
+            index.write("}//protoargs_links\n")
+        return path, paSchema.Schema(path).analyse()
+
+    # best generation time per field
+    def timePerField(self, module, fields):
+        path, schema = self.schema(fields)
+        best = None
+        for run in range(2):
+            start = time.time()
+            self.assertTrue(module.Generator(path, self.dst, schema).generate())
+            elapsed = time.time() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best / fields
+
+    # generation time per field does not grow with number of fields,
+    # quadratic output building would make it 8 times larger
+    def test_linear(self):
+        for module in generators:
+            small = self.timePerField(module, 1000)
+            large = self.timePerField(module, 8000)
+            self.assertLess(large, small * 3, module.__name__)
@@ -0,0 +1,138 @@
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+import unittest
+
+import paSchema
+import paCache
+import paTokenizer
+import paCppGenerator
+import paPyGenerator
+import paRustGenerator
+import paGoGenerator
+import paBashGenerator
+
+SCHEMA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Schema", "src")
+
+class TestSchema(unittest.TestCase):
+
+    def setUp(self):
+        self.dst = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dst)
+
+    def test_analyse(self):
+        schema = paSchema.Schema(os.path.join(SCHEMA_DIR, "schema.proto")).analyse()
+        self.assertTrue(schema.valid())
+        self.assertNotEqual(len(schema.getTokens()), 0)
+
+        names = [token.name for token in schema.getTokens() if token.directive == paTokenizer.pd_message]
+        self.assertEqual(names, [paTokenizer.pa_main, paTokenizer.pa_links]) # 'dummy' is excluded
+
+    def test_symbols(self):
+        schema = paSchema.Schema(os.path.join(SCHEMA_DIR, "schema.proto")).analyse()
+        symbols = schema.getSymbols()
+
+        self.assertTrue(symbols.getToken(paTokenizer.pd_message, paTokenizer.pa_links).valid())
+        self.assertFalse(symbols.getToken(paTokenizer.pd_message, "dummy").valid())
+        self.assertEqual(symbols.getToken(paTokenizer.pd_package, "bsw.protoargs.schema").name, "bsw.protoargs.schema")
+
+        fields = [token.name for token in symbols.getMessage(paTokenizer.pa_main)]
+        self.assertEqual(len(fields), 16)
+        self.assertEqual(fields[0], "paramA")
+        self.assertEqual(fields[-1], "paramDouble")
+        self.assertEqual(symbols.getMessage("missing"), [])
+
+        self.assertEqual([token.name for token in symbols.getLinks("paramC")], ["c", "c_long_param"])
+        self.assertEqual([token.name for token in symbols.getLinks("printHelp")], ["h", "help"])
+        self.assertEqual(symbols.getLinks("PARAMG"), []) # positional
+
+    def test_fields(self):
+        schema = paSchema.Schema(os.path.join(SCHEMA_DIR, "schema.proto")).analyse()
+        fields = dict((field.token.name, field) for field in schema.getSymbols().getFields())
+
+        self.assertEqual(len(fields), 16)
+        self.assertTrue(all(field.linked for field in fields.values()))
+        self.assertTrue(fields["PARAMG"].positional)
+        self.assertFalse(fields["paramC"].positional)
+        self.assertEqual([link.name for link in fields["paramC"].sortedLinks], ["c", "c_long_param"])
+
+        # links message is optional, fields are options named by themselves then
+        schema = paSchema.Schema("inline").analyse(["message protoargs\n", "{\n",
+            "    optional string name = 1; // Name\n", "}\n"])
+        field = schema.getSymbols().getFields()[0]
+        self.assertEqual((field.linked, field.positional, field.links), (False, False, []))
+
+    def test_stream(self):
+        path = os.path.join(SCHEMA_DIR, "schema.proto")
+        expected = str(paSchema.Schema(path).analyse().getTokens())
+
+        # any line iterator is consumed without materialising it
+        with open(path, "r") as index:
+            lines = (line for line in index)
+            self.assertEqual(str(paSchema.Schema(path).analyse(lines).getTokens()), expected)
+
+        with open(path, "rb") as index:
+            self.assertEqual(str(paTokenizer.Tokenizer().tokenize(paSchema.mapLines(index)).excludeUnused().getTokens()), expected)
+
+    @unittest.skipUnless(hasattr(os, "mkfifo"), "fifo is not supported")
+    def test_fifo(self):
+        source = os.path.join(SCHEMA_DIR, "schema.proto")
+        expected = str(paSchema.Schema(source).analyse().getTokens())
+
+        # fifo can not be mapped, it is read as stream, with cache too
+        path = os.path.join(self.dst, "schema.proto")
+        os.mkfifo(path)
+        def write():
+            with open(source, "rb") as data:
+                with open(path, "wb") as index:
+                    index.write(data.read())
+        for cache in [None, paCache.Cache(self.dst)]:
+            writer = threading.Thread(target=write)
+            writer.start()
+            try:
+                schema = paSchema.Schema(path, cache).analyse()
+            finally:
+                writer.join()
+            self.assertTrue(schema.valid())
+            self.assertEqual(str(schema.getTokens()), expected)
+
+    def test_pickle(self):
+        schema = paSchema.Schema(os.path.join(SCHEMA_DIR, "schema.proto")).analyse()
+        copy = pickle.loads(pickle.dumps(schema, pickle.HIGHEST_PROTOCOL))
+        self.assertTrue(copy.valid())
+        self.assertEqual(str(copy.getTokens()), str(schema.getTokens()))
+        self.assertEqual([token.name for token in copy.getSymbols().getLinks("paramC")], ["c", "c_long_param"])
+        self.assertEqual(copy.getTimings(), schema.getTimings())
+
+    def test_empty_file(self):
+        path = os.path.join(self.dst, "empty.proto")
+        open(path, "w").close()
+        schema = paSchema.Schema(path).analyse()
+        self.assertFalse(schema.valid())
+        self.assertEqual(len(schema.getTokens()), 0)
+
+    def test_missing_file(self):
+        schema = paSchema.Schema(os.path.join(self.dst, "missing.proto")).analyse()
+        self.assertFalse(schema.valid())
+        self.assertEqual(len(schema.getTokens()), 0)
+
+    def test_shared_between_generators(self):
+        path = os.path.join(self.dst, "shared.proto")
+        shutil.copy(os.path.join(SCHEMA_DIR, "schema.proto"), path)
+        schema = paSchema.Schema(path).analyse()
+
+        # generators should not need the proto file anymore
+        os.remove(path)
+
+        for module in [paCppGenerator, paPyGenerator, paRustGenerator, paGoGenerator, paBashGenerator]:
+            generator = module.Generator(path, self.dst, schema)
+            self.assertTrue(generator.generate())
+            self.assertTrue(generator.getSourceFileData())
+            self.assertTrue(os.path.exists(generator.getSourceFilePath()))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,20 @@
+import unittest
+
+import paTemplate
+
+class TestTemplate(unittest.TestCase):
+
+    def test_render(self):
+        template = paTemplate.Template("%NAME%: %TYPE% %NAME%")
+        self.assertEqual(template.render(NAME="count", TYPE="int"), "count: int count")
+
+    def test_value_not_substituted(self):
+        template = paTemplate.Template("%NAME% %TYPE%")
+        self.assertEqual(template.render(NAME="%TYPE%", TYPE="int"), "%TYPE% int")
+
+    def test_unknown_slot(self):
+        template = paTemplate.Template("100% %NAME% %OTHER%")
+        self.assertEqual(template.render(NAME="count"), "100% count %OTHER%")
+
+    def test_get(self):
+        self.assertIs(paTemplate.get("%NAME%"), paTemplate.get("%NAME%"))
@@ -0,0 +1,128 @@
+import gc
+import os
+import time
+import logging
+import unittest
+
+import paTokenizer
+
+SCHEMA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Schema", "src")
+
+def loadSchema(name):
+    with open(os.path.join(SCHEMA_DIR, name), "r") as index:
+        return index.readlines()
+
+class TestTokenizer(unittest.TestCase):
+
+    data = loadSchema("schema.proto")
+
+    def setUp(self):
+        logging.disable(logging.WARNING) # excluded messages are reported on every run
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def tokenize(self, tokenizer):
+        return tokenizer.tokenize(self.data).excludeUnused().getTokens()
+
+    def test_instances_do_not_share_tokens(self):
+        first = self.tokenize(paTokenizer.Tokenizer())
+        second = self.tokenize(paTokenizer.Tokenizer())
+        self.assertNotEqual(len(first), 0)
+        self.assertEqual(len(first), len(second))
+
+    def test_reset(self):
+        tokenizer = paTokenizer.Tokenizer()
+        expected = len(self.tokenize(tokenizer))
+        self.assertEqual(len(tokenizer.reset().getTokens()), 0)
+        self.assertEqual(len(self.tokenize(tokenizer)), expected)
+
+    def test_compact_tokens(self):
+        tokens = self.tokenize(paTokenizer.Tokenizer())
+        self.assertFalse(hasattr(tokens[0], "__dict__"))
+
+        fields = [token for token in tokens if token.directive == paTokenizer.pd_field]
+        self.assertTrue(fields[0].field is fields[1].field) # interned "optional"
+        self.assertTrue(fields[0].type is fields[-1].type) # interned "string"
+
+    def test_exclude_unused(self):
+        data = []
+        for m in range(1000):
+            data += ["message unrelated_%d\n" % m, "{\n", "    optional string field = 1; // Field\n", "}\n"]
+            if m == 500:
+                data += self.data
+        tokens = self.tokenize(paTokenizer.Tokenizer())
+        filtered = paTokenizer.Tokenizer().tokenize(data, skipUnused=False).excludeUnused().getTokens()
+        self.assertEqual(str(filtered), str(tokens))
+
+        # the same without tokenizing not needed messages at all
+        skipped = paTokenizer.Tokenizer().tokenize(data).getTokens()
+        self.assertEqual(str(skipped), str(tokens))
+
+    def test_lexer(self):
+        tokenizer = paTokenizer.Tokenizer()
+
+        token = tokenizer.createFieldToken('\toptional string p_a = 3 [ default = "a, b" ]; //\tParam\tA\n')
+        self.assertEqual([token.field, token.type, token.name, token.position], ["optional", "string", "p_a", "3"])
+        self.assertEqual(token.value, "a, b")
+        self.assertEqual(token.description, "Param A")
+
+        token = tokenizer.createFieldToken("required bsw.Type x=1[deprecated=true,default=-0.5];")
+        self.assertEqual([token.type, token.value, token.description], ["bsw.Type", "-0.5", ""])
+        self.assertFalse(tokenizer.createFieldToken("// optional string commented = 1;").valid())
+        self.assertEqual(tokenizer.createPackageToken("package a.b.c; // comment").name, "a.b.c")
+
+        # keywords inside of comments do not change line meaning
+        tokens = tokenizer.tokenize([
+            "message protoargs // optional arguments\n",
+            "{\n",
+            "    // required string commented = 1;\n",
+            "    optional bool flag = 1; // message inside } of description\n",
+            "}\n",
+            "message unrelated { }\n",
+            "message protoargs_links {}\n",
+            ], skipUnused=True).getTokens()
+        self.assertEqual([token.directive for token in tokens], [paTokenizer.pd_message,
+                paTokenizer.pd_field, paTokenizer.pd_end, paTokenizer.pd_message, paTokenizer.pd_end])
+        self.assertEqual(tokens[1].description, "message inside } of description")
+
+        # message with body on one line does not hide the next message
+        for skipUnused in [True, False]:
+            tokens = paTokenizer.Tokenizer().tokenize([
+                "message Ping { optional int32 id = 1; message Nested { } } // ping {\n",
+                "message protoargs {\n",
+                "    optional bool flag = 1;\n",
+                "}\n",
+                "message protoargs_links { optional string f = 1 [default = \"flag}\"]; optional string g = 2 [default = \"flag\"]; }\n",
+                ], skipUnused=skipUnused).excludeUnused().getTokens()
+            self.assertEqual([(token.directive, token.name) for token in tokens], [
+                (paTokenizer.pd_message, "protoargs"), (paTokenizer.pd_field, "flag"), (paTokenizer.pd_end, ""),
+                (paTokenizer.pd_message, "protoargs_links"), (paTokenizer.pd_field, "f"), (paTokenizer.pd_field, "g"),
+                (paTokenizer.pd_end, "")])
+            self.assertEqual([token.value for token in tokens[4:6]], ["flag}", "flag"])
+
+    # regression benchmark, successive schemas should not make tokenizer slower or bigger
+    def test_successive_schemas_stay_flat(self):
+        runs = 10000
+        chunk = 1000
+        expected = len(self.tokenize(paTokenizer.Tokenizer()))
+        reused = paTokenizer.Tokenizer()
+
+        timings = []
+        memory = []
+        for chunkIndex in range(runs // chunk):
+            start = time.time()
+            for i in range(chunk // 2):
+                self.assertEqual(len(self.tokenize(paTokenizer.Tokenizer())), expected)
+                self.assertEqual(len(self.tokenize(reused.reset())), expected)
+            timings.append(time.time() - start)
+            gc.collect()
+            memory.append(len(gc.get_objects()))
+
+        self.assertLess(memory[-1] - memory[0], 100) # no tokens are kept between runs
+
+        best = min(timings)
+        self.assertLess(timings[-1], best * 3) # generous limit, growth used to be linear
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,14 @@
+#!/bin/bash
+
+# find python binary
+python=$(which python)
+if [ -z "$python" ]; then
+    python=$(which python3)
+fi
+if [ -z "$python" ]; then
+    python=$(which python2)
+fi
+
+# testing protoargs generator itself
+SCRIPTPATH="$( cd -- "$(dirname "$0")" >/dev/null 2>&1 ; pwd -P )"
+PYTHONPATH="$SCRIPTPATH/../Protoargs/bin" $python -m unittest discover $SCRIPTPATH/src